@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import run
+
+
+CALLS = 100000
+
+PROGRAM = """
+FUNCAO f({params})
+  DECLARAR r = 0
+  RETORNAR r
+FIMFUNCAO
+DECLARAR i = 0
+ENQUANTO i < {calls}
+  f({args})
+  i++
+FIMENQUANTO
+"""
+
+LOOP_ONLY = """
+DECLARAR i = 0
+ENQUANTO i < {calls}
+  i++
+FIMENQUANTO
+"""
+
+
+def measure(text):
+    start = time.perf_counter()
+    result, error = run("<bench>", text)
+    if error:
+        raise RuntimeError(error.as_string())
+    return time.perf_counter() - start
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else CALLS
+    loop_time = measure(LOOP_ONLY.format(calls=calls))
+
+    for arity in (0, 1, 3):
+        params = ", ".join(f"p{i}" for i in range(arity))
+        args = ", ".join(str(i) for i in range(arity))
+        elapsed = measure(PROGRAM.format(params=params, args=args, calls=calls))
+        per_second = calls / max(elapsed - loop_time, 1e-9)
+        print(f"{arity} args: {per_second:12,.0f} chamadas/s ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope
+from nexus.runtime import Context
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.interpreter import Interpreter
+from nexus.direct import DirectInterpreter
+from nexus.optimizer import Optimizer
+from nexus.nodes import CountedLoopNode
+
+
+SIZE = 200000
+
+PROGRAM = """
+DECLARAR total = 0
+DECLARAR i = 0
+ENQUANTO i < limite
+  total += i % 7
+  i++
+FIMENQUANTO
+"""
+
+
+def parse(text, optimizer):
+    tokens, error = Lexer("<bench>", text).make_tokens()
+    if error:
+        raise RuntimeError(error.as_string())
+
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    return optimizer.optimize(ast.node)
+
+
+def measure(interpreter, node, context):
+    start = time.perf_counter()
+    res = interpreter.visit(node, context)
+    if res.error:
+        raise RuntimeError(res.error.as_string())
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+
+    context = Context("<bench>")
+    context.symbol_table = get_fresh_global_scope()
+    optimizer = Optimizer(context.symbol_table)
+
+    Interpreter().visit(parse(f"DECLARAR limite = {size}", optimizer), context)
+    node = parse(PROGRAM, optimizer)
+    statements = node.statement_nodes
+    index = next(
+        i for i, statement in enumerate(statements)
+        if isinstance(statement, CountedLoopNode)
+    )
+    counted = statements[index]
+
+    for label, interpreter in (
+        ("tabela", Interpreter()),
+        ("direto", DirectInterpreter()),
+    ):
+        fast = measure(interpreter, node, context)
+
+        statements[index] = counted.loop
+        slow = measure(interpreter, node, context)
+        statements[index] = counted
+
+        print(
+            f"{label:>8}: {size / slow:12,.0f} it/s generico, "
+            f"{size / fast:12,.0f} it/s contado ({slow / fast:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
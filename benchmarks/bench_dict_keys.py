@@ -0,0 +1,96 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope
+from nexus.runtime import Context
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.interpreter import Interpreter
+from nexus.optimizer import Optimizer
+
+
+SIZE = 3000
+
+PARALLEL_LISTS = """
+DECLARAR chaves_a = []
+DECLARAR chaves_b = []
+DECLARAR totais = []
+PARA n EM INTERVALO(limite)
+  DECLARAR a = n % 37
+  DECLARAR b = n % 11
+  DECLARAR achou = -1
+  DECLARAR j = 0
+  PARA ca EM chaves_a
+    SE ca == a E chaves_b[j] == b ENTAO
+      achou = j
+    FIMSE
+    j++
+  FIMPARA
+  SE achou == -1 ENTAO
+    chaves_a = chaves_a + [a]
+    chaves_b = chaves_b + [b]
+    totais = totais + [n]
+  SENAO
+    totais[achou] = totais[achou] + n
+  FIMSE
+FIMPARA
+"""
+
+TUPLE_KEYS = """
+DECLARAR grupos = {}
+PARA n EM INTERVALO(limite)
+  DECLARAR chave = (n % 37, n % 11)
+  TENTE
+    grupos[chave] = grupos[chave] + n
+  CAPTURAR erro
+    grupos[chave] = n
+  FIMTENTE
+FIMPARA
+DECLARAR soma = 0
+PARA total EM VALORES(grupos)
+  soma = soma + total
+FIMPARA
+"""
+
+
+def parse(text, optimizer):
+    tokens, error = Lexer("<bench>", text).make_tokens()
+    if error:
+        raise RuntimeError(error.as_string())
+
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    return optimizer.optimize(ast.node)
+
+
+def measure(interpreter, node, context):
+    start = time.perf_counter()
+    res = interpreter.visit(node, context)
+    if res.error:
+        raise RuntimeError(res.error.as_string())
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+
+    context = Context("<bench>")
+    context.symbol_table = get_fresh_global_scope()
+    optimizer = Optimizer(context.symbol_table)
+    interpreter = Interpreter()
+    interpreter.visit(parse(f"DECLARAR limite = {size}", optimizer), context)
+
+    slow = measure(interpreter, parse(PARALLEL_LISTS, optimizer), context)
+    fast = measure(interpreter, parse(TUPLE_KEYS, optimizer), context)
+    print(
+        f"{size / slow:12,.0f} el/s listas paralelas, "
+        f"{size / fast:12,.0f} el/s chaves em tupla ({slow / fast:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope
+from nexus.runtime import Context
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.interpreter import Interpreter
+from nexus.direct import DirectInterpreter
+from nexus.optimizer import Optimizer
+from nexus.analysis import walk
+from nexus.nodes import WhileNode, ForNode, CountedLoopNode
+from nexus.jit import HOT_LOOP
+
+
+SIZE = 100000
+
+PROGRAMS = {
+    "ENQUANTO": """
+DECLARAR total = 0
+DECLARAR n = 0
+ENQUANTO n < limite
+  SE n % 3 == 0 ENTAO
+    total = total + n / 2
+  SENAO
+    total = total - 1
+  FIMSE
+  n = n + 1
+FIMENQUANTO
+""",
+    "PARA": """
+DECLARAR soma = 0
+PARA x EM INTERVALO(limite)
+  soma = soma + (x * x) % 11
+FIMPARA
+""",
+}
+
+
+def parse(text, optimizer):
+    tokens, error = Lexer("<bench>", text).make_tokens()
+    if error:
+        raise RuntimeError(error.as_string())
+
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    return optimizer.optimize(ast.node)
+
+
+def measure(interpreter, node, context):
+    start = time.perf_counter()
+    res = interpreter.visit(node, context)
+    if res.error:
+        raise RuntimeError(res.error.as_string())
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+
+    context = Context("<bench>")
+    context.symbol_table = get_fresh_global_scope()
+    optimizer = Optimizer(context.symbol_table)
+    Interpreter().visit(parse(f"DECLARAR limite = {size}", optimizer), context)
+
+    for name, program in PROGRAMS.items():
+        for label, interpreter in (
+            ("tabela", Interpreter()),
+            ("direto", DirectInterpreter()),
+        ):
+            fast = measure(interpreter, parse(program, optimizer), context)
+
+            node = parse(program, optimizer)
+            for current in walk(node):
+                if isinstance(current, (WhileNode, ForNode, CountedLoopNode)):
+                    current.back_edges = HOT_LOOP
+            slow = measure(interpreter, node, context)
+
+            print(
+                f"{name:>8} {label:>6}: {size / slow:12,.0f} it/s generico, "
+                f"{size / fast:12,.0f} it/s compilado ({slow / fast:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
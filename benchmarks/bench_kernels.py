@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope
+from nexus.runtime import Context
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.interpreter import Interpreter
+from nexus.optimizer import Optimizer
+from nexus.analysis import walk
+from nexus.nodes import ListCompNode
+from nexus import kernels
+
+
+SIZE = 100000
+
+EXPRESSIONS = (
+    "n ^ 2",
+    "(n * fator + 1) % 7",
+    "n / 2 - fator",
+)
+
+
+def parse(text, optimizer):
+    tokens, error = Lexer("<bench>", text).make_tokens()
+    if error:
+        raise RuntimeError(error.as_string())
+
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    return optimizer.optimize(ast.node)
+
+
+def measure(interpreter, node, context):
+    start = time.perf_counter()
+    res = interpreter.visit(node, context)
+    if res.error:
+        raise RuntimeError(res.error.as_string())
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+
+    context = Context("<bench>")
+    context.symbol_table = get_fresh_global_scope()
+    optimizer = Optimizer(context.symbol_table)
+    interpreter = Interpreter()
+
+    setup = (
+        "DECLARAR fator = 3\n"
+        f"DECLARAR numeros = [n * 1.5 PARA n EM INTERVALO({size})]"
+    )
+    interpreter.visit(parse(setup, optimizer), context)
+
+    print(f"numpy: {'sim' if kernels.numpy is not None else 'nao'}")
+    for expression in EXPRESSIONS:
+        node = parse(f"[{expression} PARA n EM numeros]", optimizer)
+        comp = next(n for n in walk(node) if isinstance(n, ListCompNode))
+
+        fast = measure(interpreter, node, context)
+
+        kernel = comp.kernel
+        comp.kernel = None
+        slow = measure(interpreter, node, context)
+        comp.kernel = kernel
+
+        print(
+            f"{expression:>22}: {size / slow:12,.0f} el/s generico, "
+            f"{size / fast:12,.0f} el/s kernel ({slow / fast:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope
+from nexus.runtime import Context
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.interpreter import Interpreter
+from nexus.direct import DirectInterpreter
+from nexus.optimizer import Optimizer
+from nexus.pgo import Profile, RecordingInterpreter, source_hash
+
+
+SIZE = 50000
+
+PROGRAM = """
+DECLARAR total = 0
+PARA i EM INTERVALO(limite)
+  total = total + (i * 2 + 1) % 7 - (i - 3) * 2
+FIMPARA
+"""
+
+
+def parse(text, context):
+    tokens, error = Lexer("<bench>", text).make_tokens()
+    if error:
+        raise RuntimeError(error.as_string())
+
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    return Optimizer(context.symbol_table).optimize(ast.node)
+
+
+def fresh_context(size):
+    context = Context("<bench>")
+    context.symbol_table = get_fresh_global_scope()
+    Interpreter().visit(parse(f"DECLARAR limite = {size}", context), context)
+    return context
+
+
+def measure(interpreter, profile, size):
+    context = fresh_context(size)
+    node = parse(PROGRAM, context)
+    if profile is not None:
+        profile.apply(node, interpreter)
+
+    start = time.perf_counter()
+    res = interpreter.visit(node, context)
+    if res.error:
+        raise RuntimeError(res.error.as_string())
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+
+    profile = Profile(source_hash(PROGRAM))
+    recorded = measure(RecordingInterpreter(profile), None, size)
+    profile.summarize(parse(PROGRAM, fresh_context(size)))
+    print(f"gravacao: {size / recorded:12,.0f} it/s")
+
+    for label, interpreter_type in (
+        ("tabela", Interpreter),
+        ("direto", DirectInterpreter),
+    ):
+        cold = measure(interpreter_type(), None, size)
+        warm = measure(interpreter_type(), profile, size)
+        print(
+            f"{label:>8}: {size / cold:12,.0f} it/s sem perfil, "
+            f"{size / warm:12,.0f} it/s com perfil ({cold / warm:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope
+from nexus.runtime import Context
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.interpreter import Interpreter
+from nexus.optimizer import Optimizer
+
+
+N = 22
+
+PROGRAM = """
+FUNCAO fib(n)
+  SE n < 2 ENTAO
+    RETORNAR n
+  FIMSE
+  RETORNAR fib(n - 1) + fib(n - 2)
+FIMFUNCAO
+"""
+
+
+def parse(text, optimizer):
+    tokens, error = Lexer("<bench>", text).make_tokens()
+    if error:
+        raise RuntimeError(error.as_string())
+
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    return optimizer.optimize(ast.node)
+
+
+def measure(interpreter, node, context):
+    start = time.perf_counter()
+    res = interpreter.visit(node, context)
+    if res.error:
+        raise RuntimeError(res.error.as_string())
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+
+    context = Context("<bench>")
+    context.symbol_table = get_fresh_global_scope()
+    optimizer = Optimizer(context.symbol_table)
+    interpreter = Interpreter()
+
+    interpreter.visit(parse(PROGRAM, optimizer), context)
+    node = parse(f"fib({n})", optimizer)
+    fib = context.symbol_table.get("fib")
+
+    fast = measure(interpreter, node, context)
+
+    specialized = fib.specialized
+    fib.specialized = None
+    slow = measure(interpreter, node, context)
+    fib.specialized = specialized
+
+    print(
+        f"fib({n}): {slow:.3f}s generico, "
+        f"{fast:.3f}s especializado ({slow / fast:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope
+from nexus.runtime import Context
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.interpreter import Interpreter
+from nexus.direct import DirectInterpreter
+from nexus.analysis import walk
+
+
+ROUNDS = 20000
+
+EXPRESSION = "(a + 1) * (b - 2) + (a * b) - (a + b + 3) * 2"
+
+
+class NameDispatchInterpreter(Interpreter):
+    def visit(self, node, context):
+        method = getattr(self, f"visit_{type(node).__name__}", self.no_visit_method)
+        return method(node, context)
+
+
+def parse(text):
+    tokens, error = Lexer("<bench>", text).make_tokens()
+    if error:
+        raise RuntimeError(error.as_string())
+
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    return ast.node
+
+
+def measure(interpreter, node, context, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        interpreter.visit(node, context)
+    return time.perf_counter() - start
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else ROUNDS
+
+    context = Context("<bench>")
+    context.symbol_table = get_fresh_global_scope()
+
+    for name, value in (("a", "3"), ("b", "4")):
+        Interpreter().visit(parse(f"DECLARAR {name} = {value}"), context)
+
+    node = parse(EXPRESSION)
+    visits = sum(1 for _ in walk(node)) * rounds
+
+    for label, interpreter in (
+        ("getattr", NameDispatchInterpreter()),
+        ("tabela", Interpreter()),
+        ("direto", DirectInterpreter()),
+    ):
+        elapsed = measure(interpreter, node, context, rounds)
+        print(f"{label:>8}: {visits / elapsed:12,.0f} visitas/s")
+
+
+if __name__ == "__main__":
+    main()
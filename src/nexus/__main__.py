@@ -1,5 +1,4 @@
 import sys
-import re
 import io
 
 if hasattr(sys, "set_int_max_str_digits"):
@@ -9,10 +8,16 @@ if hasattr(sys, "setrecursionlimit"):
     sys.setrecursionlimit(2000)
 
 from .runtime import SymbolTable, Context
-from .values import Number, BuiltInFunction, List
+from .values import Number, BuiltInFunction
 from .lexer import Lexer
 from .parser import Parser
 from .interpreter import Interpreter
+from .direct import DirectInterpreter
+from .optimizer import Optimizer
+from .pgo import Profile, RecordingInterpreter, PROFILE_SUFFIX, source_hash
+from .parallel import parse_parallel
+from . import jit
+from .repl import BlockTracker, ReplSession
 
 
 def get_fresh_global_scope():
@@ -27,92 +32,71 @@ def get_fresh_global_scope():
     scope.set("INT", BuiltInFunction("INT"))
     scope.set("FLUTUANTE", BuiltInFunction("FLUTUANTE"))
     scope.set("BOOL", BuiltInFunction("BOOL"))
+    scope.set("INTERVALO", BuiltInFunction("INTERVALO"))
+    scope.set("MAPA", BuiltInFunction("MAPA"))
+    scope.set("FILTRO", BuiltInFunction("FILTRO"))
+    scope.set("REDUZIR", BuiltInFunction("REDUZIR"))
+    scope.set("PEGAR", BuiltInFunction("PEGAR"))
+    scope.set("TUPLA", BuiltInFunction("TUPLA"))
+    scope.set("CHAVES", BuiltInFunction("CHAVES"))
+    scope.set("VALORES", BuiltInFunction("VALORES"))
+    scope.set("ITENS", BuiltInFunction("ITENS"))
     scope.set("IMPRIMIR", BuiltInFunction("IMPRIMIR"))
 
     return scope
 
 
-def run(fn, text, context=None):
-    lexer = Lexer(fn, text)
-    tokens, error = lexer.make_tokens()
-    if error:
-        return None, error
-
-    parser = Parser(tokens)
-    ast = parser.parse()
-    if ast.error:
-        return None, ast.error
-
-    interpreter = Interpreter()
+def run(
+    fn, text, context=None, strict=False, parallel=False, direct=False, pgo=None
+):
+    program = None
+    if parallel:
+        program = parse_parallel(fn, text, lazy_bodies=not strict)
+
+    if program is None:
+        lexer = Lexer(fn, text)
+        tokens, error = lexer.make_tokens()
+        if error:
+            return None, error
+
+        parser = Parser(tokens, lazy_bodies=not strict)
+        ast = parser.parse()
+        if ast.error:
+            return None, ast.error
+        program = ast.node
+
+    profile = None
+    if pgo == "record":
+        profile = Profile(source_hash(text))
+        interpreter = RecordingInterpreter(profile)
+    else:
+        interpreter = DirectInterpreter() if direct else Interpreter()
 
     if context is None:
         context = Context("<program>")
         context.symbol_table = get_fresh_global_scope()
 
-    result = interpreter.visit(ast.node, context)
-
-    if result.should_return:
-        return result.return_value, result.error
-
-    return result.value, result.error
-
-
-def is_complete(text):
-    text = re.sub(r"#.*", "", text)
-
-    temp_text = re.sub(r'""".*?"""', "", text, flags=re.DOTALL)
-    if temp_text.count('"""') % 2 != 0:
-        return False
-
-    temp_text = re.sub(r"`[^`]*`", "", temp_text, flags=re.DOTALL)
-    if temp_text.count("`") % 2 != 0:
-        return False
-
-    temp_text = re.sub(r'"[^"\\]*(\\.[^"\\]*)*"', "", temp_text)
-    if temp_text.count('"') % 2 != 0:
-        return False
-
-    if temp_text.count("(") != temp_text.count(")"):
-        return False
-    if temp_text.count("[") != temp_text.count("]"):
-        return False
-    if temp_text.count("{") != temp_text.count("}"):
-        return False
+    node = Optimizer(context.symbol_table).optimize(program)
 
-    depth = 0
-    bracket_level = 0
-
-    pattern = r"(\[|\]|\b(FUNCAO|CLASSE|SE|SENAO\s+SE|SENAO|ENQUANTO|PARA|TENTE|ESCOLHA|FIMFUNCAO|FIMCLASSE|FIMSE|FIMENQUANTO|PARA|FIMTENTE|FIMESCOLHA)\b)"
-
-    tokens = re.finditer(pattern, temp_text)
-
-    start_keys = {"FUNCAO", "CLASSE", "SE", "ENQUANTO", "PARA", "TENTE", "ESCOLHA"}
-    end_keys = {
-        "FIMFUNCAO",
-        "FIMCLASSE",
-        "FIMSE",
-        "FIMENQUANTO",
-        "FOR",
-        "FIMTENTE",
-        "FIMESCOLHA",
-    }
+    if pgo == "use":
+        profile = Profile.load(fn + PROFILE_SUFFIX, source_hash(text))
+        if profile is None:
+            print(
+                f"Aviso: perfil '{fn + PROFILE_SUFFIX}' ausente ou desatualizado",
+                file=sys.stderr,
+            )
+        else:
+            profile.apply(node, interpreter)
 
-    for match in tokens:
-        token = match.group()
+    result = interpreter.visit(node, context)
 
-        if token in ("SENAO", "SENAO SE"):
-            continue
+    if pgo == "record":
+        profile.save(fn + PROFILE_SUFFIX, node)
 
-        if token == "[":
-            bracket_level += 1
-        elif token == "]":
-            bracket_level -= 1
-        elif token in start_keys:
-            depth += 1
-        elif token in end_keys:
-            depth -= 1
+    if result.should_return:
+        return result.return_value, result.error
 
-    return depth <= 0
+    return result.value, result.error
 
 
 def main():
@@ -126,15 +110,47 @@ Comandos:
   [arquivo.nx] [args]     Executa o script e passa os argumentos para ENTRADA().
   --help                    Mostra esta mensagem de ajuda e sai.
   --version                 Mostra a versão do interpretador e sai.
+
+Opcoes:
+  --strict                  Analisa o corpo de todas as funcoes antes de executar.
+  --parallel                Divide scripts grandes e os analisa em varios processos.
+  --direct                  Executa com o interpretador de retorno direto.
+  --pgo-record              Grava um perfil de execucao em [arquivo.nx].perfil.
+  --pgo-use                 Otimiza a execucao com o perfil gravado anteriormente.
+  --jit-log                 Mostra quais lacos foram compilados e por que outros nao.
 """
 
-    if len(sys.argv) == 1:
+    args = sys.argv[1:]
+    options = set()
+
+    while args and args[0] in (
+        "--strict",
+        "--parallel",
+        "--direct",
+        "--pgo-record",
+        "--pgo-use",
+        "--jit-log",
+    ):
+        options.add(args.pop(0))
+
+    strict = "--strict" in options
+    parallel = "--parallel" in options
+    direct = "--direct" in options
+    pgo = None
+    if "--pgo-record" in options:
+        pgo = "record"
+    elif "--pgo-use" in options:
+        pgo = "use"
+    if "--jit-log" in options:
+        jit.log_stream = sys.stderr
+
+    if not args:
         print(f"Bem-vindo ao Nexus (v{GLADLANG_VERSION})")
         print("Escreva 'sair' ou 'quitar' para fechar o shell.")
         print("--------------------------------------------------")
 
-        repl_context = Context("<repl>")
-        repl_context.symbol_table = get_fresh_global_scope()
+        session = ReplSession(get_fresh_global_scope(), strict, direct)
+        tracker = BlockTracker()
 
         full_text = ""
 
@@ -148,28 +164,22 @@ Comandos:
 
                 full_text += line + "\n"
 
-                if is_complete(full_text):
+                if tracker.feed(line):
+                    tracker.reset()
+
                     if full_text.strip() == "":
                         full_text = ""
                         continue
 
-                    result, error = run("<stdin>", full_text, repl_context)
+                    result, error = session.execute(full_text)
 
                     if error:
                         print(error.as_string())
                     elif result:
-                        clean_text = re.sub(r"#.*", "", full_text).strip()
-
-                        if clean_text.startswith("LET "):
+                        if session.is_quiet(full_text):
                             pass
                         elif isinstance(result, Number) and result.value == 0:
                             pass
-                        elif (
-                            isinstance(result, List)
-                            and len(result.elements) == 1
-                            and result.elements[0].value == "NULL"
-                        ):
-                            pass
                         else:
                             print(result)
 
@@ -177,6 +187,7 @@ Comandos:
 
             except KeyboardInterrupt:
                 print("\nTecladoInterrupcao")
+                tracker.reset()
                 full_text = ""
                 continue
             except EOFError:
@@ -184,10 +195,11 @@ Comandos:
                 break
             except Exception as e:
                 print(f"Erro no Shell: {e}")
+                tracker.reset()
                 full_text = ""
 
-    elif len(sys.argv) >= 2:
-        arg = sys.argv[1]
+    else:
+        arg = args[0]
 
         if arg == "--help":
             print(GLADLANG_HELP)
@@ -199,7 +211,7 @@ Comandos:
             try:
                 filename = arg
 
-                script_args = sys.argv[2:]
+                script_args = args[1:]
 
                 if script_args:
                     sys.stdin = io.StringIO("\n".join(script_args) + "\n")
@@ -207,7 +219,14 @@ Comandos:
                 with open(filename, "r") as f:
                     text = f.read()
 
-                result, error = run(filename, text)
+                result, error = run(
+                    filename,
+                    text,
+                    strict=strict,
+                    parallel=parallel,
+                    direct=direct,
+                    pgo=pgo,
+                )
 
                 if error:
                     print(error.as_string(), file=sys.stderr)
@@ -217,10 +236,6 @@ Comandos:
             except Exception as e:
                 print(f"Ocorreu um erro inesperado: {e}", file=sys.stderr)
 
-    else:
-        print("Erro: Argumentos invalidos.")
-        print(GLADLANG_HELP)
-
 
 if __name__ == "__main__":
     main()
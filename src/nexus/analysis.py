@@ -0,0 +1,319 @@
+from . import nodes
+from .nodes import *
+from .constants import *
+from .lexer import Token
+
+
+NODE_TYPES = tuple(
+    value
+    for value in vars(nodes).values()
+    if isinstance(value, type) and value.__module__ == nodes.__name__
+)
+
+NODE_TYPE_SET = frozenset(NODE_TYPES)
+
+PURE_BUILTINS = ("INT", "TEXT", "FLUTUANTE", "BOOL")
+
+SKIPPED_FIELDS = (
+    "pos_start",
+    "pos_end",
+    "cached_nodes",
+    "guard_body",
+    "template",
+    "tokens",
+    "frames",
+    "captures",
+    "counters",
+)
+
+ASSIGN_TOKENS = (
+    TT_EQ,
+    TT_PLUSEQ,
+    TT_MINUSEQ,
+    TT_MULEQ,
+    TT_DIVEQ,
+    TT_POWEQ,
+    TT_MODEQ,
+    TT_FLOORDIVEQ,
+)
+
+BINDING_KEYWORDS = ("DECLARAR", "FINAL", "PARA", "FUNCAO", "CLASSE", "CAPTURAR")
+
+DEFINITION_NODES = (FunDefNode, ClassNode)
+
+SCOPE_NODES = DEFINITION_NODES + (LazyCompNode,)
+
+
+def is_node(value):
+    return type(value) in NODE_TYPE_SET
+
+
+def iter_children(node):
+    for name, value in vars(node).items():
+        if name in SKIPPED_FIELDS:
+            continue
+        yield from _iter_nodes(value)
+
+
+def _iter_nodes(value):
+    if type(value) in NODE_TYPE_SET:
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_nodes(item)
+
+
+def map_children(node, fn):
+    for name, value in list(vars(node).items()):
+        if name in SKIPPED_FIELDS:
+            continue
+        setattr(node, name, _map_nodes(value, fn))
+    return node
+
+
+def _map_nodes(value, fn):
+    if is_node(value):
+        return fn(value)
+    elif isinstance(value, list):
+        return [_map_nodes(item, fn) for item in value]
+    elif isinstance(value, tuple):
+        return tuple(_map_nodes(item, fn) for item in value)
+    return value
+
+
+def walk(node, into_functions=True):
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        if (
+            not into_functions
+            and current is not node
+            and isinstance(current, DEFINITION_NODES)
+        ):
+            continue
+        stack.extend(iter_children(current))
+
+
+def is_scope(node):
+    return isinstance(node, SCOPE_NODES)
+
+
+def defines_scope(node):
+    for current in walk(node):
+        if current is not node and is_scope(current):
+            return True
+        if isinstance(current, LazyBodyNode) and current.body is None:
+            depth = 0
+            for tok in current.tokens:
+                if tok.type == TT_LPAREN:
+                    depth += 1
+                elif tok.type == TT_RPAREN:
+                    depth -= 1
+                elif tok.type == TT_KEYWORD and tok.value in ("FUNCAO", "CLASSE"):
+                    return True
+                elif depth > 0 and tok.matches(TT_KEYWORD, "PARA"):
+                    return True
+    return False
+
+
+def is_name_token(value):
+    return isinstance(value, Token) and (
+        value.type == TT_IDENTIFIER or value.matches(TT_KEYWORD, "EU")
+    )
+
+
+def iter_token_names(tokens):
+    for tok in tokens:
+        if is_name_token(tok):
+            yield tok.value
+        elif tok.type == TT_TEMPLATE:
+            for part in tok.value:
+                if isinstance(part, list):
+                    yield from iter_token_names(part)
+
+
+def referenced_names(node):
+    names = set()
+
+    for current in walk(node):
+        if isinstance(current, LazyBodyNode) and current.body is None:
+            names.update(iter_token_names(current.tokens))
+
+        for value in vars(current).values():
+            if is_name_token(value):
+                names.add(value.value)
+            elif isinstance(value, list):
+                names.update(item.value for item in value if is_name_token(item))
+
+    return names
+
+
+def captured_names(node):
+    names = set()
+
+    for current in walk(node, into_functions=False):
+        if current is not node and is_scope(current):
+            names |= referenced_names(current)
+        elif isinstance(current, LazyBodyNode) and current.body is None:
+            if defines_scope(current):
+                names.update(iter_token_names(current.tokens))
+
+    return names
+
+
+def is_increment(node):
+    return isinstance(node, PostOpNode) or (
+        isinstance(node, UnaryOpNode)
+        and node.op_tok.type in (TT_PLUSPLUS, TT_MINUSMINUS)
+    )
+
+
+def iter_bindings(node, into_functions=False):
+    for current in walk(node, into_functions):
+        if isinstance(
+            current, (VarAssignNode, VarAugAssignNode, FinalVarAssignNode, ForNode)
+        ):
+            yield current.var_name_tok.value
+        elif isinstance(current, (ListCompNode, LazyCompNode)):
+            yield current.var_name_tok.value
+        elif isinstance(current, MultiVarAssignNode):
+            for tok in current.var_name_toks:
+                yield tok.value
+        elif isinstance(current, FunDefNode):
+            if current.var_name_tok:
+                yield current.var_name_tok.value
+            if into_functions:
+                for tok in current.arg_name_toks:
+                    yield tok.value
+        elif isinstance(current, ClassNode):
+            yield current.class_name_tok.value
+        elif isinstance(current, TryCatchNode):
+            if current.catch_var_node:
+                yield current.catch_var_node.value
+        elif is_increment(current) and isinstance(current.node, VarAccessNode):
+            yield current.node.var_name_tok.value
+        elif isinstance(current, LazyBodyNode) and current.body is None:
+            for name, _ in iter_token_bindings(current.tokens):
+                yield name
+
+
+def iter_token_bindings(tokens):
+    in_params = False
+    in_targets = False
+
+    for idx, tok in enumerate(tokens):
+        prev_tok = tokens[idx - 1] if idx > 0 else None
+        next_tok = tokens[idx + 1] if idx + 1 < len(tokens) else None
+
+        if tok.type == TT_LPAREN and prev_tok and (
+            prev_tok.matches(TT_KEYWORD, "FUNCAO")
+            or (
+                prev_tok.type == TT_IDENTIFIER
+                and idx > 1
+                and tokens[idx - 2].matches(TT_KEYWORD, "FUNCAO")
+            )
+        ):
+            in_params = True
+        elif tok.type == TT_RPAREN:
+            in_params = False
+        elif tok.type == TT_LSQUARE and prev_tok and prev_tok.matches(
+            TT_KEYWORD, "DECLARAR"
+        ):
+            in_targets = True
+        elif tok.type == TT_RSQUARE:
+            in_targets = False
+
+        if tok.type != TT_IDENTIFIER or (prev_tok and prev_tok.type == TT_DOT):
+            continue
+
+        if prev_tok and prev_tok.type in (TT_PLUSPLUS, TT_MINUSMINUS):
+            yield tok.value, True
+        elif next_tok and next_tok.type in (TT_PLUSPLUS, TT_MINUSMINUS):
+            yield tok.value, True
+        elif in_params or in_targets:
+            yield tok.value, False
+        elif next_tok and next_tok.type in ASSIGN_TOKENS:
+            yield tok.value, False
+        elif prev_tok and prev_tok.type == TT_KEYWORD:
+            if prev_tok.value in BINDING_KEYWORDS:
+                yield tok.value, False
+
+
+def produces(node):
+    return any(
+        isinstance(current, ProduceNode)
+        for current in walk(node, into_functions=False)
+    )
+
+
+def scoped_names(node):
+    names = set()
+
+    for current in walk(node):
+        if isinstance(current, FunDefNode):
+            names.update(tok.value for tok in current.arg_name_toks)
+            names |= bound_names(current.body_node, into_functions=True)
+        elif isinstance(current, TryCatchNode) and current.catch_body_node:
+            if current.catch_var_node:
+                names.add(current.catch_var_node.value)
+            names |= bound_names(current.catch_body_node, into_functions=True)
+        elif isinstance(current, LazyCompNode):
+            names.add(current.var_name_tok.value)
+
+    return names
+
+
+def bound_names(node, into_functions=False):
+    return set(iter_bindings(node, into_functions))
+
+
+def updated_names(node):
+    names = set()
+
+    for current in walk(node):
+        if is_increment(current) and isinstance(current.node, VarAccessNode):
+            names.add(current.node.var_name_tok.value)
+        elif isinstance(current, LazyBodyNode) and current.body is None:
+            names.update(
+                name for name, updated in iter_token_bindings(current.tokens) if updated
+            )
+
+    return names
+
+
+def node_key(node):
+    if isinstance(node, NumberNode):
+        return ("num", type(node.tok.value), node.tok.value)
+    if isinstance(node, StringNode):
+        return ("str", node.tok.value)
+    if isinstance(node, VarAccessNode):
+        return ("var", node.var_name_tok.value)
+    if isinstance(node, CachedExprNode):
+        return ("cached", id(node))
+
+    if isinstance(node, BinOpNode):
+        parts = ("bin", node.op_tok.type, node.op_tok.value, node.left_node, node.right_node)
+    elif isinstance(node, LogicalOpNode):
+        parts = ("logic", node.op_tok.value, node.left_node, node.right_node)
+    elif isinstance(node, UnaryOpNode):
+        parts = ("unary", node.op_tok.type, node.op_tok.value, node.node)
+    elif isinstance(node, CallNode):
+        parts = ("call", node.node_to_call, *node.arg_nodes)
+    elif isinstance(node, ListAccessNode):
+        parts = ("index", node.list_node, node.index_node)
+    elif isinstance(node, GetAttrNode):
+        parts = ("attr", node.attr_name_tok.value, node.object_node)
+    elif isinstance(node, SliceAccessNode):
+        parts = ("slice", node.node_to_slice, node.start_node, node.end_node)
+    else:
+        return None
+
+    key = []
+    for part in parts:
+        if is_node(part):
+            part = node_key(part)
+            if part is None:
+                return None
+        key.append(part)
+    return tuple(key)
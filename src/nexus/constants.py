@@ -3,6 +3,7 @@ import string
 TT_INT = "TT_INT"
 TT_FLOAT = "TT_FLOAT"
 TT_STRING = "TT_STRING"
+TT_TEMPLATE = "TT_TEMPLATE"
 TT_IDENTIFIER = "TT_IDENTIFIER"
 TT_KEYWORD = "TT_KEYWORD"
 TT_PLUS = "TT_PLUS"
@@ -53,6 +54,7 @@ KEYWORDS = [
     "FUNCAO",
     "FIMFUNCAO",
     "RETORNAR",
+    "PRODUZIR",
     "CLASSE",
     "FIMCLASSE",
     "HERDA",
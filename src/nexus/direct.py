@@ -0,0 +1,661 @@
+from .runtime import RTResult, Context
+from .values import Number, String, Function, BoundMethod, BaseFunction, List, Tuple
+from .interpreter import Interpreter, DispatchTable, is_counter
+from .jit import HOT_LOOP, LOOP_END, LOOP_BREAK, compile_loop, run_while, run_for
+from .nodes import *
+from .errors import RTError
+from .constants import *
+
+
+class ErrorSignal(Exception):
+    def __init__(self, error):
+        self.error = error
+
+
+class ReturnSignal(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class BreakSignal(Exception):
+    pass
+
+
+class ContinueSignal(Exception):
+    pass
+
+
+BREAK = BreakSignal()
+CONTINUE = ContinueSignal()
+
+
+class DirectInterpreter(Interpreter):
+    @classmethod
+    def build_dispatch(cls):
+        super().build_dispatch()
+        cls.eval_methods = DispatchTable(cls, "eval_", cls.eval_fallback)
+
+    def visit(self, node, context):
+        try:
+            return RTResult().success(self.eval(node, context))
+        except ErrorSignal as signal:
+            return RTResult().failure(signal.error)
+        except ReturnSignal as signal:
+            return RTResult().success_return(signal.value)
+        except BreakSignal:
+            return RTResult().success_break()
+        except ContinueSignal:
+            return RTResult().success_continue()
+
+    def eval(self, node, context):
+        return self.eval_methods[type(node)](self, node, context)
+
+    def eval_fallback(self, node, context):
+        return self.unwrap(Interpreter.visit(self, node, context))
+
+    def unwrap(self, res):
+        if res.error:
+            raise ErrorSignal(res.error)
+        if res.should_return:
+            raise ReturnSignal(res.return_value)
+        if res.should_break:
+            raise BREAK.with_traceback(None)
+        if res.should_continue:
+            raise CONTINUE.with_traceback(None)
+        return res.value
+
+    def eval_StatementListNode(self, node, context):
+        value = Number.null
+        for statement_node in node.statement_nodes:
+            value = self.eval(statement_node, context)
+        return value
+
+    def eval_NumberNode(self, node, context):
+        return (
+            Number(node.tok.value)
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
+    def eval_StringNode(self, node, context):
+        return (
+            String(node.tok.value)
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
+    def eval_TemplateNode(self, node, context):
+        pieces = []
+
+        for part in node.parts:
+            if isinstance(part, str):
+                pieces.append(part)
+            else:
+                pieces.append(str(self.eval(part, context)))
+
+        return (
+            String("".join(pieces))
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
+    def eval_ListNode(self, node, context):
+        elements = [
+            self.eval(element_node, context) for element_node in node.element_nodes
+        ]
+        return (
+            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+
+    def eval_TupleNode(self, node, context):
+        elements = tuple(
+            self.eval(element_node, context) for element_node in node.element_nodes
+        )
+        return (
+            Tuple(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+
+    def eval_VarAccessNode(self, node, context):
+        var_name = node.var_name_tok.value
+
+        if node.global_site:
+            value = self.lookup_global(node, context)
+        else:
+            value = context.symbol_table.get(var_name)
+
+        if not value:
+            raise ErrorSignal(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    f"'{var_name}' nao esta definida",
+                    context,
+                )
+            )
+
+        return value.set_pos(node.pos_start, node.pos_end)
+
+    def eval_VarAssignNode(self, node, context):
+        var_name = node.var_name_tok.value
+
+        if var_name in context.symbol_table.finals:
+            raise ErrorSignal(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    f"Nao e possivel reatribuir a constante '{var_name}'",
+                    context,
+                )
+            )
+
+        value = self.eval(node.value_node, context)
+        context.symbol_table.set(var_name, value)
+        return value
+
+    def eval_VarAugAssignNode(self, node, context):
+        var_name = node.var_name_tok.value
+
+        if var_name in context.symbol_table.finals:
+            raise ErrorSignal(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    f"Nao e possivel reatribuir a constante '{var_name}'",
+                    context,
+                )
+            )
+
+        value = context.symbol_table.get(var_name)
+        if not value:
+            raise ErrorSignal(
+                RTError(
+                    node.var_name_tok.pos_start,
+                    node.var_name_tok.pos_end,
+                    f"'{var_name}' nao esta definida",
+                    context,
+                )
+            )
+        value = value.set_pos(node.var_name_tok.pos_start, node.var_name_tok.pos_end)
+
+        operand = self.eval(node.value_node, context)
+
+        new_value, error = self.binary_operation(value, node.op_tok, operand)
+        if error:
+            raise ErrorSignal(error)
+
+        new_value = new_value.set_pos(node.pos_start, node.pos_end)
+        context.symbol_table.set(var_name, new_value)
+        return new_value
+
+    def eval_PrintNode(self, node, context):
+        print(self.eval(node.node_to_print, context))
+        return Number.null
+
+    def eval_IfNode(self, node, context):
+        for condition, body in node.cases:
+            if self.eval(condition, context).is_true():
+                return self.eval(body, context)
+
+        if node.else_case:
+            return self.eval(node.else_case, context)
+
+        return Number.null
+
+    def eval_ForNode(self, node, context):
+        var_name = node.var_name_tok.value
+
+        if var_name in context.symbol_table.finals:
+            raise ErrorSignal(
+                RTError(
+                    node.var_name_tok.pos_start,
+                    node.var_name_tok.pos_end,
+                    f"Nao e possivel usar '{var_name}' como variavel de loop",
+                    context,
+                )
+            )
+
+        iterable_value = self.eval(node.iterable_node, context)
+
+        elements, error = iterable_value.iterate(self)
+        if error:
+            raise ErrorSignal(error)
+
+        if elements is None:
+            raise ErrorSignal(
+                RTError(
+                    node.iterable_node.pos_start,
+                    node.iterable_node.pos_end,
+                    "O valor nao e iteravel",
+                    context,
+                )
+            )
+
+        self.reset_cache(node, context)
+
+        symbol_table = context.symbol_table
+        body_node = node.body_node
+
+        for element in elements:
+            if node.trace is not None:
+                status, element = run_for(node, element, elements, context)
+                if status is LOOP_END:
+                    break
+                if status is LOOP_BREAK:
+                    return Number.null
+            else:
+                node.back_edges += 1
+                if node.back_edges == HOT_LOOP:
+                    compile_loop(node, context)
+
+            symbol_table.set(var_name, element)
+            try:
+                self.eval(body_node, context)
+            except ContinueSignal:
+                continue
+            except BreakSignal:
+                return Number.null
+
+        error = getattr(elements, "error", None)
+        if error:
+            raise ErrorSignal(error)
+
+        return Number.null
+
+    def eval_WhileNode(self, node, context):
+        self.reset_cache(node, context)
+
+        condition_node = node.condition_node
+        body_node = node.body_node
+
+        while True:
+            if node.trace is not None:
+                if run_while(node, context):
+                    break
+            else:
+                node.back_edges += 1
+                if node.back_edges == HOT_LOOP:
+                    compile_loop(node, context)
+
+            if not self.eval(condition_node, context).is_true():
+                break
+
+            try:
+                self.eval(body_node, context)
+            except ContinueSignal:
+                continue
+            except BreakSignal:
+                break
+
+        return Number.null
+
+    def eval_CountedLoopNode(self, node, context):
+        table, start = self.counted_start(node, context)
+        if table is None:
+            return self.eval_uncounted(node, context)
+
+        self.reset_cache(node.loop, context)
+        bound = self.eval(node.loop.condition_node.right_node, context)
+        if not is_counter(bound):
+            return self.eval_uncounted(node, context)
+
+        var_name = node.var_name_tok.value
+        body_node = node.body_node
+        origin = start.context
+        limit = bound.value
+        k = start.value
+        state = [k, origin]
+        node.counters.append(state)
+
+        try:
+            while k <= limit if node.inclusive else k < limit:
+                if node.trace is not None:
+                    table.set(var_name, Number(k).set_context(origin))
+                    finished = run_while(node, context)
+                    k = table.symbols[var_name].value
+                    if finished or not (k <= limit if node.inclusive else k < limit):
+                        break
+                else:
+                    node.back_edges += 1
+                    if node.back_edges == HOT_LOOP:
+                        compile_loop(node, context)
+
+                if node.eager:
+                    table.set(var_name, Number(k).set_context(origin))
+                else:
+                    state[0] = k
+
+                try:
+                    self.eval(body_node, context)
+                except BreakSignal:
+                    break
+
+                k += 1
+        finally:
+            node.counters.pop()
+            table.set(var_name, Number(k).set_context(origin))
+
+        return Number.null
+
+    def eval_uncounted(self, node, context):
+        node.counters.append(None)
+        try:
+            return self.eval_WhileNode(node.loop, context)
+        finally:
+            node.counters.pop()
+
+    def eval_CounterNode(self, node, context):
+        state = node.counters[-1] if node.counters else None
+        if state is None:
+            return self.eval_VarAccessNode(node.var_access, context)
+
+        return Number(state[0]).set_context(state[1]).set_pos(
+            node.pos_start, node.pos_end
+        )
+
+    def eval_CachedExprNode(self, node, context):
+        if context.expr_cache is None:
+            context.expr_cache = {}
+
+        value = context.expr_cache.get(node)
+        if value is not None:
+            return value
+
+        value = self.eval(node.expr_node, context)
+        if isinstance(value, (Number, String)):
+            context.expr_cache[node] = value
+
+        return value
+
+    def eval_CacheScopeNode(self, node, context):
+        self.reset_cache(node, context)
+        return self.eval(node.node, context)
+
+    def eval_BreakNode(self, node, context):
+        raise BREAK.with_traceback(None)
+
+    def eval_ContinueNode(self, node, context):
+        raise CONTINUE.with_traceback(None)
+
+    def eval_ReturnNode(self, node, context):
+        raise ReturnSignal(self.eval(node.node_to_return, context))
+
+    def eval_LazyBodyNode(self, node, context):
+        if node.body is None:
+            error = self.materialize(node)
+            if error:
+                raise ErrorSignal(error)
+
+        return self.eval(node.body, context)
+
+    def eval_CallNode(self, node, context):
+        value_to_call = self.eval(node.node_to_call, context)
+        args = [self.eval(arg_node, context) for arg_node in node.arg_nodes]
+
+        if type(value_to_call) is Function:
+            return self.call_function(
+                value_to_call, args, node.pos_start, node.pos_end
+            )
+
+        if type(value_to_call) is BoundMethod:
+            return self.call_method(value_to_call, args)
+
+        if isinstance(value_to_call, BaseFunction):
+            return self.unwrap(
+                value_to_call.fast_call(self, args, node.pos_start, node.pos_end)
+            )
+
+        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
+        return self.unwrap(value_to_call.execute(args))
+
+    def call_function(self, function, args, pos_start, pos_end):
+        if function.generator:
+            return self.unwrap(function.fast_call(self, args, pos_start, pos_end))
+
+        if len(args) != function.arity:
+            raise ErrorSignal(function.arity_error(args, pos_start, pos_end))
+
+        if function.specialized is not None:
+            value = function.specialized.call(function, args, pos_start)
+            if value is not None:
+                return value
+
+        new_context = function.acquire_frame(pos_start)
+        symbols = new_context.symbol_table.symbols
+        for arg_name, arg_value in zip(function.arg_names, args):
+            symbols[arg_name] = arg_value
+
+        try:
+            return self.run_body(function.body_node, new_context)
+        finally:
+            function.release_frame(new_context)
+
+    def call_method(self, method, args):
+        function = method.function_to_bind
+        arg_names = function.arg_names
+
+        if function.generator or len(arg_names) == 0 or arg_names[0] != "EU":
+            return self.unwrap(method.fast_call(self, args, None, None))
+
+        if len(args) != function.arity - 1:
+            raise ErrorSignal(
+                function.arity_error(args, function.pos_start, function.pos_end, 1)
+            )
+
+        new_context = function.acquire_frame(function.pos_start)
+        symbols = new_context.symbol_table.symbols
+        symbols["EU"] = method.instance
+        for arg_name, arg_value in zip(arg_names[1:], args):
+            symbols[arg_name] = arg_value
+
+        try:
+            return self.run_body(function.body_node, new_context)
+        finally:
+            function.release_frame(new_context)
+
+    def run_body(self, body_node, context):
+        try:
+            if type(body_node) is LazyBodyNode:
+                if body_node.body is None:
+                    error = self.materialize(body_node)
+                    if error:
+                        raise ErrorSignal(error)
+                body_node = body_node.body
+
+            if type(body_node) is not StatementListNode:
+                return self.eval(body_node, context) or Number.null
+
+            value = Number.null
+            for statement_node in body_node.statement_nodes:
+                if type(statement_node) is ReturnNode:
+                    return self.eval(statement_node.node_to_return, context)
+                value = self.eval(statement_node, context)
+            return value or Number.null
+
+        except ReturnSignal as signal:
+            return signal.value
+        except (BreakSignal, ContinueSignal):
+            return Number.null
+
+    def eval_InlinedCallNode(self, node, context):
+        call_node = node.call_node
+
+        func = self.eval(call_node.node_to_call, context)
+        if not isinstance(func, Function) or func.body_node is not node.guard_body:
+            return self.eval_CallNode(call_node, context)
+
+        args = [self.eval(arg_node, context) for arg_node in call_node.arg_nodes]
+
+        self.inline_frames.append(args)
+        self.inline_calls.append((func, node, context))
+        try:
+            return self.eval(node.template, context)
+        except ErrorSignal as signal:
+            if getattr(signal.error, "context", None) is context:
+                signal.error.context = self.inline_context(context)
+            raise
+        finally:
+            self.inline_calls.pop()
+            self.inline_frames.pop()
+
+    def eval_InlineArgNode(self, node, context):
+        value = self.inline_frames[-1][node.index]
+        if isinstance(value, (Number, String)):
+            value = value.copy().set_pos(node.pos_start, node.pos_end)
+        return value
+
+    def eval_BinOpNode(self, node, context):
+        left = self.eval(node.left_node, context)
+        right = self.eval(node.right_node, context)
+
+        if node.number_op is not None and type(left) is type(right) is Number:
+            try:
+                value = node.number_op(left.value, right.value)
+            except ZeroDivisionError:
+                pass
+            else:
+                return (
+                    Number(value)
+                    .set_context(left.context)
+                    .set_pos(node.pos_start, node.pos_end)
+                )
+
+        result, error = self.binary_operation(left, node.op_tok, right)
+        if error:
+            raise ErrorSignal(error)
+
+        return result.set_pos(node.pos_start, node.pos_end)
+
+    def eval_LogicalOpNode(self, node, context):
+        left = self.eval(node.left_node, context)
+
+        is_and = node.op_tok.matches(TT_KEYWORD, "E") or node.op_tok.matches(
+            TT_KEYWORD, "e"
+        )
+
+        if left.is_true() != is_and:
+            if is_and:
+                result, error = left.anded_by(left)
+            else:
+                result, error = left.ored_by(left)
+        else:
+            right = self.eval(node.right_node, context)
+            result, error = self.binary_operation(left, node.op_tok, right)
+
+        if error:
+            raise ErrorSignal(error)
+
+        return result.set_pos(node.pos_start, node.pos_end)
+
+    def eval_UnaryOpNode(self, node, context):
+        if node.op_tok.type in (TT_PLUSPLUS, TT_MINUSMINUS):
+            return self.unwrap(self.visit_UnaryOpNode(node, context))
+
+        number = self.eval(node.node, context).copy()
+
+        error = None
+        if node.op_tok.type == TT_MINUS:
+            if isinstance(number, Number):
+                number, error = number.multed_by(Number(-1))
+            else:
+                error = RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    "O hifen unário '-' só pode ser aplicado a números.",
+                    context,
+                )
+        elif node.op_tok.matches(TT_KEYWORD, "NAO"):
+            number, error = number.notted()
+
+        if error:
+            raise ErrorSignal(error)
+
+        return number.set_pos(node.pos_start, node.pos_end)
+
+    def eval_PostOpNode(self, node, context):
+        target_node = node.node
+        if type(target_node) is not VarAccessNode:
+            return self.unwrap(self.visit_PostOpNode(node, context))
+
+        var_name = target_node.var_name_tok.value
+        old_value = context.symbol_table.get(var_name)
+        if not old_value:
+            raise ErrorSignal(
+                RTError(
+                    target_node.pos_start,
+                    target_node.pos_end,
+                    f"'{var_name}' nao esta definida",
+                    context,
+                )
+            )
+
+        if not isinstance(old_value, Number):
+            raise ErrorSignal(
+                RTError(
+                    target_node.pos_start,
+                    target_node.pos_end,
+                    "Operando deve ser um numero",
+                    context,
+                )
+            )
+
+        if node.op_tok.type == TT_PLUSPLUS:
+            new_value, error = old_value.added_to(Number(1))
+        else:
+            new_value, error = old_value.subbed_by(Number(1))
+
+        if error:
+            raise ErrorSignal(error)
+
+        err = context.symbol_table.update(var_name, new_value)
+        if err:
+            raise ErrorSignal(
+                RTError(target_node.pos_start, target_node.pos_end, err, context)
+            )
+
+        return old_value.copy().set_pos(node.pos_start, node.pos_end)
+
+    def eval_GetAttrNode(self, node, context):
+        object = self.eval(node.object_node, context)
+
+        value, error = object.get_attr(node.attr_name_tok)
+        if error:
+            raise ErrorSignal(error)
+
+        return value.set_pos(node.pos_start, node.pos_end)
+
+    def eval_ListAccessNode(self, node, context):
+        list_val = self.eval(node.list_node, context)
+        index_val = self.eval(node.index_node, context)
+
+        element, error = list_val.get_element_at(index_val)
+        if error:
+            raise ErrorSignal(error)
+
+        return element.copy().set_pos(node.pos_start, node.pos_end)
+
+    def eval_SwitchNode(self, node, context):
+        switch_val = self.eval(node.switch_value_node, context)
+
+        if node.jump_table is not None and isinstance(switch_val, node.jump_kind):
+            body_node = node.jump_table.get(switch_val.value, node.default_case)
+        else:
+            body_node = self.match_case(node, switch_val, context)
+
+        if body_node:
+            return self.eval(body_node, context)
+
+        return Number.null
+
+    def match_case(self, node, switch_val, context):
+        for case_conditions, body_node in node.cases:
+            for cond_node in case_conditions:
+                case_val = self.eval(cond_node, context)
+
+                is_eq, error = switch_val.get_comparison_eq(case_val)
+                if error:
+                    raise ErrorSignal(error)
+
+                if is_eq.is_true():
+                    return body_node
+
+        return node.default_case
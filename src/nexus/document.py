@@ -0,0 +1,204 @@
+from .constants import *
+from .errors import Position
+from .lexer import Lexer, Token
+from .parser import Parser, ParseResult
+from .nodes import StatementListNode
+from .analysis import walk
+
+
+def collect_positions(tokens, node=None):
+    positions = []
+    seen = set()
+
+    def add(value):
+        if isinstance(value, Position):
+            if id(value) not in seen:
+                seen.add(id(value))
+                positions.append(value)
+        elif isinstance(value, Token):
+            add(getattr(value, "pos_start", None))
+            add(getattr(value, "pos_end", None))
+            if value.type == TT_TEMPLATE:
+                add(value.value)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                add(item)
+
+    add(tokens)
+    if node is not None:
+        for current in walk(node):
+            for value in vars(current).values():
+                add(value)
+
+    return positions
+
+
+class Document:
+    def __init__(self, fn, text, lazy_bodies=False):
+        self.fn = fn
+        self.text = text
+        self.lazy_bodies = lazy_bodies
+        self.tokens = None
+        self.starts = []
+        self.statements = []
+        self.positions = []
+        self.dirty = None
+        self.ast = self.parse_all()
+
+    def parse_all(self):
+        tokens, error = Lexer(self.fn, self.text).make_tokens()
+        if error:
+            self.tokens = None
+            return ParseResult().failure(error)
+
+        self.starts = []
+        self.statements = []
+        self.positions = []
+        return self.parse_region(0, tokens, [])
+
+    def apply_edit(self, edit_range, text):
+        start, end = edit_range
+        old_text = self.text
+        self.text = old_text[:start] + text + old_text[end:]
+
+        if self.tokens is None or not self.starts:
+            self.ast = self.parse_all()
+            return self.ast
+
+        delta = len(text) - (end - start)
+        ln_delta = text.count("\n") - old_text.count("\n", start, end)
+
+        start_idxs = [self.tokens[tok_idx].pos_start.idx for tok_idx in self.starts]
+
+        first = 0
+        for i, idx in enumerate(start_idxs):
+            if idx > start:
+                break
+            first = max(i - 1, 0)
+
+        if self.dirty is not None:
+            first = min(first, self.dirty)
+
+        resync = {
+            start_idxs[i] + delta: i
+            for i in range(first + 1, len(self.starts))
+            if start_idxs[i] >= end
+        }
+
+        if first == 0:
+            lexer = Lexer(self.fn, self.text)
+        else:
+            pos = self.tokens[self.starts[first]].pos_start
+            pos = Position(pos.idx, pos.ln, pos.col, self.fn, self.text)
+            lexer = Lexer(self.fn, self.text, pos)
+
+        region = []
+        match = None
+        while True:
+            tok, error = lexer.make_token()
+            if error:
+                self.tokens = None
+                self.ast = ParseResult().failure(error)
+                return self.ast
+
+            if tok.type != TT_EOF and tok.pos_start.idx in resync:
+                candidate = resync[tok.pos_start.idx]
+                old_pos = self.tokens[self.starts[candidate]].pos_start
+                if (
+                    tok.pos_start.ln == old_pos.ln + ln_delta
+                    and tok.pos_start.col == old_pos.col
+                ):
+                    match = candidate
+                    break
+
+            region.append(tok)
+            if tok.type == TT_EOF:
+                break
+
+        head = self.tokens[: self.starts[first]]
+        tail = []
+
+        if match is None:
+            tokens = head + region
+        else:
+            tail_start = self.starts[match]
+            tokens = head + region + self.tokens[tail_start:]
+            offset = len(head) + len(region) - tail_start
+
+            shifted = set()
+            eof_positions = collect_positions(self.tokens[-1:])
+            for positions in self.positions[match:] + [eof_positions]:
+                for pos in positions:
+                    if id(pos) not in shifted:
+                        shifted.add(id(pos))
+                        pos.idx += delta
+                        pos.ln += ln_delta
+
+            for i in range(match, len(self.starts)):
+                tail.append(
+                    (self.starts[i] + offset, self.statements[i], self.positions[i])
+                )
+
+        del self.starts[first:]
+        del self.statements[first:]
+        del self.positions[first:]
+
+        self.ast = self.parse_region(len(head), tokens, tail)
+        return self.ast
+
+    def parse_region(self, start, tokens, tail):
+        parser = Parser(tokens, self.lazy_bodies)
+        parser.tok_idx = start - 1
+        parser.advance()
+
+        placeholders = [i for i, entry in enumerate(tail) if entry[1] is None]
+        landings = {
+            tok_idx: i
+            for i, (tok_idx, statement, _) in enumerate(tail)
+            if not placeholders or i > placeholders[-1]
+        }
+
+        first = len(self.starts)
+        error = None
+
+        while parser.current_tok.type != TT_EOF:
+            if parser.tok_idx in landings:
+                tail = tail[landings[parser.tok_idx] :]
+                break
+
+            self.starts.append(parser.tok_idx)
+            res = parser.top_level_statement()
+            if res.error:
+                error = res.error
+                self.statements.append(None)
+                tail = [entry for entry in tail if entry[0] > self.starts[-1]]
+                break
+
+            self.statements.append(res.node)
+        else:
+            tail = []
+
+        bounds = self.starts[first:] + [tail[0][0] if tail else len(tokens) - 1]
+        for i in range(first, len(self.starts)):
+            span = tokens[bounds[i - first] : bounds[i - first + 1]]
+            self.positions.append(collect_positions(span, self.statements[i]))
+
+        self.dirty = len(self.starts) - 1 if error else None
+
+        for tok_idx, statement, positions in tail:
+            self.starts.append(tok_idx)
+            self.statements.append(statement)
+            self.positions.append(positions)
+
+        self.tokens = tokens
+
+        if error:
+            return ParseResult().failure(error)
+
+        return ParseResult().success(
+            StatementListNode(
+                list(self.statements),
+                tokens[0].pos_start.copy(),
+                tokens[-1].pos_start.copy(),
+            )
+        )
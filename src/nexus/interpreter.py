@@ -1,30 +1,61 @@
 from platform import node
 from .runtime import RTResult, Context, SymbolTable
-from .values import Number, String, Function, Class, List, Dict
+from .values import Number, String, BaseFunction, Function, Class, List, Dict
+from .values import Range, Tuple, CompStage, extend_stream, is_iterable
 from .nodes import *
 from .errors import RTError
+from .parser import Parser
+from .analysis import NODE_TYPES, captured_names
+from .jit import HOT_LOOP, LOOP_END, LOOP_BREAK, compile_loop, run_while, run_for
 from .constants import *
 
 
+def is_counter(value):
+    return type(value) is Number and type(value.value) in (int, float)
+
+
+class DispatchTable(dict):
+    def __init__(self, owner, prefix, default):
+        super().__init__()
+        self.owner = owner
+        self.prefix = prefix
+        self.default = default
+
+        for node_type in NODE_TYPES:
+            self.__missing__(node_type)
+
+    def __missing__(self, node_type):
+        method = getattr(self.owner, self.prefix + node_type.__name__, self.default)
+        self[node_type] = method
+        return method
+
+
 class Interpreter:
-    def visit(self, node, context):
-        method_name = f"visit_{type(node).__name__}"
-        method = getattr(self, method_name, self.no_visit_method)
-        result = method(node, context)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.build_dispatch()
 
-        if isinstance(result, RTResult) and (
-            result.should_return
-            or result.should_break
-            or result.should_continue
-            or result.error
-        ):
-            return result
+    @classmethod
+    def build_dispatch(cls):
+        cls.visit_methods = DispatchTable(cls, "visit_", cls.no_visit_method)
+        cls.produce_methods = DispatchTable(cls, "produce_", None)
 
-        return result
+    def __init__(self):
+        self.inline_frames = []
+        self.inline_calls = []
+
+    def visit(self, node, context):
+        return self.visit_methods[type(node)](self, node, context)
 
     def no_visit_method(self, node, context):
         raise Exception(f"Nenhum metodo visit_{type(node).__name__} foi definido")
 
+    def produce(self, node, context):
+        method = self.produce_methods[type(node)]
+        if method is None:
+            return self.visit(node, context)
+        return (yield from method(self, node, context))
+
 
     def visit_StatementListNode(self, node, context):
         res = RTResult()
@@ -57,6 +88,25 @@ class Interpreter:
             .set_pos(node.pos_start, node.pos_end)
         )
 
+    def visit_TemplateNode(self, node, context):
+        res = RTResult()
+        pieces = []
+
+        for part in node.parts:
+            if isinstance(part, str):
+                pieces.append(part)
+            else:
+                value = res.register(self.visit(part, context))
+                if res.error:
+                    return res
+                pieces.append(str(value))
+
+        return res.success(
+            String("".join(pieces))
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
     def visit_ListNode(self, node, context):
         res = RTResult()
         elements = []
@@ -70,6 +120,21 @@ class Interpreter:
             List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
         )
 
+    def visit_TupleNode(self, node, context):
+        res = RTResult()
+        elements = []
+
+        for element_node in node.element_nodes:
+            elements.append(res.register(self.visit(element_node, context)))
+            if res.error:
+                return res
+
+        return res.success(
+            Tuple(tuple(elements))
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
     def visit_DictNode(self, node, context):
         res = RTResult()
         elements = {}
@@ -83,17 +148,17 @@ class Interpreter:
             if res.error:
                 return res
 
-            if isinstance(key, (Number, String)):
-                elements[key.value] = value
-            else:
+            hash_key = key.hash_key()
+            if hash_key is None:
                 return res.failure(
                     RTError(
                         key_node.pos_start,
                         key_node.pos_end,
-                        "A chave do dicionario deve ser um numero ou um texto.",
+                        "A chave do dicionario deve ser um numero, um texto ou uma tupla desses valores.",
                         context,
                     )
                 )
+            elements[hash_key] = value
 
         return res.success(
             Dict(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
@@ -106,12 +171,12 @@ class Interpreter:
         if res.error:
             return res
 
-        if not isinstance(list_val, List):
+        if not isinstance(list_val, (List, Tuple)):
             return res.failure(
                 RTError(
                     node.pos_start,
                     node.pos_end,
-                    f"Nao e possivel desempacotar o tipo '{type(list_val).__name__}' (Lista esperada)",
+                    f"Nao e possivel desempacotar o tipo '{type(list_val).__name__}' (Lista ou Tupla esperada)",
                     context,
                 )
             )
@@ -162,29 +227,124 @@ class Interpreter:
         if res.error:
             return res
 
-        if not isinstance(iterable_val, List):
+        elements, error = iterable_val.iterate(self)
+        if error:
+            return res.failure(error)
+
+        if elements is None:
             return res.failure(
                 RTError(
                     node.iterable_node.pos_start,
                     node.iterable_node.pos_end,
-                    "Esperava uma lista",
+                    "O valor nao e iteravel",
                     context,
                 )
             )
 
-        for element in iterable_val.elements:
+        self.reset_cache(node, context)
+
+        if node.kernel is not None:
+            kernel_res = self.run_kernel(node, iterable_val, context)
+            if kernel_res is not None:
+                return kernel_res
+
+        for element in elements:
             context.symbol_table.set(node.var_name_tok.value, element)
 
+            if node.condition_node:
+                condition_value = res.register(self.visit(node.condition_node, context))
+                if res.error:
+                    return res
+
+                if not condition_value.is_true():
+                    continue
+
             value = res.register(self.visit(node.output_expr_node, context))
             if res.error:
                 return res
 
             output_list.append(value)
 
+        error = getattr(elements, "error", None)
+        if error:
+            return res.failure(error)
+
         return res.success(
             List(output_list).set_context(context).set_pos(node.pos_start, node.pos_end)
         )
 
+    def run_kernel(self, node, iterable_val, context):
+        if isinstance(iterable_val, List):
+            elements = iterable_val.elements
+            if not all(type(element) is Number for element in elements):
+                return None
+            values = [element.value for element in elements]
+        elif isinstance(iterable_val, Range):
+            values = list(iterable_val.steps())
+            elements = None
+        else:
+            return None
+
+        if not values:
+            return None
+
+        params = []
+        for param_node in node.kernel.params:
+            param_res = self.visit(param_node, context)
+            if param_res.error or type(param_res.value) is not Number:
+                return None
+            params.append(param_res.value.value)
+
+        results = node.kernel.run(values, params)
+        if results is None:
+            return None
+
+        last = elements[-1] if elements else Number(values[-1]).set_context(context)
+        context.symbol_table.set(node.var_name_tok.value, last)
+
+        expr = node.output_expr_node
+        output_list = [
+            Number(value).set_context(context).set_pos(expr.pos_start, expr.pos_end)
+            for value in results
+        ]
+
+        return RTResult().success(
+            List(output_list).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+
+    def visit_LazyCompNode(self, node, context):
+        res = RTResult()
+
+        iterable_val = res.register(self.visit(node.iterable_node, context))
+        if res.error:
+            return res
+
+        if not is_iterable(iterable_val):
+            return res.failure(
+                RTError(
+                    node.iterable_node.pos_start,
+                    node.iterable_node.pos_end,
+                    "O valor nao e iteravel",
+                    context,
+                )
+            )
+
+        comp_context = Context("<compreensao>", context, node.pos_start)
+        comp_context.symbol_table = SymbolTable(context.symbol_table)
+        var_name = node.var_name_tok.value
+
+        stages = ()
+        if node.condition_node:
+            condition = CompStage(node.condition_node, var_name, comp_context)
+            stages += (("filter", condition),)
+        stages += (("map", CompStage(node.output_expr_node, var_name, comp_context)),)
+
+        return res.success(
+            extend_stream(iterable_val, stages)
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
     def visit_SliceAccessNode(self, node, context):
         res = RTResult()
 
@@ -256,7 +416,11 @@ class Interpreter:
     def visit_VarAccessNode(self, node, context):
         res = RTResult()
         var_name = node.var_name_tok.value
-        value = context.symbol_table.get(var_name)
+
+        if node.global_site:
+            value = self.lookup_global(node, context)
+        else:
+            value = context.symbol_table.get(var_name)
 
         if not value:
             return res.failure(
@@ -272,6 +436,17 @@ class Interpreter:
 
         return res.success(value)
 
+    def lookup_global(self, node, context):
+        root = context.symbol_table.root
+        if node.cached_root is root and node.cached_version == root.version:
+            return node.cached_value
+
+        value = root.symbols.get(node.var_name_tok.value)
+        node.cached_root = root
+        node.cached_version = root.version
+        node.cached_value = value
+        return value
+
     def visit_VarAssignNode(self, node, context):
         res = RTResult()
         var_name = node.var_name_tok.value
@@ -321,34 +496,55 @@ class Interpreter:
 
         return res.success(Number.null)
 
-    def visit_ForNode(self, node, context):
-        res = RTResult()
-
+    def loop_elements(self, node, context):
         if node.var_name_tok.value in context.symbol_table.finals:
-            return res.failure(
-                RTError(
-                    node.var_name_tok.pos_start,
-                    node.var_name_tok.pos_end,
-                    f"Nao e possivel usar '{node.var_name_tok.value}' como variavel de loop",
-                    context,
-                )
+            return None, RTError(
+                node.var_name_tok.pos_start,
+                node.var_name_tok.pos_end,
+                f"Nao e possivel usar '{node.var_name_tok.value}' como variavel de loop",
+                context,
             )
 
+        res = RTResult()
         iterable_value = res.register(self.visit(node.iterable_node, context))
         if res.error:
-            return res
+            return None, res.error
 
-        if not isinstance(iterable_value, List):
-            return res.failure(
-                RTError(
-                    node.iterable_node.pos_start,
-                    node.iterable_node.pos_end,
-                    "Interavel deve ser uma lista",
-                    context,
-                )
+        elements, error = iterable_value.iterate(self)
+        if error:
+            return None, error
+
+        if elements is None:
+            return None, RTError(
+                node.iterable_node.pos_start,
+                node.iterable_node.pos_end,
+                "O valor nao e iteravel",
+                context,
             )
 
-        for element in iterable_value.elements:
+        return elements, None
+
+    def visit_ForNode(self, node, context):
+        res = RTResult()
+
+        elements, error = self.loop_elements(node, context)
+        if error:
+            return res.failure(error)
+
+        self.reset_cache(node, context)
+
+        for element in elements:
+            if node.trace is not None:
+                status, element = run_for(node, element, elements, context)
+                if status is LOOP_END:
+                    break
+                if status is LOOP_BREAK:
+                    return res.success(Number.null)
+            else:
+                node.back_edges += 1
+                if node.back_edges == HOT_LOOP:
+                    compile_loop(node, context)
+
             context.symbol_table.set(node.var_name_tok.value, element)
 
             value = res.register(self.visit(node.body_node, context))
@@ -366,12 +562,25 @@ class Interpreter:
             if res.should_return:
                 return res
 
+        error = getattr(elements, "error", None)
+        if error:
+            return res.failure(error)
+
         return res.success(Number.null)
 
     def visit_WhileNode(self, node, context):
         res = RTResult()
+        self.reset_cache(node, context)
 
         while True:
+            if node.trace is not None:
+                if run_while(node, context):
+                    break
+            else:
+                node.back_edges += 1
+                if node.back_edges == HOT_LOOP:
+                    compile_loop(node, context)
+
             condition_value = res.register(self.visit(node.condition_node, context))
             if res.error:
                 return res
@@ -396,6 +605,120 @@ class Interpreter:
 
         return res.success(Number.null)
 
+    def counted_start(self, node, context):
+        var_name = node.var_name_tok.value
+        table = context.symbol_table
+        while table is not None and var_name not in table.symbols:
+            table = table.parent
+
+        if table is None or var_name in table.finals:
+            return None, None
+
+        start = table.symbols[var_name]
+        if not is_counter(start):
+            return None, None
+        return table, start
+
+    def visit_CountedLoopNode(self, node, context):
+        res = RTResult()
+
+        table, start = self.counted_start(node, context)
+        if table is None:
+            return self.run_uncounted(node, context)
+
+        self.reset_cache(node.loop, context)
+        bound = res.register(self.visit(node.loop.condition_node.right_node, context))
+        if res.error:
+            return res
+
+        if not is_counter(bound):
+            return self.run_uncounted(node, context)
+
+        var_name = node.var_name_tok.value
+        origin = start.context
+        limit = bound.value
+        k = start.value
+        state = [k, origin]
+        node.counters.append(state)
+
+        try:
+            while k <= limit if node.inclusive else k < limit:
+                if node.trace is not None:
+                    table.set(var_name, Number(k).set_context(origin))
+                    finished = run_while(node, context)
+                    k = table.symbols[var_name].value
+                    if finished or not (k <= limit if node.inclusive else k < limit):
+                        break
+                else:
+                    node.back_edges += 1
+                    if node.back_edges == HOT_LOOP:
+                        compile_loop(node, context)
+
+                if node.eager:
+                    table.set(var_name, Number(k).set_context(origin))
+                else:
+                    state[0] = k
+
+                res.register(self.visit(node.body_node, context))
+                if res.error or res.should_return:
+                    return res
+
+                if res.should_break:
+                    res.should_break = False
+                    break
+
+                k += 1
+        finally:
+            node.counters.pop()
+            table.set(var_name, Number(k).set_context(origin))
+
+        return res.success(Number.null)
+
+    def run_uncounted(self, node, context):
+        node.counters.append(None)
+        try:
+            return self.visit_WhileNode(node.loop, context)
+        finally:
+            node.counters.pop()
+
+    def visit_CounterNode(self, node, context):
+        state = node.counters[-1] if node.counters else None
+        if state is None:
+            return self.visit_VarAccessNode(node.var_access, context)
+
+        return RTResult().success(
+            Number(state[0])
+            .set_context(state[1])
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
+    def reset_cache(self, node, context):
+        if node.cached_nodes and context.expr_cache:
+            for cached_node in node.cached_nodes:
+                context.expr_cache.pop(cached_node, None)
+
+    def visit_CachedExprNode(self, node, context):
+        if context.expr_cache is None:
+            context.expr_cache = {}
+
+        value = context.expr_cache.get(node)
+        if value is not None:
+            return RTResult().success(value)
+
+        res = RTResult()
+        value = res.register(self.visit(node.expr_node, context))
+        if res.error:
+            return res
+
+        if isinstance(value, (Number, String)):
+            context.expr_cache[node] = value
+
+        return res.success(value)
+
+    def visit_CacheScopeNode(self, node, context):
+        self.reset_cache(node, context)
+        return self.visit(node.node, context)
+
     def visit_BreakNode(self, node, context):
         return RTResult().success_break()
 
@@ -408,7 +731,16 @@ class Interpreter:
         func_name = node.var_name_tok.value if node.var_name_tok else None
         body_node = node.body_node
 
-        func = Function(func_name, body_node, node.arg_name_toks, context)
+        func = Function(
+            func_name,
+            body_node,
+            node.arg_name_toks,
+            context,
+            node.frames,
+            node.captures,
+            node.generator,
+            node.specialized,
+        )
 
         if func_name:
             context.symbol_table.set(func_name, func)
@@ -417,6 +749,30 @@ class Interpreter:
             func.set_pos(node.pos_start, node.pos_end).set_context(context)
         )
 
+    def visit_LazyBodyNode(self, node, context):
+        if node.body is None:
+            error = self.materialize(node)
+            if error:
+                return RTResult().failure(error)
+
+        return self.visit(node.body, context)
+
+    def materialize(self, node):
+        parse_res = Parser(node.tokens, lazy_bodies=True).statement_list(
+            ("FIMFUNCAO",)
+        )
+        if parse_res.error:
+            return parse_res.error
+
+        body = parse_res.node
+        if node.optimizer:
+            body = node.optimizer.optimize_body(body)
+        node.body = body
+
+        if node.captures is not None:
+            node.captures.intersection_update(captured_names(body))
+        return None
+
     def visit_CallNode(self, node, context):
         res = RTResult()
         args = []
@@ -425,19 +781,71 @@ class Interpreter:
         if res.error:
             return res
 
-        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
-
         for arg_node in node.arg_nodes:
             args.append(res.register(self.visit(arg_node, context)))
             if res.error:
                 return res
 
-        return_value = res.register(value_to_call.execute(args))
+        if isinstance(value_to_call, BaseFunction):
+            return_value = res.register(
+                value_to_call.fast_call(self, args, node.pos_start, node.pos_end)
+            )
+        else:
+            value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
+            return_value = res.register(value_to_call.execute(args))
+
         if res.error:
             return res
 
         return res.success(return_value)
 
+    def visit_InlinedCallNode(self, node, context):
+        res = RTResult()
+        call_node = node.call_node
+
+        func = res.register(self.visit(call_node.node_to_call, context))
+        if res.error:
+            return res
+
+        if not isinstance(func, Function) or func.body_node is not node.guard_body:
+            return self.visit_CallNode(call_node, context)
+
+        args = []
+        for arg_node in call_node.arg_nodes:
+            args.append(res.register(self.visit(arg_node, context)))
+            if res.error:
+                return res
+
+        self.inline_frames.append(args)
+        self.inline_calls.append((func, node, context))
+        value = res.register(self.visit(node.template, context))
+        if res.error and getattr(res.error, "context", None) is context:
+            res.error.context = self.inline_context(context)
+        self.inline_calls.pop()
+        self.inline_frames.pop()
+
+        if res.error:
+            return res
+
+        return res.success(value)
+
+    def inline_context(self, context):
+        calls = []
+        for func, call_node, call_context in reversed(self.inline_calls):
+            if call_context is not context:
+                break
+            calls.append((func, call_node))
+
+        for func, call_node in reversed(calls):
+            context = Context(func.name, context, call_node.pos_start)
+        return context
+
+    def visit_InlineArgNode(self, node, context):
+        value = self.inline_frames[-1][node.index]
+        if isinstance(value, (Number, String)):
+            value = value.copy().set_pos(node.pos_start, node.pos_end)
+        return RTResult().success(value)
+
     def visit_ReturnNode(self, node, context):
         res = RTResult()
 
@@ -447,6 +855,16 @@ class Interpreter:
 
         return res.success_return(value)
 
+    def visit_ProduceNode(self, node, context):
+        return RTResult().failure(
+            RTError(
+                node.pos_start,
+                node.pos_end,
+                "PRODUZIR so pode ser usado dentro de uma funcao",
+                context,
+            )
+        )
+
     def visit_ClassNode(self, node, context):
         res = RTResult()
         class_name = node.class_name_tok.value
@@ -470,7 +888,13 @@ class Interpreter:
         for method_node in node.method_nodes:
             method_name = method_node.var_name_tok.value
             method_value = Function(
-                method_name, method_node.body_node, method_node.arg_name_toks, context
+                method_name,
+                method_node.body_node,
+                method_node.arg_name_toks,
+                context,
+                method_node.frames,
+                method_node.captures,
+                method_node.generator,
             ).set_pos(method_node.pos_start, method_node.pos_end)
             methods[method_name] = method_value
 
@@ -586,6 +1010,104 @@ class Interpreter:
 
         return res.success(new_value)
 
+    def visit_VarAugAssignNode(self, node, context):
+        res = RTResult()
+        var_name = node.var_name_tok.value
+
+        if var_name in context.symbol_table.finals:
+            return res.failure(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    f"Nao e possivel reatribuir a constante '{var_name}'",
+                    context,
+                )
+            )
+
+        value = context.symbol_table.get(var_name)
+        if not value:
+            return res.failure(
+                RTError(
+                    node.var_name_tok.pos_start,
+                    node.var_name_tok.pos_end,
+                    f"'{var_name}' nao esta definida",
+                    context,
+                )
+            )
+        value = value.set_pos(node.var_name_tok.pos_start, node.var_name_tok.pos_end)
+
+        operand = res.register(self.visit(node.value_node, context))
+        if res.error:
+            return res
+
+        new_value, error = self.binary_operation(value, node.op_tok, operand)
+        if error:
+            return res.failure(error)
+
+        new_value = new_value.set_pos(node.pos_start, node.pos_end)
+        context.symbol_table.set(var_name, new_value)
+        return res.success(new_value)
+
+    def visit_AttrAugAssignNode(self, node, context):
+        res = RTResult()
+
+        object = res.register(self.visit(node.object_node, context))
+        if res.error:
+            return res
+
+        value, error = object.get_attr(node.attr_name_tok)
+        if error:
+            return res.failure(error)
+        value = value.set_pos(node.pos_start, node.attr_name_tok.pos_end)
+
+        operand = res.register(self.visit(node.value_node, context))
+        if res.error:
+            return res
+
+        new_value, error = self.binary_operation(value, node.op_tok, operand)
+        if error:
+            return res.failure(error)
+
+        new_value, error = object.set_attr(
+            node.attr_name_tok, new_value.set_pos(node.pos_start, node.pos_end)
+        )
+        if error:
+            return res.failure(error)
+
+        return res.success(new_value)
+
+    def visit_ListAugAssignNode(self, node, context):
+        res = RTResult()
+
+        list_val = res.register(self.visit(node.list_node, context))
+        if res.error:
+            return res
+
+        index_val = res.register(self.visit(node.index_node, context))
+        if res.error:
+            return res
+
+        element, error = list_val.get_element_at(index_val)
+        if error:
+            return res.failure(error)
+        element = element.set_pos(node.pos_start, node.index_node.pos_end)
+
+        operand = res.register(self.visit(node.value_node, context))
+        if res.error:
+            return res
+
+        new_value, error = self.binary_operation(element, node.op_tok, operand)
+        if error:
+            return res.failure(error)
+
+        new_value, error = list_val.set_element_at(
+            index_val, new_value.set_pos(node.pos_start, node.pos_end)
+        )
+        if error:
+            return res.failure(error)
+
+        return res.success(new_value)
+
     def visit_BinOpNode(self, node, context):
         res = RTResult()
         left = res.register(self.visit(node.left_node, context))
@@ -595,53 +1117,90 @@ class Interpreter:
         if res.error:
             return res
 
-        if node.op_tok.type == TT_PLUS:
+        if node.number_op is not None and type(left) is type(right) is Number:
+            try:
+                value = node.number_op(left.value, right.value)
+            except ZeroDivisionError:
+                pass
+            else:
+                return res.success(
+                    Number(value)
+                    .set_context(left.context)
+                    .set_pos(node.pos_start, node.pos_end)
+                )
+
+        result, error = self.binary_operation(left, node.op_tok, right)
+        if error:
+            return res.failure(error)
+        else:
+            return res.success(result.set_pos(node.pos_start, node.pos_end))
+
+    def visit_LogicalOpNode(self, node, context):
+        res = RTResult()
+        left = res.register(self.visit(node.left_node, context))
+        if res.error:
+            return res
+
+        is_and = node.op_tok.matches(TT_KEYWORD, "E") or node.op_tok.matches(
+            TT_KEYWORD, "e"
+        )
+
+        if left.is_true() != is_and:
+            if is_and:
+                result, error = left.anded_by(left)
+            else:
+                result, error = left.ored_by(left)
+        else:
+            right = res.register(self.visit(node.right_node, context))
+            if res.error:
+                return res
+
+            result, error = self.binary_operation(left, node.op_tok, right)
+
+        if error:
+            return res.failure(error)
+        else:
+            return res.success(result.set_pos(node.pos_start, node.pos_end))
+
+    def binary_operation(self, left, op_tok, right):
+        if op_tok.type == TT_PLUS:
             result, error = left.added_to(right)
-        elif node.op_tok.type == TT_MINUS:
+        elif op_tok.type == TT_MINUS:
             result, error = left.subbed_by(right)
-        elif node.op_tok.type == TT_MUL:
+        elif op_tok.type == TT_MUL:
             result, error = left.multed_by(right)
-        elif node.op_tok.type == TT_DIV:
+        elif op_tok.type == TT_DIV:
             result, error = left.dived_by(right)
-        elif node.op_tok.type == TT_MOD:
+        elif op_tok.type == TT_MOD:
             result, error = left.modded_by(right)
-        elif node.op_tok.type == TT_FLOORDIV:
+        elif op_tok.type == TT_FLOORDIV:
             result, error = left.floordived_by(right)
-        elif node.op_tok.type == TT_POW:
+        elif op_tok.type == TT_POW:
             result, error = left.powed_by(right)
-        elif node.op_tok.type == TT_DIV:
+        elif op_tok.type == TT_DIV:
             result, error = left.dived_by(right)
-        elif node.op_tok.type == TT_POW:
+        elif op_tok.type == TT_POW:
             result, error = left.powed_by(right)
-        elif node.op_tok.type == TT_EE:
+        elif op_tok.type == TT_EE:
             result, error = left.get_comparison_eq(right)
-        elif node.op_tok.type == TT_NE:
+        elif op_tok.type == TT_NE:
             result, error = left.get_comparison_ne(right)
-        elif node.op_tok.type == TT_LT:
+        elif op_tok.type == TT_LT:
             result, error = left.get_comparison_lt(right)
-        elif node.op_tok.type == TT_GT:
+        elif op_tok.type == TT_GT:
             result, error = left.get_comparison_gt(right)
-        elif node.op_tok.type == TT_LTE:
+        elif op_tok.type == TT_LTE:
             result, error = left.get_comparison_lte(right)
-        elif node.op_tok.type == TT_GTE:
+        elif op_tok.type == TT_GTE:
             result, error = left.get_comparison_gte(right)
-        elif node.op_tok.matches(TT_KEYWORD, "E") or node.op_tok.matches(
-            TT_KEYWORD, "e"
-        ):
+        elif op_tok.matches(TT_KEYWORD, "E") or op_tok.matches(TT_KEYWORD, "e"):
             result, error = left.anded_by(right)
-        elif node.op_tok.matches(TT_KEYWORD, "OU") or node.op_tok.matches(
-            TT_KEYWORD, "ou"
-        ):
+        elif op_tok.matches(TT_KEYWORD, "OU") or op_tok.matches(TT_KEYWORD, "ou"):
             result, error = left.ored_by(right)
-        elif node.op_tok.matches(TT_KEYWORD, "IS") or node.op_tok.matches(
-            TT_KEYWORD, "ser"
-        ):
+        elif op_tok.matches(TT_KEYWORD, "IS") or op_tok.matches(TT_KEYWORD, "ser"):
             result, error = left.get_comparison_is(right)
 
-        if error:
-            return res.failure(error)
-        else:
-            return res.success(result.set_pos(node.pos_start, node.pos_end))
+        return result, error
 
     def visit_UnaryOpNode(self, node, context):
         res = RTResult()
@@ -718,9 +1277,6 @@ class Interpreter:
                         )
                     )
 
-            if isinstance(target_node, VarAccessNode):
-                context.symbol_table.set(var_name, new_value)
-
             elif isinstance(target_node, GetAttrNode):
                 _, error = obj.set_attr(target_node.attr_name_tok, new_value)
                 if error:
@@ -956,9 +1512,30 @@ class Interpreter:
         if res.error:
             return res
 
-        for case_conditions, body_node in node.cases:
-            should_execute = False
+        if node.jump_table is not None and isinstance(switch_val, node.jump_kind):
+            body_node = node.jump_table.get(switch_val.value, node.default_case)
+        else:
+            body_node = res.register(self.find_case(node, switch_val, context))
+            if res.error:
+                return res
+
+        if body_node:
+            val = res.register(self.visit(body_node, context))
+            if (
+                res.error
+                or res.should_return
+                or res.should_break
+                or res.should_continue
+            ):
+                return res
+            return res.success(val)
 
+        return res.success(Number.null)
+
+    def find_case(self, node, switch_val, context):
+        res = RTResult()
+
+        for case_conditions, body_node in node.cases:
             for cond_node in case_conditions:
                 case_val = res.register(self.visit(cond_node, context))
                 if res.error:
@@ -969,22 +1546,23 @@ class Interpreter:
                     return res.failure(error)
 
                 if is_eq.is_true():
-                    should_execute = True
-                    break
+                    return res.success(body_node)
 
-            if should_execute:
-                val = res.register(self.visit(body_node, context))
-                if (
-                    res.error
-                    or res.should_return
-                    or res.should_break
-                    or res.should_continue
-                ):
-                    return res
-                return res.success(val)
+        return res.success(node.default_case)
+
+    def produce_StatementListNode(self, node, context):
+        res = RTResult()
+        last_value = Number.null
+
+        for statement_node in node.statement_nodes:
+            method = self.produce_methods[type(statement_node)]
+            if method is None:
+                last_value = res.register(self.visit(statement_node, context))
+            else:
+                last_value = res.register(
+                    (yield from method(self, statement_node, context))
+                )
 
-        if node.default_case:
-            val = res.register(self.visit(node.default_case, context))
             if (
                 res.error
                 or res.should_return
@@ -992,6 +1570,179 @@ class Interpreter:
                 or res.should_continue
             ):
                 return res
-            return res.success(val)
 
+        return res.success(last_value)
+
+    def produce_ProduceNode(self, node, context):
+        res = RTResult()
+
+        value = res.register(self.visit(node.node_to_produce, context))
+        if res.error:
+            return res
+
+        yield value
         return res.success(Number.null)
+
+    def produce_IfNode(self, node, context):
+        res = RTResult()
+
+        for condition, body in node.cases:
+            condition_value = res.register(self.visit(condition, context))
+            if res.error:
+                return res
+
+            if condition_value.is_true():
+                return (yield from self.produce(body, context))
+
+        if node.else_case:
+            return (yield from self.produce(node.else_case, context))
+
+        return res.success(Number.null)
+
+    def produce_ForNode(self, node, context):
+        res = RTResult()
+
+        elements, error = self.loop_elements(node, context)
+        if error:
+            return res.failure(error)
+
+        self.reset_cache(node, context)
+
+        for element in elements:
+            context.symbol_table.set(node.var_name_tok.value, element)
+
+            res.register((yield from self.produce(node.body_node, context)))
+            if res.error:
+                return res
+
+            if res.should_continue:
+                res.should_continue = False
+                continue
+
+            if res.should_break:
+                res.should_break = False
+                break
+
+            if res.should_return:
+                return res
+        else:
+            error = getattr(elements, "error", None)
+            if error:
+                return res.failure(error)
+
+        return res.success(Number.null)
+
+    def produce_WhileNode(self, node, context):
+        res = RTResult()
+        self.reset_cache(node, context)
+
+        while True:
+            condition_value = res.register(self.visit(node.condition_node, context))
+            if res.error:
+                return res
+
+            if not condition_value.is_true():
+                break
+
+            res.register((yield from self.produce(node.body_node, context)))
+            if res.error:
+                return res
+
+            if res.should_continue:
+                res.should_continue = False
+                continue
+
+            if res.should_break:
+                res.should_break = False
+                break
+
+            if res.should_return:
+                return res
+
+        return res.success(Number.null)
+
+    def produce_TryCatchNode(self, node, context):
+        res = RTResult()
+
+        try_res = yield from self.produce(node.try_body_node, context)
+
+        if try_res.error:
+            if node.catch_body_node:
+                catch_context = Context("CAPTURAR", context, node.pos_start)
+                catch_context.symbol_table = SymbolTable(context.symbol_table)
+
+                if node.catch_var_node:
+                    val_to_assign = getattr(try_res.error, "thrown_value", None)
+                    if val_to_assign is None:
+                        val_to_assign = String(try_res.error.details)
+                    catch_context.symbol_table.set(
+                        node.catch_var_node.value, val_to_assign
+                    )
+
+                res.register(
+                    (yield from self.produce(node.catch_body_node, catch_context))
+                )
+
+                if res.error:
+                    if node.finally_body_node:
+                        fin_res = yield from self.produce(
+                            node.finally_body_node, context
+                        )
+                        if fin_res.error:
+                            return res.failure(fin_res.error)
+
+                    return res
+
+            else:
+                if node.finally_body_node:
+                    fin_res = yield from self.produce(node.finally_body_node, context)
+                    if fin_res.error:
+                        return fin_res
+                return try_res
+        else:
+            res.register(try_res)
+            if res.should_return or res.should_break or res.should_continue:
+                if node.finally_body_node:
+                    yield from self.produce(node.finally_body_node, context)
+                return res
+
+        if node.finally_body_node:
+            res.register((yield from self.produce(node.finally_body_node, context)))
+            if res.error:
+                return res
+
+        return res.success(Number.null)
+
+    def produce_SwitchNode(self, node, context):
+        res = RTResult()
+
+        switch_val = res.register(self.visit(node.switch_value_node, context))
+        if res.error:
+            return res
+
+        if node.jump_table is not None and isinstance(switch_val, node.jump_kind):
+            body_node = node.jump_table.get(switch_val.value, node.default_case)
+        else:
+            body_node = res.register(self.find_case(node, switch_val, context))
+            if res.error:
+                return res
+
+        if body_node:
+            return (yield from self.produce(body_node, context))
+
+        return res.success(Number.null)
+
+    def produce_CacheScopeNode(self, node, context):
+        self.reset_cache(node, context)
+        return (yield from self.produce(node.node, context))
+
+    def produce_LazyBodyNode(self, node, context):
+        if node.body is None:
+            error = self.materialize(node)
+            if error:
+                return RTResult().failure(error)
+
+        return (yield from self.produce(node.body, context))
+
+
+Interpreter.build_dispatch()
@@ -0,0 +1,307 @@
+from itertools import chain
+
+from .nodes import *
+from .analysis import walk, referenced_names, bound_names, updated_names
+from .specializer import NumericCompiler, HELPERS
+from .values import Function, Number
+
+
+HOT_LOOP = 64
+MAX_EXITS = 16
+
+NUMERIC_TYPES = (int, float)
+
+LOOP_END = "end"
+LOOP_BREAK = "break"
+LOOP_EXIT = "exit"
+
+LOOP_NAMES = {WhileNode: "ENQUANTO", CountedLoopNode: "ENQUANTO", ForNode: "PARA"}
+
+log_stream = None
+
+
+def log(node, message):
+    if log_stream is not None:
+        name = LOOP_NAMES[type(node)]
+        print(
+            f"[jit] {name} linha {node.pos_start.ln + 1}: {message}", file=log_stream
+        )
+
+
+class Trace:
+    def __init__(self, function, names, written, assigned, shared, counters):
+        self.function = function
+        self.names = names
+        self.written = written
+        self.assigned = assigned
+        self.shared = shared
+        self.counters = counters
+        self.exits = 0
+
+
+class LoopCompiler(NumericCompiler):
+    def __init__(self, names):
+        super().__init__([])
+        self.locals = set(names)
+        self.loop_depth = 1
+
+    def statement(self, node, indent):
+        if isinstance(node, ReturnNode):
+            return self.reject(node)
+        return super().statement(node, indent)
+
+    def pack(self, names):
+        return "(" + "".join(f"v_{name}, " for name in names) + ")"
+
+    def compile_while(self, loop, params, written):
+        pack = self.pack(written)
+        self.emit(0, f"def trace(scope{params}):")
+        self.emit(1, "while True:")
+        self.emit(2, f"snapshot = {pack}")
+        self.emit(2, "try:")
+
+        condition = self.expr(loop.condition_node)
+        if condition is None:
+            return False
+        self.emit(3, f"if not {condition}:")
+        self.emit(4, f"return {pack}, LOOP_END, None")
+        if not self.statement(loop.body_node, 3):
+            return False
+
+        self.emit(2, "except Exception:")
+        self.emit(3, "return snapshot, LOOP_EXIT, None")
+        return self.emit(1, f"return {pack}, LOOP_BREAK, None")
+
+    def compile_for(self, loop, params, written):
+        pack = self.pack(written)
+        var_name = loop.var_name_tok.value
+        self.emit(0, f"def trace(scope, elements{params}):")
+        self.emit(1, f"v_{var_name} = None")
+        self.emit(1, "for element in elements:")
+        self.emit(2, f"snapshot = {pack}")
+        self.emit(2, "try:")
+        self.emit(3, "if type(element) is not Number:")
+        self.emit(4, "raise Deoptimize")
+        self.emit(3, f"v_{var_name} = element.value")
+        self.emit(3, f"if type(v_{var_name}) not in NUMERIC_TYPES:")
+        self.emit(4, "raise Deoptimize")
+        if not self.statement(loop.body_node, 3):
+            return False
+
+        self.emit(2, "except Exception:")
+        self.emit(3, "return snapshot, LOOP_EXIT, element")
+        self.emit(1, "else:")
+        self.emit(2, f"return {pack}, LOOP_END, None")
+        return self.emit(1, f"return {pack}, LOOP_BREAK, None")
+
+
+def lookup(table, name):
+    while table is not None and name not in table.symbols:
+        table = table.parent
+    return table
+
+
+def callee_reads(function, reads, seen):
+    if function in seen:
+        return
+    seen.add(function)
+
+    names = referenced_names(function.specialized.body_node)
+    reads |= names
+    for name in names:
+        value = function.context.symbol_table.get(name)
+        if type(value) is Function and value.specialized is not None:
+            callee_reads(value, reads, seen)
+
+
+def compile_loop(node, context):
+    trace, reason = build_trace(node, context)
+    if trace is None:
+        log(node, f"rejeitado ({reason})")
+    else:
+        node.trace = trace
+        names = ", ".join(sorted(set(trace.names) | set(trace.written)))
+        log(node, f"compilado (variaveis: {names})")
+
+
+def build_trace(node, context):
+    loop = node.loop if isinstance(node, CountedLoopNode) else node
+    if isinstance(loop, ForNode):
+        scanned = loop.body_node
+        loop_names = {loop.var_name_tok.value}
+    else:
+        scanned = loop
+        loop_names = set()
+
+    owned = [node.counters] if isinstance(node, CountedLoopNode) else []
+    callees = set()
+    counted = {}
+    for current in walk(scanned):
+        if isinstance(current, LazyBodyNode) and current.body is None:
+            return None, "corpo nao materializado"
+        if isinstance(current, CountedLoopNode):
+            owned.append(current.counters)
+        elif isinstance(current, CounterNode):
+            counted[current.var_access.var_name_tok.value] = current.counters
+        elif isinstance(current, CallNode) and isinstance(
+            current.node_to_call, VarAccessNode
+        ):
+            callees.add(current.node_to_call.var_name_tok.value)
+
+    counters = {
+        name: counters
+        for name, counters in counted.items()
+        if not any(counters is owner for owner in owned)
+    }
+
+    reads = set(callees)
+    seen = set()
+    for name in sorted(callees):
+        function = context.symbol_table.get(name)
+        if (
+            type(function) is not Function
+            or function.specialized is None
+            or function.specialized.compile() is None
+        ):
+            return None, f"chamada a '{name}' nao especializavel"
+        callee_reads(function, reads, seen)
+
+    names = (referenced_names(scanned) - callees) | loop_names
+    if not all(name.isidentifier() for name in names):
+        return None, "nome de variavel invalido"
+
+    params = sorted(names - loop_names)
+    for name in params:
+        counter = counters.get(name)
+        if counter and counter[-1] is not None:
+            value = counter[-1][0]
+        else:
+            value = context.symbol_table.get(name)
+            if value is None:
+                return None, f"'{name}' nao definida"
+            if type(value) is not Number:
+                return None, f"'{name}' e {type(value).__name__}"
+            value = value.value
+        if type(value) not in NUMERIC_TYPES:
+            return None, f"'{name}' e {type(value).__name__}"
+
+    written = sorted(bound_names(scanned) | loop_names)
+    assigned = loop_names | {
+        current.var_name_tok.value
+        for current in walk(scanned)
+        if isinstance(current, (VarAssignNode, VarAugAssignNode))
+    }
+    shared = assigned & updated_names(scanned)
+
+    for name in written:
+        if name in reads:
+            return None, f"'{name}' e lida por uma funcao chamada no laco"
+
+    compiler = LoopCompiler(names)
+    signature = "".join(f", v_{name}" for name in params)
+    if isinstance(loop, ForNode):
+        compiled = compiler.compile_for(loop, signature, written)
+    else:
+        compiled = compiler.compile_while(loop, signature, written)
+    if not compiled:
+        return None, compiler.reason or "construcao nao suportada"
+
+    namespace = dict(HELPERS)
+    namespace.update(
+        Number=Number,
+        NUMERIC_TYPES=NUMERIC_TYPES,
+        LOOP_END=LOOP_END,
+        LOOP_BREAK=LOOP_BREAK,
+        LOOP_EXIT=LOOP_EXIT,
+    )
+    try:
+        exec("\n".join(compiler.lines), namespace)
+    except (SyntaxError, RecursionError):
+        return None, "codigo gerado invalido"
+
+    trace = Trace(namespace["trace"], params, written, assigned, shared, counters)
+    return trace, None
+
+
+def enter(trace, context):
+    symbol_table = context.symbol_table
+
+    args = []
+    for name in trace.names:
+        counter = trace.counters.get(name)
+        if counter and counter[-1] is not None:
+            if name in trace.written:
+                return None
+            value = counter[-1][0]
+        else:
+            table = lookup(symbol_table, name)
+            if table is None:
+                return None
+            value = table.symbols[name]
+            if type(value) is not Number:
+                return None
+            value = value.value
+        if type(value) not in NUMERIC_TYPES:
+            return None
+        args.append(value)
+
+    holders = []
+    for name in trace.written:
+        if name in trace.shared and name not in symbol_table.symbols:
+            return None
+        if name in trace.assigned:
+            table = symbol_table
+        else:
+            table = lookup(symbol_table, name)
+        if table is None or name in table.finals:
+            return None
+        holders.append(table)
+
+    return args, holders
+
+
+def leave(trace, values, holders, context):
+    for name, value, table in zip(trace.written, values, holders):
+        if value is not None:
+            table.set(name, Number(value).set_context(context))
+
+
+def side_exit(node):
+    trace = node.trace
+    trace.exits += 1
+    if trace.exits >= MAX_EXITS:
+        node.trace = None
+        log(node, f"descartado apos {trace.exits} saidas")
+
+
+def run_while(node, context):
+    trace = node.trace
+    entry = enter(trace, context)
+    if entry is None:
+        side_exit(node)
+        return False
+
+    args, holders = entry
+    values, status, _ = trace.function(context.symbol_table, *args)
+    leave(trace, values, holders, context)
+    if status is LOOP_EXIT:
+        side_exit(node)
+        return False
+    return True
+
+
+def run_for(node, element, elements, context):
+    trace = node.trace
+    entry = enter(trace, context)
+    if entry is None:
+        side_exit(node)
+        return None, element
+
+    args, holders = entry
+    values, status, pending = trace.function(
+        context.symbol_table, chain((element,), elements), *args
+    )
+    leave(trace, values, holders, context)
+    if status is LOOP_EXIT:
+        side_exit(node)
+    return status, pending
@@ -0,0 +1,117 @@
+from .constants import *
+from .nodes import *
+from .analysis import referenced_names
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+NUMPY_MIN_SIZE = 1024
+
+ARITHMETIC_OPS = {
+    TT_PLUS: "+",
+    TT_MINUS: "-",
+    TT_MUL: "*",
+    TT_DIV: "/",
+    TT_MOD: "%",
+    TT_FLOORDIV: "//",
+    TT_POW: "**",
+}
+
+COMPARISON_OPS = {
+    TT_EE: "==",
+    TT_NE: "!=",
+    TT_LT: "<",
+    TT_GT: ">",
+    TT_LTE: "<=",
+    TT_GTE: ">=",
+}
+
+
+class Kernel:
+    def __init__(self, expr, params, vectorizable):
+        self.params = params
+        self.vectorizable = vectorizable and numpy is not None
+
+        names = "".join(f", p{i}" for i in range(len(params)))
+        self.scalar = eval(f"lambda xs{names}: [{expr} for x in xs]")
+        self.vector = eval(f"lambda x{names}: {expr}") if self.vectorizable else None
+
+    def run(self, values, params):
+        try:
+            if (
+                self.vectorizable
+                and len(values) >= NUMPY_MIN_SIZE
+                and all(type(value) is float for value in values)
+            ):
+                with numpy.errstate(divide="raise", over="raise", invalid="raise"):
+                    return self.vector(numpy.array(values), *params).tolist()
+
+            return self.scalar(values, *params)
+        except Exception:
+            return None
+
+
+class KernelCompiler:
+    def __init__(self, var_name):
+        self.var_name = var_name
+        self.params = []
+        self.vectorizable = True
+        self.uses_var = False
+
+    def param(self, node):
+        self.params.append(node)
+        return f"p{len(self.params) - 1}"
+
+    def emit(self, node):
+        if isinstance(node, CacheScopeNode):
+            return self.emit(node.node)
+
+        if isinstance(node, CachedExprNode):
+            if self.var_name in referenced_names(node.expr_node):
+                return self.emit(node.expr_node)
+            return self.param(node)
+
+        if isinstance(node, NumberNode):
+            return repr(node.tok.value)
+
+        if isinstance(node, VarAccessNode):
+            if node.var_name_tok.value == self.var_name:
+                self.uses_var = True
+                return "x"
+            return self.param(node)
+
+        if isinstance(node, UnaryOpNode) and node.op_tok.type == TT_MINUS:
+            operand = self.emit(node.node)
+            return operand and f"({operand} * -1)"
+
+        if isinstance(node, BinOpNode):
+            op_type = node.op_tok.type
+            if op_type in ARITHMETIC_OPS:
+                template = "({} " + ARITHMETIC_OPS[op_type] + " {})"
+                if op_type == TT_POW:
+                    self.vectorizable = False
+            elif op_type in COMPARISON_OPS:
+                template = "int({} " + COMPARISON_OPS[op_type] + " {})"
+                self.vectorizable = False
+            else:
+                return None
+
+            left = self.emit(node.left_node)
+            right = left and self.emit(node.right_node)
+            return right and template.format(left, right)
+
+        return None
+
+
+def compile_kernel(node, var_name):
+    if not isinstance(node, (BinOpNode, UnaryOpNode, CacheScopeNode)):
+        return None
+
+    compiler = KernelCompiler(var_name)
+    expr = compiler.emit(node)
+    if expr is None:
+        return None
+    return Kernel(expr, compiler.params, compiler.vectorizable and compiler.uses_var)
@@ -1,8 +1,14 @@
 from .constants import *
+import sys
 import codecs
 from .errors import Position, IllegalCharError, InvalidSyntaxError
 
 
+IDENTIFIER_CHARS = frozenset(LETTERS_DIGITS + "_")
+KEYWORD_SET = frozenset(KEYWORDS)
+INTERN_MAX_LENGTH = 40
+
+
 def decode_escapes(s):
     try:
         return codecs.decode(s, "unicode_escape")
@@ -33,24 +39,28 @@ class Token:
 
 
 class Lexer:
-    def __init__(self, fn, text):
+    def __init__(self, fn, text, pos_start=None, end_idx=None):
         self.fn = fn
         self.text = text
-        self.pos = Position(-1, 0, -1, fn, text)
+        self.end_idx = len(text) if end_idx is None else end_idx
         self.current_char = None
-        self.advance()
+
+        if pos_start:
+            self.pos = pos_start.copy()
+            self.current_char = self.char_at(self.pos.idx)
+        else:
+            self.pos = Position(-1, 0, -1, fn, text)
+            self.advance()
+
+    def char_at(self, idx):
+        return self.text[idx] if idx < self.end_idx else None
 
     def advance(self):
         self.pos.advance(self.current_char)
-        self.current_char = (
-            self.text[self.pos.idx] if self.pos.idx < len(self.text) else None
-        )
+        self.current_char = self.char_at(self.pos.idx)
 
     def peek(self):
-        peek_pos = self.pos.idx + 1
-        if peek_pos < len(self.text):
-            return self.text[peek_pos]
-        return None
+        return self.char_at(self.pos.idx + 1)
 
     def skip_comment(self):
         self.advance()
@@ -61,63 +71,71 @@ class Lexer:
     def make_tokens(self):
         tokens = []
 
+        while True:
+            tok, error = self.make_token()
+            if error:
+                return [], error
+
+            tokens.append(tok)
+            if tok.type == TT_EOF:
+                return tokens, None
+
+    def make_token(self):
         while self.current_char != None:
             if self.current_char in " \t\r\n":
                 self.advance()
             elif self.current_char == "#":
                 self.skip_comment()
             elif self.current_char in DIGITS:
-                tokens.append(self.make_number())
+                return self.make_number(), None
             elif self.current_char in LETTERS + "_":
-                tokens.append(self.make_identifier())
+                return self.make_identifier(), None
             elif self.current_char == '"':
-                tokens.append(self.make_string())
+                return self.make_string(), None
 
             elif self.current_char == "+":
                 pos_start = self.pos.copy()
                 self.advance()
                 if self.current_char == "+":
-                    tokens.append(
-                        Token(TT_PLUSPLUS, pos_start=pos_start, pos_end=self.pos)
-                    )
+                    tok = Token(TT_PLUSPLUS, pos_start=pos_start, pos_end=self.pos)
                     self.advance()
+                    return tok, None
                 elif self.current_char == "=":
-                    tokens.append(
-                        Token(TT_PLUSEQ, pos_start=pos_start, pos_end=self.pos)
-                    )
+                    tok = Token(TT_PLUSEQ, pos_start=pos_start, pos_end=self.pos)
                     self.advance()
+                    return tok, None
                 else:
-                    tokens.append(Token(TT_PLUS, pos_start=pos_start))
+                    return Token(TT_PLUS, pos_start=pos_start), None
 
             elif self.current_char == "-":
                 pos_start = self.pos.copy()
                 self.advance()
                 if self.current_char == "-":
-                    tokens.append(
-                        Token(TT_MINUSMINUS, pos_start=pos_start, pos_end=self.pos)
+                    tok = Token(
+                        TT_MINUSMINUS, pos_start=pos_start, pos_end=self.pos
                     )
                     self.advance()
+                    return tok, None
                 elif self.current_char == "=":
-                    tokens.append(
-                        Token(TT_MINUSEQ, pos_start=pos_start, pos_end=self.pos)
-                    )
+                    tok = Token(TT_MINUSEQ, pos_start=pos_start, pos_end=self.pos)
                     self.advance()
+                    return tok, None
                 else:
-                    tokens.append(Token(TT_MINUS, pos_start=pos_start))
+                    return Token(TT_MINUS, pos_start=pos_start), None
 
             elif self.current_char == "*":
                 pos_start = self.pos.copy()
                 self.advance()
                 if self.current_char == "*":
-                    tokens.append(Token(TT_POW, pos_start=pos_start, pos_end=self.pos))
+                    tok = Token(TT_POW, pos_start=pos_start, pos_end=self.pos)
                     self.advance()
+                    return tok, None
                 elif self.current_char == "=":
-                    tokens.append(
-                        Token(TT_MULEQ, pos_start=pos_start, pos_end=self.pos)
-                    )
+                    tok = Token(TT_MULEQ, pos_start=pos_start, pos_end=self.pos)
                     self.advance()
+                    return tok, None
                 else:
-                    tokens.append(Token(TT_MUL, pos_start=pos_start))
+                    return Token(TT_MUL, pos_start=pos_start), None
 
             elif self.current_char == "/":
                 pos_start = self.pos.copy()
@@ -125,92 +143,96 @@ class Lexer:
                 if self.current_char == "/":
                     self.advance()
                     if self.current_char == "=":
-                        tokens.append(
-                            Token(TT_FLOORDIVEQ, pos_start=pos_start, pos_end=self.pos)
+                        tok = Token(
+                            TT_FLOORDIVEQ, pos_start=pos_start, pos_end=self.pos
                         )
                         self.advance()
+                        return tok, None
                     else:
-                        tokens.append(
-                            Token(TT_FLOORDIV, pos_start=pos_start, pos_end=self.pos)
+                        return (
+                            Token(TT_FLOORDIV, pos_start=pos_start, pos_end=self.pos),
+                            None,
                         )
                 elif self.current_char == "=":
-                    tokens.append(
-                        Token(TT_DIVEQ, pos_start=pos_start, pos_end=self.pos)
-                    )
+                    tok = Token(TT_DIVEQ, pos_start=pos_start, pos_end=self.pos)
                     self.advance()
+                    return tok, None
                 else:
-                    tokens.append(Token(TT_DIV, pos_start=pos_start))
+                    return Token(TT_DIV, pos_start=pos_start), None
 
             elif self.current_char == "%":
                 pos_start = self.pos.copy()
                 self.advance()
                 if self.current_char == "=":
-                    tokens.append(
-                        Token(TT_MODEQ, pos_start=pos_start, pos_end=self.pos)
-                    )
+                    tok = Token(TT_MODEQ, pos_start=pos_start, pos_end=self.pos)
                     self.advance()
+                    return tok, None
                 else:
-                    tokens.append(Token(TT_MOD, pos_start=pos_start))
+                    return Token(TT_MOD, pos_start=pos_start), None
 
             elif self.current_char == "^":
                 pos_start = self.pos.copy()
                 self.advance()
                 if self.current_char == "=":
-                    tokens.append(
-                        Token(TT_POWEQ, pos_start=pos_start, pos_end=self.pos)
-                    )
+                    tok = Token(TT_POWEQ, pos_start=pos_start, pos_end=self.pos)
                     self.advance()
+                    return tok, None
                 else:
-                    tokens.append(Token(TT_POW, pos_start=pos_start))
+                    return Token(TT_POW, pos_start=pos_start), None
 
             elif self.current_char == "(":
-                tokens.append(Token(TT_LPAREN, pos_start=self.pos))
+                tok = Token(TT_LPAREN, pos_start=self.pos)
                 self.advance()
+                return tok, None
             elif self.current_char == ")":
-                tokens.append(Token(TT_RPAREN, pos_start=self.pos))
+                tok = Token(TT_RPAREN, pos_start=self.pos)
                 self.advance()
+                return tok, None
             elif self.current_char == ",":
-                tokens.append(Token(TT_COMMA, pos_start=self.pos))
+                tok = Token(TT_COMMA, pos_start=self.pos)
                 self.advance()
+                return tok, None
             elif self.current_char == ".":
-                tokens.append(Token(TT_DOT, pos_start=self.pos))
+                tok = Token(TT_DOT, pos_start=self.pos)
                 self.advance()
+                return tok, None
             elif self.current_char == "[":
-                tokens.append(Token(TT_LSQUARE, pos_start=self.pos))
+                tok = Token(TT_LSQUARE, pos_start=self.pos)
                 self.advance()
+                return tok, None
             elif self.current_char == "]":
-                tokens.append(Token(TT_RSQUARE, pos_start=self.pos))
+                tok = Token(TT_RSQUARE, pos_start=self.pos)
                 self.advance()
+                return tok, None
             elif self.current_char == "!":
-                tok, error = self.make_not_equals()
-                if error:
-                    return [], error
-                tokens.append(tok)
+                return self.make_not_equals()
             elif self.current_char == "=":
-                tokens.append(self.make_equals())
+                return self.make_equals(), None
             elif self.current_char == "`":
-                tokens += self.make_template_string()
+                return self.make_template_string()
             elif self.current_char == "<":
-                tokens.append(self.make_less_than())
+                return self.make_less_than(), None
             elif self.current_char == ">":
-                tokens.append(self.make_greater_than())
+                return self.make_greater_than(), None
             elif self.current_char == "{":
-                tokens.append(Token(TT_LBRACE, pos_start=self.pos))
+                tok = Token(TT_LBRACE, pos_start=self.pos)
                 self.advance()
+                return tok, None
             elif self.current_char == "}":
-                tokens.append(Token(TT_RBRACE, pos_start=self.pos))
+                tok = Token(TT_RBRACE, pos_start=self.pos)
                 self.advance()
+                return tok, None
             elif self.current_char == ":":
-                tokens.append(Token(TT_COLON, pos_start=self.pos))
+                tok = Token(TT_COLON, pos_start=self.pos)
                 self.advance()
+                return tok, None
             else:
                 pos_start = self.pos.copy()
                 char = self.current_char
                 self.advance()
-                return [], IllegalCharError(pos_start, self.pos, "'" + char + "'")
+                return None, IllegalCharError(pos_start, self.pos, "'" + char + "'")
 
-        tokens.append(Token(TT_EOF, pos_start=self.pos))
-        return tokens, None
+        return Token(TT_EOF, pos_start=self.pos), None
 
     def make_number(self):
         num_str = ""
@@ -257,14 +279,13 @@ class Lexer:
         return Token(TT_STRING, string_content, self.pos_start, self.pos)
 
     def make_identifier(self):
-        id_str = ""
         pos_start = self.pos.copy()
 
-        while self.current_char != None and self.current_char in LETTERS_DIGITS + "_":
-            id_str += self.current_char
+        while self.current_char != None and self.current_char in IDENTIFIER_CHARS:
             self.advance()
 
-        tok_type = TT_KEYWORD if id_str in KEYWORDS else TT_IDENTIFIER
+        id_str = sys.intern(self.text[pos_start.idx : self.pos.idx])
+        tok_type = TT_KEYWORD if id_str in KEYWORD_SET else TT_IDENTIFIER
         return Token(tok_type, id_str, pos_start, self.pos)
 
     def make_not_equals(self):
@@ -290,63 +311,49 @@ class Lexer:
         return Token(tok_type, pos_start=pos_start, pos_end=self.pos)
 
     def make_template_string(self):
-        tokens = []
+        parts = []
         pos_start = self.pos.copy()
         self.advance()
 
-        tokens.append(Token(TT_LPAREN, pos_start=pos_start))
-
         string_part = ""
 
         while self.current_char != None and self.current_char != "`":
             if self.current_char == "$" and self.peek() == "{":
-                tokens.append(Token(TT_STRING, string_part, pos_start=pos_start))
+                if string_part:
+                    parts.append(string_part)
                 string_part = ""
 
-                tokens.append(Token(TT_PLUS, pos_start=self.pos))
-
-                tokens.append(Token(TT_IDENTIFIER, "TEXT", pos_start=self.pos))
-                tokens.append(Token(TT_LPAREN, pos_start=self.pos))
-
                 self.advance()
                 self.advance()
 
-                expr_str = ""
+                expr_start = self.pos.copy()
                 brace_count = 1
-                while self.current_char != None and brace_count > 0:
+                while self.current_char != None:
                     if self.current_char == "{":
                         brace_count += 1
                     elif self.current_char == "}":
                         brace_count -= 1
+                        if brace_count == 0:
+                            break
+                    self.advance()
 
-                    if brace_count > 0:
-                        expr_str += self.current_char
-                        self.advance()
-
-                sub_lexer = Lexer(self.fn, expr_str)
+                sub_lexer = Lexer(self.fn, self.text, expr_start, self.pos.idx)
                 sub_tokens, error = sub_lexer.make_tokens()
+                if error:
+                    return None, error
 
-                if sub_tokens and sub_tokens[-1].type == TT_EOF:
-                    sub_tokens.pop()
-
-                tokens.extend(sub_tokens)
-
-                tokens.append(Token(TT_RPAREN, pos_start=self.pos))
-
-                tokens.append(Token(TT_PLUS, pos_start=self.pos))
-
+                parts.append(sub_tokens)
                 self.advance()
 
             else:
                 string_part += self.current_char
                 self.advance()
 
-        tokens.append(Token(TT_STRING, string_part, pos_start=pos_start))
-
-        tokens.append(Token(TT_RPAREN, pos_start=self.pos))
+        if string_part:
+            parts.append(string_part)
 
         self.advance()
-        return tokens
+        return Token(TT_TEMPLATE, parts, pos_start, self.pos), None
 
     def make_string(self):
         string = ""
@@ -397,6 +404,10 @@ class Lexer:
             self.advance()
 
         self.advance()
+
+        if len(string) <= INTERN_MAX_LENGTH:
+            string = sys.intern(string)
+
         return Token(TT_STRING, string, pos_start, self.pos)
 
     def make_less_than(self):
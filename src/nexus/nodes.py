@@ -28,6 +28,13 @@ class StringNode:
         return f"{self.tok}"
 
 
+class TemplateNode:
+    def __init__(self, parts, pos_start, pos_end):
+        self.parts = parts
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+
 class ListNode:
     def __init__(self, element_nodes, pos_start, pos_end):
         self.element_nodes = element_nodes
@@ -35,9 +42,20 @@ class ListNode:
         self.pos_end = pos_end
 
 
+class TupleNode:
+    def __init__(self, element_nodes, pos_start, pos_end):
+        self.element_nodes = element_nodes
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+
 class VarAccessNode:
     def __init__(self, var_name_tok):
         self.var_name_tok = var_name_tok
+        self.global_site = False
+        self.cached_root = None
+        self.cached_version = None
+        self.cached_value = None
         self.pos_start = self.var_name_tok.pos_start
         self.pos_end = self.var_name_tok.pos_end
 
@@ -51,6 +69,19 @@ class VarAssignNode:
 
 
 class BinOpNode:
+    def __init__(self, left_node, op_tok, right_node):
+        self.left_node = left_node
+        self.op_tok = op_tok
+        self.right_node = right_node
+        self.number_op = None
+        self.pos_start = self.left_node.pos_start
+        self.pos_end = self.right_node.pos_end
+
+    def __repr__(self):
+        return f"({self.left_node}, {self.op_tok}, {self.right_node})"
+
+
+class LogicalOpNode:
     def __init__(self, left_node, op_tok, right_node):
         self.left_node = left_node
         self.op_tok = op_tok
@@ -98,6 +129,10 @@ class FunDefNode:
         self.var_name_tok = var_name_tok
         self.arg_name_toks = arg_name_toks
         self.body_node = body_node
+        self.frames = None
+        self.captures = None
+        self.generator = False
+        self.specialized = None
 
         if self.var_name_tok:
             self.pos_start = self.var_name_tok.pos_start
@@ -109,6 +144,16 @@ class FunDefNode:
         self.pos_end = self.body_node.pos_end
 
 
+class LazyBodyNode:
+    def __init__(self, tokens, pos_start, pos_end):
+        self.tokens = tokens
+        self.body = None
+        self.optimizer = None
+        self.captures = None
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+
 class CallNode:
     def __init__(self, node_to_call, arg_nodes):
         self.node_to_call = node_to_call
@@ -128,6 +173,13 @@ class ReturnNode:
         self.pos_end = pos_end
 
 
+class ProduceNode:
+    def __init__(self, node_to_produce, pos_start, pos_end):
+        self.node_to_produce = node_to_produce
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+
 class ClassNode:
     def __init__(self, class_name_tok, superclass_node, method_nodes):
         self.class_name_tok = class_name_tok
@@ -172,10 +224,45 @@ class SetAttrNode:
         self.pos_end = value_node.pos_end
 
 
+class VarAugAssignNode:
+    def __init__(self, var_name_tok, op_tok, value_node):
+        self.var_name_tok = var_name_tok
+        self.op_tok = op_tok
+        self.value_node = value_node
+
+        self.pos_start = var_name_tok.pos_start
+        self.pos_end = value_node.pos_end
+
+
+class AttrAugAssignNode:
+    def __init__(self, object_node, attr_name_tok, op_tok, value_node):
+        self.object_node = object_node
+        self.attr_name_tok = attr_name_tok
+        self.op_tok = op_tok
+        self.value_node = value_node
+
+        self.pos_start = object_node.pos_start
+        self.pos_end = value_node.pos_end
+
+
+class ListAugAssignNode:
+    def __init__(self, list_node, index_node, op_tok, value_node):
+        self.list_node = list_node
+        self.index_node = index_node
+        self.op_tok = op_tok
+        self.value_node = value_node
+
+        self.pos_start = list_node.pos_start
+        self.pos_end = value_node.pos_end
+
+
 class WhileNode:
     def __init__(self, condition_node, body_node):
         self.condition_node = condition_node
         self.body_node = body_node
+        self.cached_nodes = []
+        self.back_edges = 0
+        self.trace = None
 
         self.pos_start = self.condition_node.pos_start
         self.pos_end = self.body_node.pos_end
@@ -217,6 +304,9 @@ class ForNode:
         self.var_name_tok = var_name_tok
         self.iterable_node = iterable_node
         self.body_node = body_node
+        self.cached_nodes = []
+        self.back_edges = 0
+        self.trace = None
 
         self.pos_start = self.var_name_tok.pos_start
         self.pos_end = self.body_node.pos_end
@@ -249,12 +339,29 @@ class MultiVarAssignNode:
 
 
 class ListCompNode:
-    def __init__(self, output_expr_node, var_name_tok, iterable_node):
+    def __init__(
+        self, output_expr_node, var_name_tok, iterable_node, condition_node=None
+    ):
         self.output_expr_node = output_expr_node
         self.var_name_tok = var_name_tok
         self.iterable_node = iterable_node
+        self.condition_node = condition_node
+        self.cached_nodes = []
+        self.kernel = None
         self.pos_start = output_expr_node.pos_start
-        self.pos_end = iterable_node.pos_end
+        self.pos_end = (condition_node or iterable_node).pos_end
+
+
+class LazyCompNode:
+    def __init__(
+        self, output_expr_node, var_name_tok, iterable_node, condition_node=None
+    ):
+        self.output_expr_node = output_expr_node
+        self.var_name_tok = var_name_tok
+        self.iterable_node = iterable_node
+        self.condition_node = condition_node
+        self.pos_start = output_expr_node.pos_start
+        self.pos_end = (condition_node or iterable_node).pos_end
 
 
 class SliceAccessNode:
@@ -304,6 +411,8 @@ class SwitchNode:
         self.switch_value_node = switch_value_node
         self.cases = cases
         self.default_case = default_case
+        self.jump_table = None
+        self.jump_kind = None
         self.pos_start = switch_value_node.pos_start
 
         if default_case:
@@ -312,3 +421,60 @@ class SwitchNode:
             self.pos_end = cases[-1][1].pos_end
         else:
             self.pos_end = switch_value_node.pos_end
+
+
+class CachedExprNode:
+    def __init__(self, expr_node):
+        self.expr_node = expr_node
+        self.pos_start = expr_node.pos_start
+        self.pos_end = expr_node.pos_end
+
+    def __repr__(self):
+        return f"<{self.expr_node}>"
+
+
+class CacheScopeNode:
+    def __init__(self, node, cached_nodes):
+        self.node = node
+        self.cached_nodes = cached_nodes
+        self.pos_start = node.pos_start
+        self.pos_end = node.pos_end
+
+
+class InlinedCallNode:
+    def __init__(self, call_node, guard_body, template):
+        self.call_node = call_node
+        self.guard_body = guard_body
+        self.template = template
+        self.pos_start = call_node.pos_start
+        self.pos_end = call_node.pos_end
+
+
+class InlineArgNode:
+    def __init__(self, index, var_name_tok):
+        self.index = index
+        self.var_name_tok = var_name_tok
+        self.pos_start = var_name_tok.pos_start
+        self.pos_end = var_name_tok.pos_end
+
+
+class CountedLoopNode:
+    def __init__(self, loop, body_node, var_name_tok, inclusive, eager):
+        self.loop = loop
+        self.body_node = body_node
+        self.var_name_tok = var_name_tok
+        self.inclusive = inclusive
+        self.eager = eager
+        self.counters = []
+        self.back_edges = 0
+        self.trace = None
+        self.pos_start = loop.pos_start
+        self.pos_end = loop.pos_end
+
+
+class CounterNode:
+    def __init__(self, var_access, counters):
+        self.var_access = var_access
+        self.counters = counters
+        self.pos_start = var_access.pos_start
+        self.pos_end = var_access.pos_end
@@ -0,0 +1,517 @@
+import copy
+from collections import Counter
+
+from .analysis import *
+from .nodes import *
+from .constants import *
+from .values import BuiltInFunction, Number, String
+from .kernels import compile_kernel
+from .specializer import Specialization
+
+
+LOOP_FIELDS = {
+    WhileNode: ("condition_node", "body_node"),
+    ForNode: ("body_node",),
+    ListCompNode: ("condition_node", "output_expr_node"),
+}
+
+TRIVIAL_NODES = (NumberNode, StringNode, VarAccessNode, CachedExprNode)
+
+INLINE_NODE_LIMIT = 20
+
+INLINE_NODES = (
+    NumberNode,
+    StringNode,
+    VarAccessNode,
+    BinOpNode,
+    UnaryOpNode,
+    LogicalOpNode,
+    CallNode,
+    ListNode,
+    TupleNode,
+    DictNode,
+    ListAccessNode,
+    GetAttrNode,
+    SliceAccessNode,
+)
+
+
+class LoopInfo:
+    def __init__(self):
+        self.assigned = set()
+        self.calls = False
+        self.writes = False
+
+
+class Optimizer:
+    def __init__(self, global_scope=None):
+        self.global_scope = global_scope
+        self.bindings = Counter()
+        self.top_level = set()
+        self.updated = set()
+        self.candidates = {}
+        self.scoped = set()
+
+    def optimize(self, node):
+        self.bindings.update(iter_bindings(node, into_functions=True))
+        self.scoped |= scoped_names(node)
+
+        for current in walk(node):
+            if isinstance(current, FunDefNode):
+                self.updated |= updated_names(current.body_node)
+
+        self.candidates = self.find_inline_candidates(node)
+        return self.optimize_body(node)
+
+    def facts(self):
+        return (
+            frozenset(self.bindings),
+            frozenset(name for name, count in self.bindings.items() if count == 1),
+            frozenset(self.top_level),
+            frozenset(self.updated),
+            frozenset(self.scoped),
+        )
+
+    def optimize_body(self, node):
+        for current in walk(node):
+            if isinstance(current, LazyBodyNode):
+                current.optimizer = self
+
+        if self.candidates:
+            node = self.inline_calls(node, self.candidates)
+
+        node = self.transform(node)
+
+        for current in walk(node):
+            if isinstance(current, VarAccessNode):
+                current.global_site = current.var_name_tok.value not in self.scoped
+
+        return node
+
+    def transform(self, node):
+        if isinstance(node, CachedExprNode):
+            return node
+
+        if type(node) in LOOP_FIELDS:
+            self.hoist_loop(node)
+
+        if not isinstance(node, TRIVIAL_NODES) and self.is_pure(node):
+            return self.eliminate_common(node)
+
+        node = map_children(node, self.transform)
+
+        if isinstance(node, SwitchNode):
+            self.build_jump_table(node)
+        elif isinstance(node, ListCompNode) and node.condition_node is None:
+            node.kernel = compile_kernel(node.output_expr_node, node.var_name_tok.value)
+        elif isinstance(node, WhileNode):
+            node = self.count_loop(node)
+        elif isinstance(node, FunDefNode):
+            if defines_scope(node.body_node):
+                node.captures = captured_names(node.body_node)
+                if isinstance(node.body_node, LazyBodyNode):
+                    node.body_node.captures = node.captures
+            else:
+                node.frames = []
+
+            if not node.generator:
+                node.specialized = Specialization(
+                    [tok.value for tok in node.arg_name_toks], node.body_node
+                )
+
+        return node
+
+    def constant_label(self, node):
+        if isinstance(node, NumberNode):
+            return Number, node.tok.value
+        if isinstance(node, StringNode):
+            return String, node.tok.value
+        if (
+            isinstance(node, UnaryOpNode)
+            and node.op_tok.type == TT_MINUS
+            and isinstance(node.node, NumberNode)
+        ):
+            return Number, -node.node.tok.value
+        return None, None
+
+    def build_jump_table(self, node):
+        kinds = set()
+        jump_table = {}
+
+        for case_conditions, body_node in node.cases:
+            for cond_node in case_conditions:
+                kind, value = self.constant_label(cond_node)
+                if kind is None:
+                    return
+                kinds.add(kind)
+                jump_table.setdefault(value, body_node)
+
+        if len(kinds) == 1:
+            node.jump_table = jump_table
+            node.jump_kind = kinds.pop()
+
+    def is_pure_builtin(self, node):
+        if not isinstance(node, VarAccessNode):
+            return False
+
+        name = node.var_name_tok.value
+        if name not in PURE_BUILTINS or name in self.bindings:
+            return False
+
+        if self.global_scope is not None:
+            return isinstance(self.global_scope.get(name), BuiltInFunction)
+
+        return True
+
+    def is_pure(self, node):
+        if isinstance(node, TRIVIAL_NODES):
+            return True
+
+        if is_increment(node):
+            return False
+
+        if isinstance(node, CallNode):
+            return self.is_pure_builtin(node.node_to_call) and all(
+                self.is_pure(arg_node) for arg_node in node.arg_nodes
+            )
+
+        if isinstance(
+            node,
+            (
+                BinOpNode,
+                LogicalOpNode,
+                UnaryOpNode,
+                ListAccessNode,
+                GetAttrNode,
+                SliceAccessNode,
+                ListNode,
+                TupleNode,
+                DictNode,
+            ),
+        ):
+            return all(self.is_pure(child) for child in iter_children(node))
+
+        return False
+
+    def loop_info(self, loop):
+        info = LoopInfo()
+
+        if isinstance(loop, (ForNode, ListCompNode)):
+            info.assigned.add(loop.var_name_tok.value)
+
+        for field in LOOP_FIELDS[type(loop)]:
+            part = getattr(loop, field)
+            if part is None:
+                continue
+
+            info.assigned |= bound_names(part)
+
+            for current in walk(part, into_functions=False):
+                if isinstance(current, CallNode):
+                    if not self.is_pure_builtin(current.node_to_call):
+                        info.calls = True
+                elif isinstance(current, NewInstanceNode):
+                    info.calls = True
+                elif isinstance(
+                    current,
+                    (ListSetNode, SetAttrNode, ListAugAssignNode, AttrAugAssignNode),
+                ):
+                    info.writes = True
+                elif is_increment(current) and not isinstance(
+                    current.node, VarAccessNode
+                ):
+                    info.writes = True
+
+        if info.calls:
+            info.writes = True
+
+        return info
+
+    def is_invariant(self, node, info):
+        if isinstance(node, (NumberNode, StringNode, CachedExprNode)):
+            return True
+
+        if isinstance(node, VarAccessNode):
+            name = node.var_name_tok.value
+            if name in info.assigned:
+                return False
+            return not (info.calls and name in self.updated)
+
+        if isinstance(node, (ListAccessNode, GetAttrNode, SliceAccessNode)):
+            if info.writes:
+                return False
+        elif isinstance(node, CallNode):
+            if not self.is_pure_builtin(node.node_to_call):
+                return False
+        elif not isinstance(
+            node, (BinOpNode, LogicalOpNode, UnaryOpNode)
+        ) or is_increment(node):
+            return False
+
+        return all(self.is_invariant(child, info) for child in iter_children(node))
+
+    def hoist_loop(self, loop):
+        for field in LOOP_FIELDS[type(loop)]:
+            part = getattr(loop, field)
+            if part is not None and produces(part):
+                return
+
+        info = self.loop_info(loop)
+        hoisted = {}
+
+        def replace(node):
+            if is_scope(node) or isinstance(node, CachedExprNode):
+                return node
+
+            if self.constant_label(node)[0] is not None:
+                return node
+
+            if not isinstance(node, TRIVIAL_NODES) and self.is_invariant(node, info):
+                key = node_key(node)
+                if key is not None:
+                    if key not in hoisted:
+                        hoisted[key] = CachedExprNode(node)
+                        loop.cached_nodes.append(hoisted[key])
+                    return hoisted[key]
+
+            return map_children(node, replace)
+
+        for field in LOOP_FIELDS[type(loop)]:
+            part = getattr(loop, field)
+            if part is not None:
+                setattr(loop, field, replace(part))
+
+    def count_loop(self, loop):
+        condition = loop.condition_node
+        body = loop.body_node
+
+        if not (
+            isinstance(condition, BinOpNode)
+            and condition.op_tok.type in (TT_LT, TT_LTE)
+            and isinstance(condition.left_node, VarAccessNode)
+            and isinstance(body, StatementListNode)
+            and body.statement_nodes
+        ):
+            return loop
+
+        var_name_tok = condition.left_node.var_name_tok
+        increment = body.statement_nodes[-1]
+        if not (
+            is_increment(increment)
+            and increment.op_tok.type == TT_PLUSPLUS
+            and isinstance(increment.node, VarAccessNode)
+            and increment.node.var_name_tok.value == var_name_tok.value
+        ):
+            return loop
+
+        counted_body = StatementListNode(
+            body.statement_nodes[:-1], body.pos_start, body.pos_end
+        )
+        if (
+            produces(body)
+            or defines_scope(counted_body)
+            or var_name_tok.value in bound_names(counted_body)
+        ):
+            return loop
+
+        eager = False
+        for current in walk(counted_body):
+            if isinstance(current, ContinueNode):
+                return loop
+            if isinstance(current, LazyBodyNode) and current.body is None:
+                return loop
+            if isinstance(current, ListCompNode) and current.kernel is not None:
+                eager = True
+
+        info = self.loop_info(loop)
+        if not self.is_invariant(condition.right_node, info):
+            return loop
+        if info.calls and var_name_tok.value in self.updated:
+            return loop
+
+        node = CountedLoopNode(
+            loop,
+            counted_body,
+            var_name_tok,
+            condition.op_tok.type == TT_LTE,
+            eager or info.calls,
+        )
+        if node.eager:
+            return node
+
+        def replace(current):
+            if (
+                isinstance(current, VarAccessNode)
+                and current.var_name_tok.value == var_name_tok.value
+            ):
+                return CounterNode(current, node.counters)
+            if isinstance(current, CounterNode):
+                return current
+            return map_children(current, replace)
+
+        counted_body.statement_nodes = [
+            replace(statement) for statement in counted_body.statement_nodes
+        ]
+        return node
+
+    def eliminate_common(self, node):
+        counts = {}
+
+        for current in walk(node):
+            if current is node or isinstance(current, TRIVIAL_NODES):
+                continue
+            key = node_key(current)
+            if key is not None:
+                counts[key] = counts.get(key, 0) + 1
+
+        uses = {}
+
+        def count_uses(current):
+            for child in iter_children(current):
+                if isinstance(child, TRIVIAL_NODES):
+                    continue
+                key = node_key(child)
+                if key is not None and counts.get(key, 0) > 1:
+                    uses[key] = uses.get(key, 0) + 1
+                    if uses[key] > 1:
+                        continue
+                count_uses(child)
+
+        count_uses(node)
+
+        if not any(count > 1 for count in uses.values()):
+            return node
+
+        shared = {}
+        cached_nodes = []
+
+        def replace(current):
+            if isinstance(current, TRIVIAL_NODES):
+                return current
+
+            key = node_key(current)
+            if key is None or uses.get(key, 0) < 2:
+                return map_children(current, replace)
+
+            if key not in shared:
+                shared[key] = CachedExprNode(map_children(current, replace))
+                cached_nodes.append(shared[key])
+            return shared[key]
+
+        return CacheScopeNode(map_children(node, replace), cached_nodes)
+
+    def find_inline_candidates(self, program):
+        if not isinstance(program, StatementListNode):
+            return {}
+
+        definitions = []
+        for statement in program.statement_nodes:
+            if isinstance(statement, FunDefNode) and statement.var_name_tok:
+                definitions.append((statement.var_name_tok.value, statement))
+            elif isinstance(
+                statement, (VarAssignNode, FinalVarAssignNode)
+            ) and isinstance(statement.value_node, FunDefNode):
+                definitions.append((statement.var_name_tok.value, statement.value_node))
+
+        self.top_level.update(name for name, _ in definitions)
+
+        candidates = {}
+        for name, fun_def in definitions:
+            if self.bindings[name] != 1:
+                continue
+
+            template = self.inline_template(name, fun_def)
+            if template is not None:
+                candidates[name] = (fun_def, template)
+
+        resolved = set()
+        for name in list(candidates):
+            self.inline_nested(name, candidates, resolved, set())
+
+        return candidates
+
+    def inline_nested(self, name, candidates, resolved, active):
+        if name in resolved:
+            return
+
+        active.add(name)
+        fun_def, template = candidates[name]
+        nested = {}
+        for current in walk(template):
+            if isinstance(current, CallNode) and isinstance(
+                current.node_to_call, VarAccessNode
+            ):
+                callee = current.node_to_call.var_name_tok.value
+                if callee in candidates and callee not in active:
+                    self.inline_nested(callee, candidates, resolved, active)
+                    nested[callee] = candidates[callee]
+
+        if nested:
+            candidates[name] = (fun_def, self.inline_calls(template, nested))
+        active.discard(name)
+        resolved.add(name)
+
+    def is_stable_global(self, name):
+        if name in self.bindings:
+            return self.bindings[name] == 1 and name in self.top_level
+
+        if self.global_scope is not None:
+            return self.global_scope.get(name) is not None
+
+        return False
+
+    def inline_template(self, name, fun_def):
+        body = fun_def.body_node
+        if not isinstance(body, StatementListNode) or len(body.statement_nodes) != 1:
+            return None
+
+        statement = body.statement_nodes[0]
+        if not isinstance(statement, ReturnNode):
+            return None
+
+        params = [tok.value for tok in fun_def.arg_name_toks]
+        if len(set(params)) != len(params) or "EU" in params:
+            return None
+
+        expr = statement.node_to_return
+        expr_nodes = list(walk(expr))
+        if len(expr_nodes) > INLINE_NODE_LIMIT:
+            return None
+
+        for current in expr_nodes:
+            if type(current) not in INLINE_NODES or is_increment(current):
+                return None
+
+            if isinstance(current, VarAccessNode):
+                var_name = current.var_name_tok.value
+                if var_name == name:
+                    return None
+                if var_name not in params and not self.is_stable_global(var_name):
+                    return None
+
+        return self.substitute_params(expr, params)
+
+    def substitute_params(self, node, params):
+        if isinstance(node, VarAccessNode) and node.var_name_tok.value in params:
+            return InlineArgNode(params.index(node.var_name_tok.value), node.var_name_tok)
+
+        return map_children(
+            copy.copy(node), lambda child: self.substitute_params(child, params)
+        )
+
+    def inline_calls(self, node, candidates):
+        def replace(current):
+            current = map_children(current, replace)
+
+            if isinstance(current, CallNode) and isinstance(
+                current.node_to_call, VarAccessNode
+            ):
+                candidate = candidates.get(current.node_to_call.var_name_tok.value)
+                if candidate:
+                    fun_def, template = candidate
+                    if len(current.arg_nodes) == len(fun_def.arg_name_toks):
+                        return InlinedCallNode(current, fun_def.body_node, template)
+
+            return current
+
+        return replace(node)
@@ -0,0 +1,119 @@
+import gc
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from .constants import *
+from .lexer import Lexer
+from .parser import Parser
+from .nodes import StatementListNode
+
+
+MIN_CHUNK_SIZE = 16384
+
+BOUNDARY_PATTERN = re.compile(
+    r'(?P<skip>"""[\s\S]*?"""|"(?:\\.|[^"\\])*"|`[^`]*`|#[^\n]*)'
+    r"|(?P<unit>^(?:FUNCAO|CLASSE)\b)"
+    r'|(?P<open>["`])',
+    re.M,
+)
+
+
+def find_boundaries(text):
+    boundaries = []
+
+    for match in BOUNDARY_PATTERN.finditer(text):
+        if match.lastgroup == "unit":
+            boundaries.append(match.start())
+        elif match.lastgroup == "open":
+            return []
+
+    return boundaries
+
+
+def split_chunks(text, workers):
+    target = max(len(text) // (workers * 4), MIN_CHUNK_SIZE)
+    chunks = []
+    start = 0
+    line = 0
+
+    for boundary in find_boundaries(text):
+        if boundary - start >= target:
+            chunks.append((start, line, text[start:boundary]))
+            line += text.count("\n", start, boundary)
+            start = boundary
+
+    chunks.append((start, line, text[start:]))
+    return chunks
+
+
+def shift_tokens(tokens, idx_offset, ln_offset, shifted=None):
+    if shifted is None:
+        shifted = set()
+
+    for tok in tokens:
+        for pos in (tok.pos_start, tok.pos_end):
+            if id(pos) not in shifted:
+                shifted.add(id(pos))
+                pos.idx += idx_offset
+                pos.ln += ln_offset
+
+        if tok.type == TT_TEMPLATE:
+            for part in tok.value:
+                if isinstance(part, list):
+                    shift_tokens(part, idx_offset, ln_offset, shifted)
+
+
+def parse_chunk(fn, chunk, lazy_bodies):
+    gc.disable()
+    idx_offset, ln_offset, text = chunk
+
+    tokens, error = Lexer(fn, text).make_tokens()
+    if error:
+        return None, error
+
+    shift_tokens(tokens, idx_offset, ln_offset)
+
+    ast = Parser(tokens, lazy_bodies).parse()
+    if ast.error:
+        return None, ast.error
+
+    return ast.node, None
+
+
+def parse_parallel(fn, text, lazy_bodies=False, workers=None):
+    workers = workers or os.cpu_count() or 1
+    if workers < 2:
+        return None
+
+    chunks = split_chunks(text, workers)
+    if len(chunks) < 2:
+        return None
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(
+                pool.map(
+                    parse_chunk,
+                    [fn] * len(chunks),
+                    chunks,
+                    [lazy_bodies] * len(chunks),
+                )
+            )
+    except Exception:
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    statements = []
+    for node, error in results:
+        if error:
+            return None
+        statements.extend(node.statement_nodes)
+
+    return StatementListNode(
+        statements, results[0][0].pos_start, results[-1][0].pos_end
+    )
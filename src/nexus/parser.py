@@ -29,9 +29,14 @@ class ParseResult:
         return self
 
 
+LAZY_BODY_MIN_TOKENS = 32
+
+
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, lazy_bodies=False):
         self.tokens = tokens
+        self.lazy_bodies = lazy_bodies
+        self.produced = False
         self.tok_idx = -1
         self.advance()
 
@@ -47,22 +52,7 @@ class Parser:
         pos_start = self.current_tok.pos_start.copy()
 
         while self.current_tok.type != TT_EOF:
-            if self.current_tok.type == TT_KEYWORD and self.current_tok.value in (
-                "FIMFUNCAO",
-                "FIMSE",
-                "FIMCLASSE",
-                "FIMENQUANTO",
-                "FOR",
-            ):
-                return res.failure(
-                    InvalidSyntaxError(
-                        self.current_tok.pos_start,
-                        self.current_tok.pos_end,
-                        f"Inesperado '{self.current_tok.value}'",
-                    )
-                )
-
-            statement = res.register(self.statement())
+            statement = res.register(self.top_level_statement())
             if res.error:
                 return res
             statements.append(statement)
@@ -71,6 +61,24 @@ class Parser:
             StatementListNode(statements, pos_start, self.current_tok.pos_start.copy())
         )
 
+    def top_level_statement(self):
+        if self.current_tok.type == TT_KEYWORD and self.current_tok.value in (
+            "FIMFUNCAO",
+            "FIMSE",
+            "FIMCLASSE",
+            "FIMENQUANTO",
+            "FIMPARA",
+        ):
+            return ParseResult().failure(
+                InvalidSyntaxError(
+                    self.current_tok.pos_start,
+                    self.current_tok.pos_end,
+                    f"Inesperado '{self.current_tok.value}'",
+                )
+            )
+
+        return self.statement()
+
     def statement_list(self, end_keywords):
         res = ParseResult()
         statements = []
@@ -380,6 +388,18 @@ class Parser:
 
             return res.success(ReturnNode(expr, pos_start, expr.pos_end))
 
+        if self.current_tok.matches(TT_KEYWORD, "PRODUZIR"):
+            res.register_advancement()
+            self.advance()
+            pos_start = self.current_tok.pos_start.copy()
+
+            expr = res.register(self.expr())
+            if res.error:
+                return res
+
+            self.produced = True
+            return res.success(ProduceNode(expr, pos_start, expr.pos_end))
+
         if self.current_tok.matches(TT_KEYWORD, "FUNCAO"):
             return self.fun_def()
 
@@ -455,11 +475,11 @@ class Parser:
         if res.error:
             return res
 
-        body_node = res.register(self.statement_list(("FOR",)))
+        body_node = res.register(self.statement_list(("FIMPARA",)))
         if res.error:
             return res
 
-        if not self.current_tok.matches(TT_KEYWORD, "FOR"):
+        if not self.current_tok.matches(TT_KEYWORD, "FIMPARA"):
             return res.failure(
                 InvalidSyntaxError(
                     self.current_tok.pos_start,
@@ -522,6 +542,7 @@ class Parser:
                     (TT_KEYWORD, "e"),
                     (TT_KEYWORD, "ou"),
                 ),
+                node_class=LogicalOpNode,
             )
         )
 
@@ -546,7 +567,18 @@ class Parser:
             if res.error:
                 return res
 
-            if op_tok.type != TT_EQ:
+            if op_tok.type == TT_EQ:
+                if isinstance(node, VarAccessNode):
+                    return res.success(VarAssignNode(node.var_name_tok, expr))
+                elif isinstance(node, GetAttrNode):
+                    return res.success(
+                        SetAttrNode(node.object_node, node.attr_name_tok, expr)
+                    )
+                elif isinstance(node, ListAccessNode):
+                    return res.success(
+                        ListSetNode(node.list_node, node.index_node, expr)
+                    )
+            else:
                 bin_op_type = None
                 if op_tok.type == TT_PLUSEQ:
                     bin_op_type = TT_PLUS
@@ -563,24 +595,30 @@ class Parser:
                 elif op_tok.type == TT_FLOORDIVEQ:
                     bin_op_type = TT_FLOORDIV
 
-                expr = BinOpNode(
-                    node, Token(bin_op_type, pos_start=op_tok.pos_start), expr
-                )
+                bin_op_tok = Token(bin_op_type, pos_start=op_tok.pos_start)
 
-            if isinstance(node, VarAccessNode):
-                return res.success(VarAssignNode(node.var_name_tok, expr))
-            elif isinstance(node, GetAttrNode):
-                return res.success(
-                    SetAttrNode(node.object_node, node.attr_name_tok, expr)
-                )
-            elif isinstance(node, ListAccessNode):
-                return res.success(ListSetNode(node.list_node, node.index_node, expr))
-            else:
-                return res.failure(
-                    InvalidSyntaxError(
-                        node.pos_start, node.pos_end, "Invalid assignment target"
+                if isinstance(node, VarAccessNode):
+                    return res.success(
+                        VarAugAssignNode(node.var_name_tok, bin_op_tok, expr)
+                    )
+                elif isinstance(node, GetAttrNode):
+                    return res.success(
+                        AttrAugAssignNode(
+                            node.object_node, node.attr_name_tok, bin_op_tok, expr
+                        )
                     )
+                elif isinstance(node, ListAccessNode):
+                    return res.success(
+                        ListAugAssignNode(
+                            node.list_node, node.index_node, bin_op_tok, expr
+                        )
+                    )
+
+            return res.failure(
+                InvalidSyntaxError(
+                    node.pos_start, node.pos_end, "Invalid assignment target"
                 )
+            )
 
         return res.success(node)
 
@@ -636,7 +674,7 @@ class Parser:
                 TT_KEYWORD, "e", pos_start=op_tok.pos_start, pos_end=op_tok.pos_end
             )
 
-            result_node = BinOpNode(result_node, and_tok, next_comp)
+            result_node = LogicalOpNode(result_node, and_tok, next_comp)
             prev_right = right_expr
 
         return res.success(result_node)
@@ -823,6 +861,9 @@ class Parser:
             self.advance()
             return res.success(StringNode(tok))
 
+        elif tok.type == TT_TEMPLATE:
+            return self.template_expr()
+
         elif tok.type == TT_IDENTIFIER:
             res.register_advancement()
             self.advance()
@@ -839,6 +880,19 @@ class Parser:
             expr = res.register(self.expr())
             if res.error:
                 return res
+
+            if self.current_tok.matches(TT_KEYWORD, "PARA"):
+                clause = res.register(self.comp_clause(TT_RPAREN, "Esperava-se ')'"))
+                if res.error:
+                    return res
+                return res.success(LazyCompNode(expr, *clause))
+
+            if self.current_tok.type == TT_COMMA:
+                tuple_node = res.register(self.tuple_expr(tok.pos_start.copy(), expr))
+                if res.error:
+                    return res
+                return res.success(tuple_node)
+
             if self.current_tok.type == TT_RPAREN:
                 res.register_advancement()
                 self.advance()
@@ -899,68 +953,58 @@ class Parser:
             return res
 
         if self.current_tok.matches(TT_KEYWORD, "PARA"):
-            res.register_advancement()
-            self.advance()
-
-            if self.current_tok.type != TT_IDENTIFIER:
-                return res.failure(
-                    InvalidSyntaxError(
-                        self.current_tok.pos_start,
-                        self.current_tok.pos_end,
-                        "Esperado um identificador",
-                    )
-                )
-
-            var_name = self.current_tok
-            res.register_advancement()
-            self.advance()
+            clause = res.register(self.comp_clause(TT_RSQUARE, "Esperava-se ']'"))
+            if res.error:
+                return res
+            return res.success(ListCompNode(first_expr, *clause))
 
-            if not self.current_tok.matches(TT_KEYWORD, "EM"):
-                return res.failure(
-                    InvalidSyntaxError(
-                        self.current_tok.pos_start,
-                        self.current_tok.pos_end,
-                        "Esperava-se 'EM'",
-                    )
-                )
+        element_nodes.append(first_expr)
 
+        while self.current_tok.type == TT_COMMA:
             res.register_advancement()
             self.advance()
 
-            iterable = res.register(self.expr())
+            element_nodes.append(res.register(self.expr()))
             if res.error:
                 return res
 
-            if self.current_tok.type != TT_RSQUARE:
-                return res.failure(
-                    InvalidSyntaxError(
-                        self.current_tok.pos_start,
-                        self.current_tok.pos_end,
-                        "Esperava-se ']'",
-                    )
+        if self.current_tok.type != TT_RSQUARE:
+            return res.failure(
+                InvalidSyntaxError(
+                    self.current_tok.pos_start,
+                    self.current_tok.pos_end,
+                    "Esperava-se ',' ou ']'",
                 )
+            )
 
-            res.register_advancement()
-            self.advance()
+        res.register_advancement()
+        self.advance()
 
-            return res.success(ListCompNode(first_expr, var_name, iterable))
+        return res.success(
+            ListNode(element_nodes, pos_start, self.current_tok.pos_start.copy())
+        )
 
-        element_nodes.append(first_expr)
+    def tuple_expr(self, pos_start, first_expr):
+        res = ParseResult()
+        element_nodes = [first_expr]
 
         while self.current_tok.type == TT_COMMA:
             res.register_advancement()
             self.advance()
 
+            if self.current_tok.type == TT_RPAREN:
+                break
+
             element_nodes.append(res.register(self.expr()))
             if res.error:
                 return res
 
-        if self.current_tok.type != TT_RSQUARE:
+        if self.current_tok.type != TT_RPAREN:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_tok.pos_start,
                     self.current_tok.pos_end,
-                    "Esperava-se ',' ou ']'",
+                    "Esperava-se ',' ou ')'",
                 )
             )
 
@@ -968,9 +1012,64 @@ class Parser:
         self.advance()
 
         return res.success(
-            ListNode(element_nodes, pos_start, self.current_tok.pos_start.copy())
+            TupleNode(element_nodes, pos_start, self.current_tok.pos_start.copy())
         )
 
+    def comp_clause(self, end_type, end_message):
+        res = ParseResult()
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type != TT_IDENTIFIER:
+            return res.failure(
+                InvalidSyntaxError(
+                    self.current_tok.pos_start,
+                    self.current_tok.pos_end,
+                    "Esperado um identificador",
+                )
+            )
+
+        var_name = self.current_tok
+        res.register_advancement()
+        self.advance()
+
+        if not self.current_tok.matches(TT_KEYWORD, "EM"):
+            return res.failure(
+                InvalidSyntaxError(
+                    self.current_tok.pos_start,
+                    self.current_tok.pos_end,
+                    "Esperava-se 'EM'",
+                )
+            )
+
+        res.register_advancement()
+        self.advance()
+
+        iterable = res.register(self.expr())
+        if res.error:
+            return res
+
+        condition = None
+        if self.current_tok.matches(TT_KEYWORD, "SE"):
+            res.register_advancement()
+            self.advance()
+
+            condition = res.register(self.expr())
+            if res.error:
+                return res
+
+        if self.current_tok.type != end_type:
+            return res.failure(
+                InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end, end_message
+                )
+            )
+
+        res.register_advancement()
+        self.advance()
+
+        return res.success((var_name, iterable, condition))
+
     def fun_def(self):
         res = ParseResult()
 
@@ -1062,7 +1161,18 @@ class Parser:
         res.register_advancement()
         self.advance()
 
-        body = res.register(self.statement_list(("FIMFUNCAO",)))
+        outer_produced = self.produced
+        self.produced = False
+
+        body = None
+        if self.lazy_bodies:
+            body = res.register(self.lazy_body())
+
+        if body is None:
+            body = res.register(self.statement_list(("FIMFUNCAO",)))
+
+        generator = self.produced
+        self.produced = outer_produced
 
         if res.error:
             return res
@@ -1079,7 +1189,42 @@ class Parser:
         res.register_advancement()
         self.advance()
 
-        return res.success(FunDefNode(var_name_tok, arg_name_toks, body))
+        node = FunDefNode(var_name_tok, arg_name_toks, body)
+        node.generator = generator
+        return res.success(node)
+
+    def lazy_body(self):
+        res = ParseResult()
+        depth = 0
+        end_idx = self.tok_idx
+
+        while self.tokens[end_idx].type != TT_EOF:
+            tok = self.tokens[end_idx]
+            if tok.matches(TT_KEYWORD, "FUNCAO"):
+                depth += 1
+            elif tok.matches(TT_KEYWORD, "FIMFUNCAO"):
+                if depth == 0:
+                    break
+                depth -= 1
+            elif depth == 0 and tok.matches(TT_KEYWORD, "PRODUZIR"):
+                self.produced = True
+            end_idx += 1
+
+        end_tok = self.tokens[end_idx]
+        if end_tok.type == TT_EOF or end_idx - self.tok_idx < LAZY_BODY_MIN_TOKENS:
+            return res.success(None)
+
+        tokens = self.tokens[self.tok_idx : end_idx]
+        tokens.append(Token(TT_EOF, pos_start=end_tok.pos_start))
+        node = LazyBodyNode(
+            tokens, self.current_tok.pos_start.copy(), end_tok.pos_start.copy()
+        )
+
+        while self.tok_idx < end_idx:
+            res.register_advancement()
+            self.advance()
+
+        return res.success(node)
 
     def class_def(self):
         res = ParseResult()
@@ -1235,7 +1380,7 @@ class Parser:
 
         return res.success(NewInstanceNode(class_name_tok, arg_nodes))
 
-    def bin_op(self, func_a, ops, func_b=None):
+    def bin_op(self, func_a, ops, func_b=None, node_class=BinOpNode):
         if func_b == None:
             func_b = func_a
 
@@ -1254,10 +1399,45 @@ class Parser:
             right = res.register(func_b())
             if res.error:
                 return res
-            left = BinOpNode(left, op_tok, right)
+            left = node_class(left, op_tok, right)
 
         return res.success(left)
 
+    def template_expr(self):
+        res = ParseResult()
+        tok = self.current_tok
+        res.register_advancement()
+        self.advance()
+
+        parts = []
+        for part in tok.value:
+            if isinstance(part, str):
+                parts.append(part)
+                continue
+
+            parser = Parser(part)
+            expr_res = parser.expr()
+            if expr_res.error:
+                return res.failure(expr_res.error)
+
+            if parser.current_tok.type != TT_EOF:
+                return res.failure(
+                    InvalidSyntaxError(
+                        parser.current_tok.pos_start,
+                        parser.current_tok.pos_end,
+                        "Esperava-se '}'",
+                    )
+                )
+
+            parts.append(expr_res.node)
+
+        if all(isinstance(part, str) for part in parts):
+            return res.success(
+                StringNode(Token(TT_STRING, "".join(parts), tok.pos_start, tok.pos_end))
+            )
+
+        return res.success(TemplateNode(parts, tok.pos_start, tok.pos_end))
+
     def dict_expr(self):
         res = ParseResult()
         pos_start = self.current_tok.pos_start.copy()
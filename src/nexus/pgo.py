@@ -0,0 +1,154 @@
+import hashlib
+import json
+import operator
+from collections import Counter
+
+from .constants import *
+from .nodes import *
+from .analysis import walk
+from .interpreter import Interpreter
+
+
+PROFILE_VERSION = 1
+PROFILE_SUFFIX = ".perfil"
+
+OPERAND_FIELDS = {
+    BinOpNode: ("left_node", "right_node"),
+    CallNode: ("node_to_call",),
+    GetAttrNode: ("object_node",),
+}
+
+NUMBER_OPS = {
+    TT_PLUS: operator.add,
+    TT_MINUS: operator.sub,
+    TT_MUL: operator.mul,
+    TT_DIV: operator.truediv,
+    TT_MOD: operator.mod,
+    TT_FLOORDIV: operator.floordiv,
+    TT_POW: operator.pow,
+    TT_EE: lambda a, b: int(a == b),
+    TT_NE: lambda a, b: int(a != b),
+    TT_LT: lambda a, b: int(a < b),
+    TT_GT: lambda a, b: int(a > b),
+    TT_LTE: lambda a, b: int(a <= b),
+    TT_GTE: lambda a, b: int(a >= b),
+}
+
+
+def source_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def site_key(node):
+    return f"{type(node).__name__}@{node.pos_start.idx}:{node.pos_end.idx}"
+
+
+class Profile:
+    def __init__(self, source):
+        self.source = source
+        self.keys = {}
+        self.counts = Counter()
+        self.types = {}
+        self.operands = {}
+        self.branches = {}
+
+    def key(self, node):
+        key = self.keys.get(node)
+        if key is None:
+            key = self.keys[node] = site_key(node)
+        return key
+
+    def record(self, node, value):
+        key = self.key(node)
+        self.counts[key] += 1
+
+        if value is not None:
+            types = self.types.get(key)
+            if types is None:
+                types = self.types[key] = Counter()
+            types[type(value).__name__] += 1
+
+    def summarize(self, root):
+        for node in walk(root):
+            key = self.key(node)
+            if not self.counts[key]:
+                continue
+
+            fields = OPERAND_FIELDS.get(type(node))
+            if fields:
+                self.operands[key] = [
+                    dict(self.types.get(self.key(getattr(node, field)), {}))
+                    for field in fields
+                ]
+
+            if isinstance(node, IfNode):
+                bodies = [body for _, body in node.cases]
+                if node.else_case:
+                    bodies.append(node.else_case)
+                self.branches[key] = [self.counts[self.key(body)] for body in bodies]
+
+    def save(self, path, root):
+        self.summarize(root)
+
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "version": PROFILE_VERSION,
+                    "source": self.source,
+                    "counts": self.counts,
+                    "operands": self.operands,
+                    "branches": self.branches,
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, path, source):
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != PROFILE_VERSION or data.get("source") != source:
+            return None
+
+        profile = cls(source)
+        profile.counts.update(data["counts"])
+        profile.operands = data["operands"]
+        profile.branches = data["branches"]
+        return profile
+
+    def is_numeric(self, node):
+        operands = self.operands.get(self.key(node))
+        return bool(operands) and all(
+            set(histogram) == {"Number"} for histogram in operands
+        )
+
+    def apply(self, root, interpreter):
+        for node in walk(root):
+            if (
+                isinstance(node, LazyBodyNode)
+                and node.body is None
+                and self.counts[self.key(node)]
+            ):
+                interpreter.materialize(node)
+
+        for node in walk(root):
+            if isinstance(node, FunDefNode) and node.specialized is not None:
+                if self.counts[self.key(node)]:
+                    node.specialized.compile()
+            elif isinstance(node, BinOpNode) and node.op_tok.type in NUMBER_OPS:
+                if self.is_numeric(node):
+                    node.number_op = NUMBER_OPS[node.op_tok.type]
+
+
+class RecordingInterpreter(Interpreter):
+    def __init__(self, profile):
+        super().__init__()
+        self.profile = profile
+
+    def visit(self, node, context):
+        res = self.visit_methods[type(node)](self, node, context)
+        self.profile.record(node, res.value)
+        return res
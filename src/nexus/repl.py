@@ -0,0 +1,163 @@
+from .constants import *
+from .runtime import Context
+from .lexer import Lexer
+from .parser import Parser
+from .interpreter import Interpreter
+from .direct import DirectInterpreter
+from .optimizer import Optimizer
+from .nodes import *
+
+
+BLOCK_START_KEYWORDS = (
+    "FUNCAO",
+    "CLASSE",
+    "SE",
+    "ENQUANTO",
+    "PARA",
+    "TENTE",
+    "ESCOLHA",
+)
+
+BLOCK_END_KEYWORDS = (
+    "FIMFUNCAO",
+    "FIMCLASSE",
+    "FIMSE",
+    "FIMENQUANTO",
+    "FIMPARA",
+    "FIMTENTE",
+    "FIMESCOLHA",
+)
+
+OPEN_BRACKETS = (TT_LPAREN, TT_LSQUARE, TT_LBRACE)
+CLOSE_BRACKETS = (TT_RPAREN, TT_RSQUARE, TT_RBRACE)
+
+QUIET_NODES = (
+    VarAssignNode,
+    FinalVarAssignNode,
+    MultiVarAssignNode,
+    VarAugAssignNode,
+    FunDefNode,
+    ClassNode,
+)
+
+PROGRAM_CACHE_SIZE = 128
+
+
+class BlockTracker:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.depth = 0
+        self.brackets = 0
+        self.pending = ""
+        self.prev_tok = None
+        self.failed = False
+
+    def feed(self, line):
+        text = self.pending + line + "\n"
+        self.pending = ""
+
+        if self.failed:
+            return self.is_complete()
+
+        lexer = Lexer("<stdin>", text)
+        while True:
+            tok, error = lexer.make_token()
+            if error:
+                self.failed = True
+                break
+
+            if tok.type == TT_EOF:
+                break
+
+            if tok.type in (TT_STRING, TT_TEMPLATE) and tok.pos_end.idx > len(text):
+                self.pending = text[tok.pos_start.idx :]
+                break
+
+            self.track(tok)
+            self.prev_tok = tok
+
+        return self.is_complete()
+
+    def track(self, tok):
+        if tok.type in OPEN_BRACKETS:
+            self.brackets += 1
+        elif tok.type in CLOSE_BRACKETS:
+            self.brackets -= 1
+        elif tok.type != TT_KEYWORD or self.brackets > 0:
+            return
+        elif tok.value in BLOCK_END_KEYWORDS:
+            self.depth -= 1
+        elif tok.value in BLOCK_START_KEYWORDS:
+            if tok.value == "SE" and self.prev_tok and self.prev_tok.matches(
+                TT_KEYWORD, "SENAO"
+            ):
+                return
+            self.depth += 1
+
+    def is_complete(self):
+        if self.failed:
+            return True
+        return not self.pending and self.depth <= 0 and self.brackets <= 0
+
+
+class ReplSession:
+    def __init__(self, symbol_table, strict=False, direct=False):
+        self.context = Context("<repl>")
+        self.context.symbol_table = symbol_table
+        self.strict = strict
+        self.interpreter = DirectInterpreter() if direct else Interpreter()
+        self.optimizer = Optimizer(symbol_table)
+        self.programs = {}
+
+    def compile(self, text):
+        program = self.programs.get(text)
+        if program is not None:
+            return program, None
+
+        tokens, error = Lexer("<stdin>", text).make_tokens()
+        if error:
+            return None, error
+
+        ast = Parser(tokens, lazy_bodies=not self.strict).parse()
+        if ast.error:
+            return None, ast.error
+
+        facts = self.optimizer.facts()
+        program = self.optimizer.optimize(ast.node)
+
+        if self.optimizer.facts() != facts:
+            self.programs.clear()
+        elif len(self.programs) >= PROGRAM_CACHE_SIZE:
+            del self.programs[next(iter(self.programs))]
+        self.programs[text] = program
+
+        return program, None
+
+    def execute(self, text):
+        program, error = self.compile(text)
+        if error:
+            return None, error
+
+        result = self.interpreter.visit(program, self.context)
+
+        if result.should_return:
+            return result.return_value, result.error
+
+        return result.value, result.error
+
+    def is_quiet(self, text):
+        program = self.programs.get(text)
+        if program is None:
+            return False
+
+        if isinstance(program, StatementListNode):
+            if not program.statement_nodes:
+                return True
+            program = program.statement_nodes[-1]
+
+        while isinstance(program, CacheScopeNode):
+            program = program.node
+
+        return isinstance(program, QUIET_NODES)
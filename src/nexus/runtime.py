@@ -6,6 +6,8 @@ class SymbolTable:
         self.symbols = {}
         self.finals = []
         self.parent = parent
+        self.root = parent.root if parent else self
+        self.version = 0
 
     def get(self, name):
         value = self.symbols.get(name, None)
@@ -15,11 +17,13 @@ class SymbolTable:
 
     def set(self, name, value, as_final=False):
         self.symbols[name] = value
+        self.version += 1
         if as_final:
             self.finals.append(name)
 
     def remove(self, name):
         del self.symbols[name]
+        self.version += 1
         if name in self.finals:
             self.finals.remove(name)
 
@@ -29,6 +33,7 @@ class SymbolTable:
                 return f"Nao e possivel reatribuir a constante. '{name}'"
 
             self.symbols[name] = value
+            self.version += 1
             return None
 
         if self.parent:
@@ -43,6 +48,7 @@ class Context:
         self.parent = parent
         self.parent_entry_pos = parent_entry_pos
         self.symbol_table = None
+        self.expr_cache = None
 
 
 class RTResult:
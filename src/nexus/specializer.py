@@ -0,0 +1,268 @@
+from .constants import *
+from .nodes import *
+from .analysis import bound_names, is_increment
+from .kernels import ARITHMETIC_OPS, COMPARISON_OPS
+from .runtime import Context
+from .values import Function, Number
+
+
+MAX_DEOPTS = 8
+
+
+class Deoptimize(Exception):
+    pass
+
+
+def load(scope, name):
+    value = scope.get(name)
+    if type(value) is not Number:
+        raise Deoptimize
+    return value.value
+
+
+def call(scope, name, *args):
+    function = scope.get(name)
+    if type(function) is not Function or function.specialized is None:
+        raise Deoptimize
+
+    code = function.specialized.compile()
+    if code is None or len(args) != function.arity:
+        raise Deoptimize
+    return code(function.context.symbol_table, *args)
+
+
+HELPERS = {"Deoptimize": Deoptimize, "load": load, "call": call}
+
+
+class Specialization:
+    def __init__(self, arg_names, body_node):
+        self.arg_names = arg_names
+        self.body_node = body_node
+        self.compiled = False
+        self.code = None
+        self.deopts = 0
+
+    def compile(self):
+        if self.compiled:
+            return self.code
+
+        body = self.body_node
+        if isinstance(body, LazyBodyNode):
+            if body.body is None:
+                return None
+            body = body.body
+
+        self.compiled = True
+        self.code = NumericCompiler(self.arg_names).compile(body)
+        return self.code
+
+    def call(self, function, args, pos_start):
+        code = self.compile()
+        if code is None:
+            if self.compiled:
+                function.specialized = None
+            return None
+
+        for arg in args:
+            if type(arg) is not Number:
+                return None
+
+        try:
+            value = code(function.context.symbol_table, *[arg.value for arg in args])
+        except Exception:
+            self.deopts += 1
+            if self.deopts >= MAX_DEOPTS:
+                self.code = None
+            return None
+
+        return Number(value).set_context(
+            Context(function.name, function.context, pos_start)
+        )
+
+
+class NumericCompiler:
+    def __init__(self, arg_names):
+        self.arg_names = arg_names
+        self.locals = set(arg_names)
+        self.lines = []
+        self.loop_depth = 0
+        self.reason = None
+
+    def compile(self, body):
+        self.locals |= bound_names(body)
+        if not all(name.isidentifier() for name in self.locals):
+            return None
+
+        statements = list(body.statement_nodes)
+        tail = self.expr(statements[-1]) if statements else None
+        if tail is not None:
+            statements.pop()
+
+        params = "".join(f", v_{name}" for name in self.arg_names)
+        self.emit(0, f"def specialized(scope{params}):")
+        if not self.block(statements, 1):
+            return None
+        self.emit(1, f"return {tail}" if tail is not None else "raise Deoptimize")
+
+        namespace = dict(HELPERS)
+        exec("\n".join(self.lines), namespace)
+        return namespace["specialized"]
+
+    def emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+        return True
+
+    def reject(self, node):
+        if self.reason is None:
+            self.reason = f"{type(node).__name__} na linha {node.pos_start.ln + 1}"
+        return None
+
+    def block(self, statements, indent):
+        if not statements:
+            return self.emit(indent, "pass")
+        return all(self.statement(statement, indent) for statement in statements)
+
+    def statement(self, node, indent):
+        if isinstance(node, StatementListNode):
+            return self.block(node.statement_nodes, indent)
+
+        if isinstance(node, CacheScopeNode):
+            return self.statement(node.node, indent)
+
+        if isinstance(node, VarAssignNode):
+            value = self.expr(node.value_node)
+            name = node.var_name_tok.value
+            return value is not None and self.emit(indent, f"v_{name} = {value}")
+
+        if isinstance(node, VarAugAssignNode):
+            value = self.expr(node.value_node)
+            op = ARITHMETIC_OPS.get(node.op_tok.type)
+            name = node.var_name_tok.value
+            if op is None:
+                return self.reject(node)
+            return value is not None and self.emit(
+                indent, f"v_{name} = (v_{name} {op} {value})"
+            )
+
+        if is_increment(node):
+            if not isinstance(node.node, VarAccessNode):
+                return self.reject(node)
+            op = "+=" if node.op_tok.type == TT_PLUSPLUS else "-="
+            return self.emit(indent, f"v_{node.node.var_name_tok.value} {op} 1")
+
+        if isinstance(node, IfNode):
+            for i, (condition, body) in enumerate(node.cases):
+                condition = self.expr(condition)
+                if condition is None:
+                    return False
+                self.emit(indent, f"{'elif' if i else 'if'} {condition}:")
+                if not self.statement(body, indent + 1):
+                    return False
+
+            if node.else_case:
+                self.emit(indent, "else:")
+                return self.statement(node.else_case, indent + 1)
+            return True
+
+        if isinstance(node, CountedLoopNode):
+            return self.statement(node.loop, indent)
+
+        if isinstance(node, WhileNode):
+            condition = self.expr(node.condition_node)
+            if condition is None:
+                return False
+
+            self.emit(indent, f"while {condition}:")
+            self.loop_depth += 1
+            compiled = self.statement(node.body_node, indent + 1)
+            self.loop_depth -= 1
+            return compiled
+
+        if isinstance(node, (BreakNode, ContinueNode)):
+            if not self.loop_depth:
+                return self.reject(node)
+            keyword = "break" if isinstance(node, BreakNode) else "continue"
+            return self.emit(indent, keyword)
+
+        if isinstance(node, ReturnNode):
+            value = self.expr(node.node_to_return)
+            return value is not None and self.emit(indent, f"return {value}")
+
+        value = self.expr(node)
+        return value is not None and self.emit(indent, value)
+
+    def expr(self, node):
+        if isinstance(node, CacheScopeNode):
+            return self.expr(node.node)
+
+        if isinstance(node, CachedExprNode):
+            return self.expr(node.expr_node)
+
+        if isinstance(node, CounterNode):
+            return self.expr(node.var_access)
+
+        if isinstance(node, NumberNode):
+            return repr(node.tok.value)
+
+        if isinstance(node, VarAccessNode):
+            name = node.var_name_tok.value
+            if name in self.locals:
+                return f"v_{name}"
+            return f"load(scope, {name!r})"
+
+        if isinstance(node, BinOpNode):
+            op_type = node.op_tok.type
+            if op_type in ARITHMETIC_OPS:
+                template = "({} " + ARITHMETIC_OPS[op_type] + " {})"
+            elif op_type in COMPARISON_OPS:
+                template = "int({} " + COMPARISON_OPS[op_type] + " {})"
+            else:
+                return self.reject(node)
+
+            left = self.expr(node.left_node)
+            right = left and self.expr(node.right_node)
+            return right and template.format(left, right)
+
+        if isinstance(node, LogicalOpNode):
+            if node.op_tok.matches(TT_KEYWORD, "E") or node.op_tok.matches(
+                TT_KEYWORD, "e"
+            ):
+                template = "int({} and {})"
+            else:
+                template = "int({} or {})"
+
+            left = self.expr(node.left_node)
+            right = left and self.expr(node.right_node)
+            return right and template.format(left, right)
+
+        if isinstance(node, UnaryOpNode):
+            if node.op_tok.type in (TT_PLUSPLUS, TT_MINUSMINUS):
+                return self.reject(node)
+
+            operand = self.expr(node.node)
+            if operand is None:
+                return None
+            if node.op_tok.type == TT_MINUS:
+                return f"({operand} * -1)"
+            if node.op_tok.matches(TT_KEYWORD, "NAO"):
+                return f"(1 if {operand} == 0 else 0)"
+            return operand
+
+        if isinstance(node, InlinedCallNode):
+            return self.expr(node.call_node)
+
+        if isinstance(node, CallNode):
+            callee = node.node_to_call
+            if (
+                not isinstance(callee, VarAccessNode)
+                or callee.var_name_tok.value in self.locals
+            ):
+                return self.reject(node)
+
+            args = [self.expr(arg_node) for arg_node in node.arg_nodes]
+            if None in args:
+                return None
+            parts = ", ".join([repr(callee.var_name_tok.value)] + args)
+            return f"call(scope, {parts})"
+
+        return self.reject(node)
@@ -5,6 +5,11 @@ from .lexer import Token
 from .nodes import *
 
 
+FRAME_POOL_SIZE = 32
+
+DICT_VIEWS = {"CHAVES": "chaves", "VALORES": "valores", "ITENS": "itens"}
+
+
 class Value:
     def __init__(self):
         self.set_pos()
@@ -110,9 +115,15 @@ class Value:
     def set_element_at(self, index, value):
         return None, self.illegal_operation()
 
+    def iterate(self, interpreter):
+        return None, None
+
     def is_true(self):
         return False
 
+    def hash_key(self):
+        return None
+
     def copy(self):
         raise Exception("Nenhum metodo de copia definido")
 
@@ -258,6 +269,9 @@ class Number(Value):
     def is_true(self):
         return self.value != 0
 
+    def hash_key(self):
+        return self.value
+
     def copy(self):
         copy = Number(self.value)
         copy.set_pos(self.pos_start, self.pos_end)
@@ -340,9 +354,15 @@ class String(Value):
         else:
             return String(self.value + str(other)).set_context(self.context), None
 
+    def iterate(self, interpreter):
+        return (String(char).set_context(self.context) for char in self.value), None
+
     def is_true(self):
         return len(self.value) > 0
 
+    def hash_key(self):
+        return self.value
+
     def copy(self):
         copy = String(self.value)
         copy.set_pos(self.pos_start, self.pos_end)
@@ -406,6 +426,9 @@ class List(Value):
                 self.context,
             )
 
+    def iterate(self, interpreter):
+        return iter(self.elements), None
+
     def is_true(self):
         return len(self.elements) > 0
 
@@ -419,48 +442,148 @@ class List(Value):
         return f'[{", ".join([repr(x) for x in self.elements])}]'
 
 
-class Dict(Value):
+class Tuple(Value):
     def __init__(self, elements):
         super().__init__()
         self.elements = elements
 
-    def copy(self):
-        copy = Dict(self.elements.copy())
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
+    def added_to(self, other):
+        if isinstance(other, Tuple):
+            return Tuple(self.elements + other.elements).set_context(self.context), None
+        else:
+            return None, self.illegal_operation(other)
 
-    def get_element_at(self, key):
-        if not isinstance(key, (Number, String)):
+    def get_comparison_eq(self, other):
+        if not isinstance(other, Tuple):
+            return None, Value.illegal_operation(self, other)
+
+        if len(self.elements) != len(other.elements):
+            return Number(0).set_context(self.context), None
+
+        for mine, theirs in zip(self.elements, other.elements):
+            result, error = mine.get_comparison_eq(theirs)
+            if error:
+                return None, error
+            if not result.is_true():
+                return Number(0).set_context(self.context), None
+
+        return Number(1).set_context(self.context), None
+
+    def get_comparison_ne(self, other):
+        result, error = self.get_comparison_eq(other)
+        if error:
+            return None, error
+        return result.notted()
+
+    def get_element_at(self, index):
+        if not isinstance(index, Number):
             return None, RTError(
                 self.pos_start,
                 self.pos_end,
-                "A chave deve ser um numero ou um texto.",
+                "O indice da tupla deve ser um numero.",
                 self.context,
             )
 
-        val = self.elements.get(key.value)
-        if val is None:
+        try:
+            return self.elements[int(index.value)], None
+        except IndexError:
             return None, RTError(
                 self.pos_start,
                 self.pos_end,
-                f"Chave '{key.value}' nao encontrada",
+                f"Indice da tupla {index.value} fora dos limites",
                 self.context,
             )
-        return val, None
 
-    def set_element_at(self, key, value):
-        if not isinstance(key, (Number, String)):
+    def set_element_at(self, index, value):
+        return None, RTError(
+            self.pos_start,
+            self.pos_end,
+            "Nao e possivel alterar uma tupla",
+            self.context,
+        )
+
+    def iterate(self, interpreter):
+        return iter(self.elements), None
+
+    def is_true(self):
+        return len(self.elements) > 0
+
+    def hash_key(self):
+        keys = []
+        for element in self.elements:
+            key = element.hash_key()
+            if key is None:
+                return None
+            keys.append(key)
+        return tuple(keys)
+
+    def copy(self):
+        copy = Tuple(self.elements)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def __repr__(self):
+        if len(self.elements) == 1:
+            return f"({repr(self.elements[0])},)"
+        return f'({", ".join([repr(x) for x in self.elements])})'
+
+
+def key_value(key, context):
+    if isinstance(key, str):
+        return String(key).set_context(context)
+    if isinstance(key, tuple):
+        return Tuple(tuple(key_value(part, context) for part in key)).set_context(
+            context
+        )
+    return Number(key).set_context(context)
+
+
+class Dict(Value):
+    def __init__(self, elements):
+        super().__init__()
+        self.elements = elements
+
+    def copy(self):
+        copy = Dict(self.elements.copy())
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def key_error(self):
+        return RTError(
+            self.pos_start,
+            self.pos_end,
+            "A chave deve ser um numero, um texto ou uma tupla desses valores.",
+            self.context,
+        )
+
+    def get_element_at(self, key):
+        hash_key = key.hash_key()
+        if hash_key is None:
+            return None, self.key_error()
+
+        val = self.elements.get(hash_key)
+        if val is None:
             return None, RTError(
                 self.pos_start,
                 self.pos_end,
-                "A chave deve ser um numero ou um texto.",
+                f"Chave '{key}' nao encontrada",
                 self.context,
             )
+        return val, None
+
+    def set_element_at(self, key, value):
+        hash_key = key.hash_key()
+        if hash_key is None:
+            return None, self.key_error()
 
-        self.elements[key.value] = value
+        self.elements[hash_key] = value
         return value, None
 
+    def iterate(self, interpreter):
+        return (key_value(key, self.context) for key in list(self.elements)), None
+
     def __repr__(self):
         kv_strings = []
         for key, value in self.elements.items():
@@ -468,6 +591,195 @@ class Dict(Value):
         return f"{{{', '.join(kv_strings)}}}"
 
 
+class DictView(Value):
+    def __init__(self, dict_value, kind):
+        super().__init__()
+        self.dict_value = dict_value
+        self.kind = kind
+
+    def iterate(self, interpreter):
+        return DictViewIterator(self.dict_value, self.kind), None
+
+    def is_true(self):
+        return len(self.dict_value.elements) > 0
+
+    def copy(self):
+        copy = DictView(self.dict_value, self.kind)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def __repr__(self):
+        return f"<{self.kind}>"
+
+
+class DictViewIterator:
+    def __init__(self, dict_value, kind):
+        self.dict_value = dict_value
+        self.kind = kind
+        self.elements = iter(dict_value.elements.items())
+        self.error = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            key, value = next(self.elements)
+        except RuntimeError:
+            self.error = RTError(
+                self.dict_value.pos_start,
+                self.dict_value.pos_end,
+                "O dicionario foi modificado durante a iteracao",
+                self.dict_value.context,
+            )
+            raise StopIteration
+
+        if self.kind == "valores":
+            return value
+
+        key = key_value(key, self.dict_value.context)
+        if self.kind == "chaves":
+            return key
+        return Tuple((key, value)).set_context(self.dict_value.context)
+
+
+class Range(Value):
+    def __init__(self, start, end, step):
+        super().__init__()
+        self.start = start
+        self.end = end
+        self.step = step
+
+    def steps(self):
+        if all(isinstance(value, int) for value in (self.start, self.end, self.step)):
+            return range(self.start, self.end, self.step)
+        return self.float_steps()
+
+    def float_steps(self):
+        i = 0
+        value = self.start
+        while value < self.end if self.step > 0 else value > self.end:
+            yield value
+            i += 1
+            value = self.start + i * self.step
+
+    def iterate(self, interpreter):
+        return (Number(value).set_context(self.context) for value in self.steps()), None
+
+    def is_true(self):
+        return next(iter(self.steps()), None) is not None
+
+    def copy(self):
+        copy = Range(self.start, self.end, self.step)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def __repr__(self):
+        return f"INTERVALO({self.start}, {self.end}, {self.step})"
+
+
+def is_iterable(value):
+    return type(value).iterate is not Value.iterate
+
+
+def extend_stream(source, stages):
+    if isinstance(source, Stream):
+        return Stream(source.source, source.stages + stages)
+    return Stream(source, stages)
+
+
+class FunctionStage:
+    def __init__(self, function, pos_start, pos_end):
+        self.function = function
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+    def apply(self, interpreter, element):
+        return self.function.fast_call(
+            interpreter, [element], self.pos_start, self.pos_end
+        )
+
+
+class CompStage:
+    def __init__(self, node, var_name, context):
+        self.node = node
+        self.var_name = var_name
+        self.context = context
+
+    def apply(self, interpreter, element):
+        self.context.symbol_table.set(self.var_name, element)
+        return interpreter.visit(self.node, self.context)
+
+
+class Stream(Value):
+    def __init__(self, source, stages):
+        super().__init__()
+        self.source = source
+        self.stages = stages
+
+    def iterate(self, interpreter):
+        elements, error = self.source.iterate(interpreter)
+        if error or elements is None:
+            return elements, error
+        return StreamIterator(interpreter, elements, self.stages), None
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        copy = Stream(self.source, self.stages)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def __repr__(self):
+        return "<stream>"
+
+
+class StreamIterator:
+    def __init__(self, interpreter, elements, stages):
+        self.interpreter = interpreter
+        self.elements = elements
+        self.stages = stages
+        self.taken = [0] * len(stages)
+        self.done = any(kind == "take" and limit <= 0 for kind, limit in stages)
+        self.error = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.done:
+            raise StopIteration
+
+        for element in self.elements:
+            for i, (kind, stage) in enumerate(self.stages):
+                if kind == "take":
+                    self.taken[i] += 1
+                    if self.taken[i] >= stage:
+                        self.done = True
+                    continue
+
+                res = stage.apply(self.interpreter, element)
+                if res.error:
+                    self.error = res.error
+                    self.done = True
+                    raise StopIteration
+
+                if kind == "map":
+                    element = res.value
+                elif not res.value.is_true():
+                    break
+            else:
+                return element
+
+        self.error = getattr(self.elements, "error", None)
+        self.done = True
+        raise StopIteration
+
+
 class BaseFunction(Value):
     def __init__(self, name):
         super().__init__()
@@ -521,6 +833,9 @@ class BaseFunction(Value):
             )
         )
 
+    def fast_call(self, interpreter, args, pos_start, pos_end):
+        return self.copy().set_pos(pos_start, pos_end).execute(args)
+
     def copy(self):
         raise Exception("Nao e possivel copiar uma funcao base.")
 
@@ -529,43 +844,164 @@ class BaseFunction(Value):
 
 
 class Function(BaseFunction):
-    def __init__(self, name, body_node, arg_name_toks, parent_context):
+    def __init__(
+        self,
+        name,
+        body_node,
+        arg_name_toks,
+        parent_context,
+        frames=None,
+        captures=None,
+        generator=False,
+        specialized=None,
+    ):
         super().__init__(name)
         self.body_node = body_node
         self.arg_name_toks = arg_name_toks
         self.arg_names = [tok.value for tok in arg_name_toks]
+        self.arity = len(self.arg_names)
         self.context = parent_context
+        self.frames = frames
+        self.captures = captures
+        self.generator = generator
+        self.specialized = specialized
 
     def execute(self, args):
         from .interpreter import Interpreter
 
-        res = RTResult()
-        interpreter = Interpreter()
+        return self.fast_call(Interpreter(), args, self.pos_start, self.pos_end)
 
-        new_context = self.generate_new_context()
+    def fast_call(self, interpreter, args, pos_start, pos_end):
+        if len(args) != self.arity:
+            return RTResult().failure(self.arity_error(args, pos_start, pos_end))
 
-        res.register(self.check_and_populate_args(self.arg_names, args, new_context))
-        if res.error:
-            return res
+        if self.specialized is not None:
+            value = self.specialized.call(self, args, pos_start)
+            if value is not None:
+                return RTResult().success(value)
+
+        new_context = self.acquire_frame(pos_start)
+        symbols = new_context.symbol_table.symbols
+        for arg_name, arg_value in zip(self.arg_names, args):
+            symbols[arg_name] = arg_value
+
+        return self.run_body(interpreter, new_context)
+
+    def arity_error(self, args, pos_start, pos_end, offset=0):
+        return RTError(
+            pos_start,
+            pos_end,
+            f"Quantidade de argumentos incorreta para '{self.name}'. Esperava {self.arity - offset}, obteve {len(args)}",
+            self.context,
+        )
+
+    def acquire_frame(self, entry_pos):
+        new_context = Context(self.name, self.context, entry_pos)
+
+        if self.frames:
+            symbol_table = self.frames.pop()
+            symbol_table.parent = self.context.symbol_table
+            symbol_table.root = symbol_table.parent.root
+        else:
+            symbol_table = SymbolTable(self.context.symbol_table)
+
+        new_context.symbol_table = symbol_table
+        return new_context
+
+    def release_frame(self, context):
+        if self.captures is not None:
+            self.prune_frame(context.symbol_table)
+            return
+
+        if self.frames is None or len(self.frames) >= FRAME_POOL_SIZE:
+            return
+
+        symbol_table = context.symbol_table
+        symbol_table.symbols.clear()
+        symbol_table.finals.clear()
+        self.frames.append(symbol_table)
+
+    def prune_frame(self, symbol_table):
+        symbol_table.symbols = {
+            name: value
+            for name, value in symbol_table.symbols.items()
+            if name in self.captures
+        }
+        symbol_table.finals = [
+            name for name in symbol_table.finals if name in symbol_table.symbols
+        ]
+
+    def run_body(self, interpreter, new_context):
+        if self.generator:
+            return RTResult().success(Generator(self, interpreter, new_context))
 
         value_result = interpreter.visit(self.body_node, new_context)
+        self.release_frame(new_context)
 
         if value_result.error:
             return value_result
 
         if value_result.should_return:
-            return res.success(value_result.return_value)
+            return RTResult().success(value_result.return_value)
 
-        return res.success(value_result.value or Number.null)
+        return RTResult().success(value_result.value or Number.null)
 
     def copy(self):
-        copy = Function(self.name, self.body_node, self.arg_name_toks, self.context)
+        copy = Function(
+            self.name,
+            self.body_node,
+            self.arg_name_toks,
+            self.context,
+            self.frames,
+            self.captures,
+            self.generator,
+            self.specialized,
+        )
 
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         return copy
 
 
+class Generator(Value):
+    def __init__(self, function, interpreter, frame):
+        super().__init__()
+        self.function = function
+        self.frame = frame
+        self.steps = interpreter.produce(function.body_node, frame)
+        self.done = False
+        self.error = None
+
+    def iterate(self, interpreter):
+        return self, None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.done:
+            self.error = None
+            raise StopIteration
+
+        try:
+            return next(self.steps)
+        except StopIteration as stop:
+            self.done = True
+            self.error = stop.value.error
+            self.function.release_frame(self.frame)
+            self.frame = None
+            raise StopIteration
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        return self
+
+    def __repr__(self):
+        return f"<generator {self.function.name}>"
+
+
 class Class(BaseFunction):
     def __init__(self, name, superclass, methods):
         super().__init__(name)
@@ -600,6 +1036,12 @@ class Class(BaseFunction):
 
         return res.success(instance)
 
+    def find_method(self, name):
+        method = self.methods.get(name)
+        if method is None and self.superclass:
+            return self.superclass.find_method(name)
+        return method
+
     def get_attr(self, name_tok):
         method_name = name_tok.value
         method = self.methods.get(method_name)
@@ -657,6 +1099,28 @@ class Instance(Value):
         self.symbol_table.set(name, value)
         return value, None
 
+    def bind_method(self, name):
+        method = self.class_ref.find_method(name)
+        if method is None:
+            return None
+        return method.copy().set_context(self.class_ref.context).bind_to_instance(self)
+
+    def iterate(self, interpreter):
+        iter_method = self.bind_method("iterar")
+        if iter_method:
+            res = iter_method.fast_call(interpreter, [], self.pos_start, self.pos_end)
+            if res.error:
+                return None, res.error
+            if res.value is not self:
+                return res.value.iterate(interpreter)
+
+        has_next = self.bind_method("tem_proximo")
+        next_method = self.bind_method("proximo")
+        if has_next and next_method:
+            return MethodIterator(interpreter, has_next, next_method), None
+
+        return None, None
+
     def copy(self):
         copy = Instance(self.class_ref)
         copy.symbol_table = self.symbol_table
@@ -668,6 +1132,34 @@ class Instance(Value):
         return f"<{self.class_ref.name} instance>"
 
 
+class MethodIterator:
+    def __init__(self, interpreter, has_next, next_method):
+        self.interpreter = interpreter
+        self.has_next = has_next
+        self.next_method = next_method
+        self.error = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        res = self.call(self.has_next)
+        if res.error or not res.value.is_true():
+            raise StopIteration
+
+        res = self.call(self.next_method)
+        if res.error:
+            raise StopIteration
+
+        return res.value
+
+    def call(self, method):
+        res = method.fast_call(self.interpreter, [], method.pos_start, method.pos_end)
+        if res.error:
+            self.error = res.error
+        return res
+
+
 class BoundMethod(BaseFunction):
     def __init__(self, name, function_to_bind, instance):
         super().__init__(name)
@@ -679,45 +1171,34 @@ class BoundMethod(BaseFunction):
     def execute(self, args):
         from .interpreter import Interpreter
 
-        res = RTResult()
-        interpreter = Interpreter()
-
-        new_context = self.function_to_bind.generate_new_context()
-        original_arg_names = self.function_to_bind.arg_names
+        return self.fast_call(Interpreter(), args, self.pos_start, self.pos_end)
 
-        if len(original_arg_names) > 0 and original_arg_names[0] == "EU":
-            new_context.symbol_table.set("EU", self.instance)
+    def fast_call(self, interpreter, args, pos_start, pos_end):
+        function = self.function_to_bind
+        arg_names = function.arg_names
 
-        if len(original_arg_names) == 0 or original_arg_names[0] != "EU":
-            return res.failure(
+        if len(arg_names) == 0 or arg_names[0] != "EU":
+            return RTResult().failure(
                 RTError(
-                    self.function_to_bind.pos_start,
-                    self.function_to_bind.pos_end,
+                    function.pos_start,
+                    function.pos_end,
                     f"Metodo '{self.name}' deve ter 'EU' como seu primeiro argumento",
                     self.context,
                 )
             )
 
-        expected_arg_names = original_arg_names[1:]
-
-        res.register(
-            self.function_to_bind.check_and_populate_args(
-                expected_arg_names, args, new_context
+        if len(args) != function.arity - 1:
+            return RTResult().failure(
+                function.arity_error(args, function.pos_start, function.pos_end, 1)
             )
-        )
-
-        if res.error:
-            return res
-
-        value_result = interpreter.visit(self.function_to_bind.body_node, new_context)
 
-        if value_result.error:
-            return value_result
-
-        if value_result.should_return:
-            return res.success(value_result.return_value)
+        new_context = function.acquire_frame(function.pos_start)
+        symbols = new_context.symbol_table.symbols
+        symbols["EU"] = self.instance
+        for arg_name, arg_value in zip(arg_names[1:], args):
+            symbols[arg_name] = arg_value
 
-        return res.success(value_result.value or Number.null)
+        return function.run_body(interpreter, new_context)
 
     def copy(self):
         return (
@@ -832,6 +1313,134 @@ class BuiltInFunction(BaseFunction):
             is_true = args[0].is_true()
             return res.success(Number.true if is_true else Number.false)
 
+        elif self.name == "INTERVALO":
+            if not 1 <= len(args) <= 3:
+                return res.failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        f"A funcao INTERVALO aceita de 1 a 3 argumentos, obteve {len(args)}",
+                        self.context,
+                    )
+                )
+
+            for arg in args:
+                if not isinstance(arg, Number):
+                    return res.failure(
+                        RTError(
+                            self.pos_start,
+                            self.pos_end,
+                            f"Os argumentos de INTERVALO devem ser numeros, obtido {type(arg).__name__}",
+                            self.context,
+                        )
+                    )
+
+            bounds = [arg.value for arg in args]
+            if len(bounds) == 1:
+                bounds.insert(0, 0)
+            if len(bounds) == 2:
+                bounds.append(1)
+
+            if bounds[2] == 0:
+                return res.failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        "O passo de INTERVALO nao pode ser zero",
+                        self.context,
+                    )
+                )
+
+            return res.success(Range(*bounds).set_context(self.context))
+
+        elif self.name in ("MAPA", "FILTRO"):
+            res.register(self.check_args(["funcao", "iteravel"], args))
+            if res.error:
+                return res
+
+            function, source = args
+            if not isinstance(function, BaseFunction):
+                return res.failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        f"O primeiro argumento de {self.name} deve ser uma funcao",
+                        self.context,
+                    )
+                )
+
+            if not is_iterable(source):
+                return res.failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        f"O segundo argumento de {self.name} deve ser iteravel",
+                        self.context,
+                    )
+                )
+
+            kind = "map" if self.name == "MAPA" else "filter"
+            stage = FunctionStage(function, self.pos_start, self.pos_end)
+            stream = extend_stream(source, ((kind, stage),))
+            return res.success(stream.set_context(self.context))
+
+        elif self.name == "PEGAR":
+            res.register(self.check_args(["iteravel", "quantidade"], args))
+            if res.error:
+                return res
+
+            source, count = args
+            if not is_iterable(source):
+                return res.failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        "O primeiro argumento de PEGAR deve ser iteravel",
+                        self.context,
+                    )
+                )
+
+            if not isinstance(count, Number):
+                return res.failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        "O segundo argumento de PEGAR deve ser um numero",
+                        self.context,
+                    )
+                )
+
+            stream = extend_stream(source, (("take", count.value),))
+            return res.success(stream.set_context(self.context))
+
+        elif self.name in DICT_VIEWS:
+            res.register(self.check_args(["dicionario"], args))
+            if res.error:
+                return res
+
+            if not isinstance(args[0], Dict):
+                return res.failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        f"O argumento de {self.name} deve ser um dicionario",
+                        self.context,
+                    )
+                )
+
+            view = DictView(args[0], DICT_VIEWS[self.name])
+            return res.success(view.set_context(self.context))
+
+        elif self.name == "REDUZIR":
+            from .interpreter import Interpreter
+
+            return self.reduce(Interpreter(), args)
+
+        elif self.name == "TUPLA":
+            from .interpreter import Interpreter
+
+            return self.to_tuple(Interpreter(), args)
+
         return res.failure(
             RTError(
                 self.pos_start,
@@ -841,6 +1450,86 @@ class BuiltInFunction(BaseFunction):
             )
         )
 
+    def fast_call(self, interpreter, args, pos_start, pos_end):
+        if self.name == "REDUZIR":
+            return self.copy().set_pos(pos_start, pos_end).reduce(interpreter, args)
+        if self.name == "TUPLA":
+            return self.copy().set_pos(pos_start, pos_end).to_tuple(interpreter, args)
+        return super().fast_call(interpreter, args, pos_start, pos_end)
+
+    def to_tuple(self, interpreter, args):
+        res = RTResult()
+        res.register(self.check_args(["iteravel"], args))
+        if res.error:
+            return res
+
+        elements, error = args[0].iterate(interpreter)
+        if error:
+            return res.failure(error)
+
+        if elements is None:
+            return res.failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "O argumento de TUPLA deve ser iteravel",
+                    self.context,
+                )
+            )
+
+        values = tuple(elements)
+        error = getattr(elements, "error", None)
+        if error:
+            return res.failure(error)
+
+        return res.success(Tuple(values).set_context(self.context))
+
+    def reduce(self, interpreter, args):
+        res = RTResult()
+        res.register(self.check_args(["funcao", "iteravel", "inicial"], args))
+        if res.error:
+            return res
+
+        function, source, accumulator = args
+        if not isinstance(function, BaseFunction):
+            return res.failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "O primeiro argumento de REDUZIR deve ser uma funcao",
+                    self.context,
+                )
+            )
+
+        elements, error = source.iterate(interpreter)
+        if error:
+            return res.failure(error)
+
+        if elements is None:
+            return res.failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "O segundo argumento de REDUZIR deve ser iteravel",
+                    self.context,
+                )
+            )
+
+        for element in elements:
+            accumulator = res.register(
+                function.fast_call(
+                    interpreter, [accumulator, element], self.pos_start, self.pos_end
+                )
+            )
+            if res.error:
+                return res
+
+        error = getattr(elements, "error", None)
+        if error:
+            return res.failure(error)
+
+        return res.success(accumulator)
+
     def copy(self):
         copy = BuiltInFunction(self.name)
         copy.set_context(self.context)
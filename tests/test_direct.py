@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+RUN = os.path.join(TESTS, "..", "run.py")
+
+
+def execute(*args):
+    result = subprocess.run(
+        [sys.executable, RUN, *args],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        timeout=120,
+    )
+    return result.stdout, result.stderr
+
+
+class DirectInterpreterTest(unittest.TestCase):
+    def test_direct_script_matches_default_interpreter(self):
+        script = os.path.join(TESTS, "test_direct.nx")
+        default = execute(script)
+        direct = execute("--direct", script)
+
+        self.assertEqual(default[1], "")
+        self.assertTrue(default[0].rstrip().endswith("fim"))
+        self.assertEqual(direct, default)
+
+
+if __name__ == "__main__":
+    unittest.main()
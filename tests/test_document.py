@@ -0,0 +1,75 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.analysis import walk
+from nexus.document import Document
+
+
+SOURCE = "".join(
+    f"FUNCAO f{i}(a)\n  RETORNAR a + {i}\nFIMFUNCAO\n" for i in range(50)
+) + "IMPRIMIR f3(1)\n"
+
+
+def positions(node):
+    return [
+        (
+            type(current).__name__,
+            current.pos_start.idx,
+            current.pos_start.ln,
+            current.pos_start.col,
+            current.pos_end.idx,
+            current.pos_end.ln,
+            current.pos_end.col,
+        )
+        for current in walk(node)
+    ]
+
+
+class DocumentTest(unittest.TestCase):
+    def assertMatchesFreshParse(self, document):
+        fresh = Document("<doc>", document.text)
+        self.assertIsNone(fresh.ast.error)
+        self.assertIsNone(document.ast.error)
+
+        expected = positions(fresh.ast.node)
+        actual = positions(document.ast.node)
+        self.assertEqual(len(actual), len(expected))
+        for node_positions, fresh_positions in zip(actual, expected):
+            self.assertEqual(node_positions, fresh_positions)
+
+    def test_edit_reuses_distant_statements(self):
+        document = Document("<doc>", SOURCE)
+        before = list(document.statements)
+
+        start = SOURCE.index("a + 20")
+        document.apply_edit((start, start + len("a + 20")), "a * 200\n  + 1")
+
+        self.assertMatchesFreshParse(document)
+        reused = [old is new for old, new in zip(before, document.statements)]
+        self.assertFalse(reused[20])
+        self.assertTrue(all(reused[:19]))
+        self.assertTrue(all(reused[21:]))
+
+    def test_syntax_error_then_fix(self):
+        document = Document("<doc>", SOURCE)
+
+        start = SOURCE.index("FIMFUNCAO\nFUNCAO f8")
+        broken = document.apply_edit((start, start + len("FIMFUNCAO")), "")
+        self.assertIsNotNone(broken.error)
+
+        document.apply_edit((start, start), "FIMFUNCAO")
+        self.assertEqual(document.text, SOURCE)
+        self.assertMatchesFreshParse(document)
+
+    def test_inserting_lines_shifts_following_statements(self):
+        document = Document("<doc>", SOURCE)
+        start = SOURCE.index("FUNCAO f10")
+        document.apply_edit((start, start), "DECLARAR x = 1\nDECLARAR y = 2\n")
+        self.assertMatchesFreshParse(document)
+
+
+if __name__ == "__main__":
+    unittest.main()
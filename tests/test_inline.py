@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope, run
+from nexus.runtime import Context
+
+
+PROGRAM = """FUNCAO divide(a, b)
+  RETORNAR a / b
+FIMFUNCAO
+FUNCAO outro(x)
+  RETORNAR divide(x, 0) + 1
+FIMFUNCAO
+IMPRIMIR outro(5)
+"""
+
+ALIASING = """FUNCAO mesmo(x)
+  RETORNAR x
+FIMFUNCAO
+DECLARAR a = 5
+DECLARAR b = mesmo(a)
+DECLARAR l = [1, 2]
+DECLARAR m = mesmo(l)
+"""
+
+TRACEBACK = [
+    "Rastreamento (chamada mais recente):",
+    "  Arquivo <inline>, linha 7, em <program>",
+    "  Arquivo <inline>, linha 5, em outro",
+    "  Arquivo <inline>, linha 2, em divide",
+    "Erro em Tempo de Execucao: Divisao por zero",
+]
+
+
+class InlineTracebackTest(unittest.TestCase):
+    def traceback(self, direct):
+        _, error = run("<inline>", PROGRAM, direct=direct)
+        self.assertIsNotNone(error)
+        return error.as_string().splitlines()
+
+    def test_nested_inlined_calls_keep_every_frame(self):
+        self.assertEqual(self.traceback(direct=False), TRACEBACK)
+
+    def test_direct_interpreter_keeps_every_frame(self):
+        self.assertEqual(self.traceback(direct=True), TRACEBACK)
+
+    def test_inlined_argument_keeps_caller_position(self):
+        for direct in (False, True):
+            context = Context("<program>")
+            context.symbol_table = get_fresh_global_scope()
+            _, error = run("<inline>", ALIASING, context, direct=direct)
+            self.assertIsNone(error)
+
+            symbols = context.symbol_table
+            self.assertEqual(symbols.get("a").pos_start.ln, 4)
+            self.assertEqual(symbols.get("b").pos_start.ln, 1)
+            self.assertIs(symbols.get("m"), symbols.get("l"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import run
+from nexus.analysis import walk
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.parallel import MIN_CHUNK_SIZE, parse_parallel
+
+
+UNIT = """# funcao {i}
+FUNCAO f{i}(a, b)
+  DECLARAR texto = `valor {{a + {i}}}`
+  SE a > b ENTAO
+    RETORNAR a * {i} + b
+  FIMSE
+  RETORNAR [x + b PARA x EM INTERVALO(a)]
+FIMFUNCAO
+
+"""
+
+
+def make_source(count):
+    units = [UNIT.format(i=i) for i in range(count)]
+    return "".join(units) + "IMPRIMIR f0(3, 1)\nIMPRIMIR(f1(1, 0) / 0)\n"
+
+
+def positions(node):
+    return [
+        (
+            type(current).__name__,
+            current.pos_start.idx,
+            current.pos_start.ln,
+            current.pos_start.col,
+            current.pos_end.idx,
+            current.pos_end.ln,
+            current.pos_end.col,
+        )
+        for current in walk(node)
+    ]
+
+
+class ParallelParseTest(unittest.TestCase):
+    def setUp(self):
+        self.text = make_source(3 * MIN_CHUNK_SIZE // len(UNIT) + 1)
+
+    def test_chunked_parse_matches_serial_positions(self):
+        tokens, error = Lexer("<parallel>", self.text).make_tokens()
+        self.assertIsNone(error)
+        serial = Parser(tokens).parse()
+        self.assertIsNone(serial.error)
+
+        chunked = parse_parallel("<parallel>", self.text, workers=2)
+        self.assertIsNotNone(chunked)
+        expected = positions(serial.node)
+        actual = positions(chunked)
+        self.assertEqual(len(actual), len(expected))
+        for node_positions, serial_positions in zip(actual, expected):
+            self.assertEqual(node_positions, serial_positions)
+
+    def test_runtime_error_lines_match(self):
+        with redirect_stdout(io.StringIO()):
+            _, serial = run("<parallel>", self.text)
+            with mock.patch("nexus.parallel.os.cpu_count", return_value=2):
+                _, chunked = run("<parallel>", self.text, parallel=True)
+        self.assertIn("linha", serial.as_string())
+        self.assertEqual(chunked.as_string(), serial.as_string())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import run
+from nexus.pgo import Profile, PROFILE_SUFFIX, source_hash
+
+
+PROGRAM = """FUNCAO passo(x)
+  SE x % 3 == 0 ENTAO
+    RETORNAR x / 3
+  SENAO
+    RETORNAR x * 2 + 1
+  FIMSE
+FIMFUNCAO
+DECLARAR total = 0
+PARA i EM INTERVALO(200)
+  total = total + passo(i)
+FIMPARA
+IMPRIMIR total
+IMPRIMIR [passo(n) PARA n EM [1, 2, 3]]
+"""
+
+
+class ProfileGuidedTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "programa.nx")
+
+    def execute(self, text, pgo=None):
+        output = io.StringIO()
+        warnings = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(warnings):
+            _, error = run(self.path, text, pgo=pgo)
+        self.assertIsNone(error, error and error.as_string())
+        return output.getvalue(), warnings.getvalue()
+
+    def test_record_and_use_match_plain_run(self):
+        plain, _ = self.execute(PROGRAM)
+        recorded, _ = self.execute(PROGRAM, pgo="record")
+        self.assertTrue(os.path.exists(self.path + PROFILE_SUFFIX))
+
+        used, warnings = self.execute(PROGRAM, pgo="use")
+        self.assertEqual(recorded, plain)
+        self.assertEqual(used, plain)
+        self.assertEqual(warnings, "")
+
+    def test_stale_profile_is_ignored(self):
+        self.execute(PROGRAM, pgo="record")
+        edited = PROGRAM.replace("INTERVALO(200)", "INTERVALO(150)")
+        self.assertIsNone(
+            Profile.load(self.path + PROFILE_SUFFIX, source_hash(edited))
+        )
+
+        plain, _ = self.execute(edited)
+        used, warnings = self.execute(edited, pgo="use")
+        self.assertEqual(used, plain)
+        self.assertIn("desatualizado", warnings)
+
+
+if __name__ == "__main__":
+    unittest.main()
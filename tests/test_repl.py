@@ -0,0 +1,79 @@
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.__main__ import get_fresh_global_scope
+from nexus.repl import BlockTracker, ReplSession
+
+
+LOOP = """DECLARAR k = 0
+ENQUANTO k < 3
+  IMPRIMIR n * 10
+  f()
+  k++
+FIMENQUANTO"""
+
+
+class ReplSessionTest(unittest.TestCase):
+    def run_chunks(self, session, chunks):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            for chunk in chunks:
+                _, error = session.execute(chunk)
+                self.assertIsNone(error, error and error.as_string())
+        return output.getvalue().split()
+
+    def test_redefinition_invalidates_cached_programs(self):
+        session = ReplSession(get_fresh_global_scope())
+        self.run_chunks(
+            session, ["DECLARAR n = 0", "FUNCAO f()\nRETORNAR 0\nFIMFUNCAO"]
+        )
+        self.assertEqual(self.run_chunks(session, [LOOP]), ["0", "0", "0"])
+
+        self.run_chunks(session, ["FUNCAO f()\nn++\nFIMFUNCAO"])
+        self.assertEqual(self.run_chunks(session, [LOOP]), ["0", "10", "20"])
+
+    def test_resubmitted_chunk_reuses_program(self):
+        session = ReplSession(get_fresh_global_scope())
+        self.run_chunks(session, ["DECLARAR n = 1", "IMPRIMIR n"])
+        program = session.programs["IMPRIMIR n"]
+        self.run_chunks(session, ["IMPRIMIR n"])
+        self.assertIs(session.programs["IMPRIMIR n"], program)
+
+
+class BlockTrackerTest(unittest.TestCase):
+    def feed(self, lines):
+        tracker = BlockTracker()
+        return [tracker.feed(line) for line in lines]
+
+    def test_else_if_chain_closes_once(self):
+        lines = [
+            "SE x > 1 ENTAO",
+            '  IMPRIMIR "FIMSE"',
+            "SENAO SE x < 0 ENTAO",
+            "  IMPRIMIR 0",
+            "SENAO",
+            "  IMPRIMIR 1",
+            "FIMSE",
+        ]
+        self.assertEqual(self.feed(lines), [False] * 6 + [True])
+
+    def test_nested_blocks(self):
+        lines = ["FUNCAO f(a)", "  PARA x EM a", "    IMPRIMIR x", "  FIMPARA"]
+        self.assertEqual(self.feed(lines + ["FIMFUNCAO"]), [False] * 4 + [True])
+
+    def test_open_brackets_continue_the_block(self):
+        self.assertEqual(self.feed(["DECLARAR l = [1,", "  2]"]), [False, True])
+        self.assertEqual(self.feed(["IMPRIMIR [x PARA x EM l]"]), [True])
+
+    def test_unterminated_string_continues_the_block(self):
+        lines = ['DECLARAR s = """abc', "FIMSE", 'def"""']
+        self.assertEqual(self.feed(lines), [False, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexus.lexer import Lexer
+from nexus.parser import Parser
+from nexus.optimizer import Optimizer
+from nexus.analysis import walk
+from nexus.nodes import SwitchNode
+
+
+SWITCH = """ESCOLHA modo
+  CASO -3
+    IMPRIMIR "menos tres"
+  CASO 1, 2
+    IMPRIMIR "baixo"
+  PADRAO
+    IMPRIMIR "outro"
+FIMESCOLHA
+"""
+
+
+def switches(text):
+    tokens, error = Lexer("<teste>", text).make_tokens()
+    assert error is None, error
+    ast = Parser(tokens).parse()
+    assert ast.error is None, ast.error
+    node = Optimizer().optimize(ast.node)
+    return [current for current in walk(node) if isinstance(current, SwitchNode)]
+
+
+class JumpTableTest(unittest.TestCase):
+    def assert_tables(self, text):
+        found = switches(text)
+        self.assertTrue(found)
+        for switch in found:
+            self.assertIsNotNone(switch.jump_table)
+            self.assertEqual(sorted(switch.jump_table), [-3, 1, 2])
+
+    def test_top_level_switch(self):
+        self.assert_tables("DECLARAR modo = 1\n" + SWITCH)
+
+    def test_switch_inside_while(self):
+        self.assert_tables(
+            "DECLARAR modo = 0\nENQUANTO modo < 3\n" + SWITCH + "modo++\nFIMENQUANTO\n"
+        )
+
+    def test_switch_inside_for(self):
+        self.assert_tables("PARA modo EM INTERVALO(3)\n" + SWITCH + "FIMPARA\n")
+
+
+if __name__ == "__main__":
+    unittest.main()